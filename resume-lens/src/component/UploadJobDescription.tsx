@@ -55,8 +55,8 @@ type MatchedData = {
 };
 
 type JobOption = {
+    name: string;
     job_title: string;
-    description: string;
 };
 
 const UploadjobDescription: React.FC = () => {
@@ -84,7 +84,7 @@ const UploadjobDescription: React.FC = () => {
                 setLoading(true);
         
                 const response = await fetch(
-                    "/api/method/resume_lens.api.get_all_records",
+                    "/api/method/resume_lens.api.get_all_records?fields=name,job_title",
                     {
                         method: "GET",
                         credentials: "include",
@@ -118,8 +118,15 @@ const UploadjobDescription: React.FC = () => {
         // If you want to automatically populate the job description textarea
         const selectedJob = jobOptions.find(job => job.job_title === e.target.value);
         if (selectedJob) {
-            setJdText(selectedJob.description);
             setJobDescFile(null); // Clear any uploaded file if selecting from dropdown
+            // The listing only carries titles, the cleaned description is fetched on selection
+            fetch(
+                `/api/method/resume_lens.api.get_job_opening_text?job_opening=${encodeURIComponent(selectedJob.name)}`,
+                { credentials: "include" }
+            )
+                .then(response => response.json())
+                .then(data => setJdText(data.message?.description || ""))
+                .catch(() => setErrorMessage("Failed to load job description"));
         }
     };
 
@@ -239,38 +246,22 @@ const UploadjobDescription: React.FC = () => {
         }
     };
 
-    const handleViewResume = async (viewUrl: string, fileName: string) => {
-        console.log("handleViewResume START for:", fileName, "URL:", viewUrl);
-        setLoading(true);
-        setViewFileContent(null);
+    const getResumeContentType = (fileName: string) => {
+        const ext = fileName.split('.').pop()?.toLowerCase();
+        if (ext === 'pdf') return 'application/pdf';
+        if (ext === 'docx') return 'application/vnd.openxmlformats-officedocument.wordprocessingml.document';
+        if (ext === 'doc') return 'application/msword';
+        return 'text/plain';
+    };
+
+    // The resume is streamed straight from view_url into the preview frame, so the browser's
+    // PDF viewer can fetch it in ranges instead of loading it as one base64 JSON payload.
+    const handleViewResume = (viewUrl: string, fileName: string) => {
         setViewFileName(fileName);
-        setViewFileContentType(null);
         setErrorMessage(null);
-        setIsModalOpen(true); 
-        try {
-            const response = await fetch(viewUrl, {
-                method: "GET",
-            });
-            if (!response.ok) {
-                throw new Error(`Failed to fetch resume content: ${response.statusText}`);
-            }
-            const data = await response.json();
-            console.log("API Response Data:", data);
-            console.log("File Content Type:", typeof data.message.file_content, data.message.file_content);
-            console.log("Content Type String:", typeof data.message.content_type, data.message.content_type);
-
-            setViewFileContent(data.message.file_content);
-            setViewFileContentType(data.message.content_type);
-
-        } catch (error: any) {
-            console.error("Error viewing resume:", error);
-            setErrorMessage(error.message || "Failed to view resume.");
-            setViewFileContent(null);
-            setViewFileContentType(null);
-        } finally {
-            setLoading(false);
-            console.log("handleViewResume FINISHED for:", fileName);
-        }
+        setViewFileContent(viewUrl);
+        setViewFileContentType(getResumeContentType(fileName));
+        setIsModalOpen(true);
     };
 
     const handleCloseModal = () => {
@@ -281,55 +272,16 @@ const UploadjobDescription: React.FC = () => {
         setErrorMessage(null);
     };
 
-    // Function to chunk base64 encoding to avoid stack overflow
-    const base64EncodeChunked = (arrayBuffer: ArrayBuffer) => { // ADDED: Type annotation for arrayBuffer
-        let base64String = '';
-        const byteArray = new Uint8Array(arrayBuffer);
-        const chunkSize = 4096; // Adjust chunk size if needed
-        for (let i = 0; i < byteArray.length; i += chunkSize) {
-            const chunk = byteArray.subarray(i, i + chunkSize);
-            base64String += String.fromCharCode.apply(null, Array.from(chunk));
-        }
-        return btoa(base64String);
-    };
-
-
     const renderFileContent = () => {
         if (!viewFileContent) {
             return <p>Loading resume content...</p>;
         }
 
-        if (viewFileContentType === 'application/pdf') {
-            try {
-                let base64PDF;
-                if (typeof viewFileContent === 'string') {
-                    base64PDF = viewFileContent;
-                } else if (viewFileContent instanceof ArrayBuffer) {
-                    base64PDF = base64EncodeChunked(viewFileContent); // Use chunked encoding for ArrayBuffer
-                }
-                else {
-                    // Attempt to process as Uint8Array if it's something else array-like
-                    base64PDF = base64EncodeChunked(new Uint8Array(viewFileContent));
-                }
-
-
-                const pdfSrc = `data:application/pdf;base64,${base64PDF}`;
-                return <iframe src={pdfSrc} width="100%" height="600px" title="Resume Preview" className="resume-preview-iframe" />;
-            } catch (error) {
-                console.error("Error rendering PDF:", error);
-                return <p className="error-message">Error rendering PDF resume.</p>;
-            }
-        } else if (viewFileContentType === 'application/vnd.openxmlformats-officedocument.wordprocessingml.document' || viewFileContentType === 'application/msword') {
+        if (viewFileContentType === 'application/vnd.openxmlformats-officedocument.wordprocessingml.document' || viewFileContentType === 'application/msword') {
             return <p>Word documents cannot be rendered directly. Please download to view.</p>;
         }
-        else {
-            try {
-                return <pre style={{ whiteSpace: 'pre-wrap', wordWrap: 'break-word' }}>{String(viewFileContent)}</pre>;
-            } catch (error) {
-                console.error("Error rendering Text Content:", error);
-                return <p className="error-message">Error rendering text-based resume.</p>;
-            }
-        }
+
+        return <iframe src={viewFileContent} width="100%" height="600px" title="Resume Preview" className="resume-preview-iframe" />;
     };
 
     return (
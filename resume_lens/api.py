@@ -1,16 +1,45 @@
 import os
 import re
-import secrets
-import spacy
-import docx2txt
-import pypdf
+from urllib.parse import urlencode
+
 import frappe
-from sklearn.metrics.pairwise import cosine_similarity
-from sentence_transformers import SentenceTransformer
 from bs4 import BeautifulSoup
-
-nlp = spacy.load("en_core_web_sm")
-model = SentenceTransformer('paraphrase-MiniLM-L6-v2')
+from frappe.model.naming import BRACED_PARAMS_PATTERN, parse_naming_series
+
+from resume_lens import instrumentation, scoring
+from resume_lens.applicant_discovery import (
+    get_applicant_file_names,
+    get_request_filters,
+    iter_applicant_files,
+    iter_batches,
+    iter_job_applicants,
+)
+from resume_lens.applicant_index import get_applicant_index, get_skill_index, search_index
+from resume_lens.config import get_config
+from resume_lens.dedup import DEFAULT_THRESHOLD as DEFAULT_NEAR_DUPLICATE_THRESHOLD
+from resume_lens.dedup import Deduplicator, minhash_signature
+from resume_lens.download_tokens import mint_token, resolve_token
+from resume_lens.feature_cache import (
+    get_cached_features,
+    get_content_hash,
+    get_extraction_limits,
+    get_pipeline_version,
+    store_features,
+    update_features,
+)
+from resume_lens.file_delivery import send_resume_file
+from resume_lens.job_catalogue import CATALOGUE_FIELDS, get_catalogue_entry, get_catalogue_records
+from resume_lens.model_registry import get_embedding_model
+from resume_lens.skills import extract_skills, extract_skills_batch
+from resume_lens.text_extraction import (
+    DEFAULT_EXTRACTION_MAX_MEMORY_MB,
+    DEFAULT_EXTRACTION_TIMEOUT,
+    DEFAULT_MAX_TASKS_PER_WORKER,
+    extract_text_from_docx,
+    extract_text_from_pdf,
+    extract_texts_parallel,
+    summarize_extraction,
+)
 
 SITE_URL = frappe.utils.get_url()
         
@@ -20,16 +49,12 @@ PRIVATE_DIR = frappe.get_site_path("private", "files")
 PUBLIC_DIR = frappe.get_site_path("public", "files")
 WHITELISTED_DOWNLOAD_PATHS = [PRIVATE_DIR, PUBLIC_DIR]
 ALLOWED_EXTENSIONS = {"pdf", "doc", "docx"}
-
-# Store tokens mapped to filepaths for secure downloads and views
-TOKEN_MAP = {}
+DEFAULT_SCREENING_BATCH_SIZE = 500
 
 #generate token for download file 
-def generate_download_token(filepath):
-    """Generate a secure token for a given filepath"""
-    token = secrets.token_urlsafe(16)
-    TOKEN_MAP[token] = filepath
-    return token
+def generate_download_token(filepath, single_use=False):
+    """Generate a secure, expiring token for a given filepath"""
+    return mint_token(filepath, single_use=single_use)
 
 #Determine the file type and absolute path based on the resume URL.
 def resolve_file_path(resume_url):
@@ -50,64 +75,69 @@ def is_path_allowed(filepath):
     return any(abs_path.startswith(os.path.abspath(allowed)) for allowed in WHITELISTED_DOWNLOAD_PATHS)
 
 #Generate a secure download URL
-def get_secure_download_url(resume_url):
+def get_secure_download_url(resume_url, single_use=False):
     file_type, file_path, filename = resolve_file_path(resume_url)
-    token = generate_download_token(file_path)
+    token = generate_download_token(file_path, single_use)
           
     return f"/api/method/resume_lens.api.download_matched_resume?token={token}"
 
 #Generates a secure view URL for a given resume URL.
-def get_secure_view_url(resume_url):
+def get_secure_view_url(resume_url, single_use=False):
     file_type, file_path, filename = resolve_file_path(resume_url)
-    token = generate_download_token(file_path)
+    token = generate_download_token(file_path, single_use)
     
     return f"/api/method/resume_lens.api.view_matched_resume?token={token}"
 
+# Stable link placed in screening results. No token is minted until the link is opened.
+def get_resume_link(job_applicant, action="view"):
+    query = urlencode({"job_applicant": job_applicant, "action": action})
+    return f"/api/method/resume_lens.api.open_matched_resume?{query}"
+
+# Mint a token for an applicant's resume when its link is actually opened, then redirect to the
+# tokenized view/download URL (or return it with as_url=1)
+@frappe.whitelist()
+def open_matched_resume(job_applicant, action="view", single_use=0, as_url=0):
+    frappe.has_permission("Job Applicant", "read", job_applicant, throw=True)
+
+    resume_url = frappe.db.get_value("Job Applicant", job_applicant, "resume_attachment")
+    if not resume_url:
+        frappe.throw("Resume not found", frappe.DoesNotExistError)
+
+    single_use = frappe.utils.cint(single_use)
+    if action == "download":
+        url = get_secure_download_url(resume_url, single_use)
+    else:
+        url = get_secure_view_url(resume_url, single_use)
+
+    if frappe.utils.cint(as_url):
+        return {"url": url}
+
+    frappe.local.response.type = "redirect"
+    frappe.local.response.location = url
+
 #Download a matched resume based on a provided token.
 @frappe.whitelist(allow_guest=True)
 def download_matched_resume(token):
-    filepath = TOKEN_MAP.get(token)
+    filepath = resolve_token(token)
     if not filepath or not os.path.exists(filepath):
         frappe.throw("Invalid or expired link", frappe.PermissionError)
 
     if not is_path_allowed(filepath):
         frappe.throw("Unauthorized folder access", frappe.PermissionError)
 
-    with open(filepath, "rb") as f:
-        filecontent = f.read()
-
-    filename = os.path.basename(filepath)
-    frappe.local.response.filename = filename
-    frappe.local.response.filecontent = filecontent
-    frappe.local.response.type = "download"
-    return
+    return send_resume_file(filepath, as_attachment=True)
 
 #Securely serve a resume file for viewing if the token is valid
 @frappe.whitelist(allow_guest=True)
 def view_matched_resume(token):
-    filepath = TOKEN_MAP.get(token)
+    filepath = resolve_token(token)
     if not filepath or not os.path.exists(filepath):
         frappe.throw("Invalid or expired link for viewing", frappe.PermissionError)
 
     if not is_path_allowed(filepath):
         frappe.throw("Unauthorized folder access for viewing", frappe.PermissionError)
 
-    content_type_map = {
-        ".pdf": "application/pdf",
-        ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        ".doc": "application/msword"
-    }
-    ext = os.path.splitext(filepath)[1].lower()
-    content_type = content_type_map.get(ext, "text/plain")
-
-    with open(filepath, "rb") as f:
-        filecontent = f.read()
-
-    return {
-        "file_name": os.path.basename(filepath),
-        "file_content": frappe.utils.encode(filecontent),
-        "content_type": content_type,
-    }
+    return send_resume_file(filepath)
 
 #Extract text form html content
 def strip_html(text):
@@ -118,57 +148,40 @@ def strip_html(text):
 
     return ' '.join(soup.get_text().split())
 
-#Get All Job Opening From Frappe
+#Get All Job Opening From Frappe, served from the cleaned Job Opening catalogue in redis.
+# `fields` picks among name, job_title, description, experience_range and jd_required_skills
+# (default name, job_title, description); start / page_length page through the openings.
 @frappe.whitelist(allow_guest=True)
-def get_all_records():
+def get_all_records(fields=None, start=0, page_length=0):
     try: 
-        data = frappe.get_all("Job Opening", filters={"status": "Open"}, fields=["job_title", "description"])
-        cleaned_data = [{"job_title": item["job_title"], "description": strip_html(item["description"])} for item in data]
-        return cleaned_data
+        return get_catalogue_records(fields, start, page_length)
+    except frappe.ValidationError:
+        raise
     except Exception as e:
         frappe.throw(f"Error fetching job openings: {str(e)}")
 
-#This function fetches job applicants, processes their resume URLs, and constructs a list of file data objects.
-def get_applicant_files(): 
-    applicants = get_job_applicants() 
-    if isinstance(applicants, str):
-        return applicants 
-    files_data = []
-    for applicant in applicants:
-        resume_url = applicant.get("resume_attachment")
-        if not resume_url:
-            continue  
-
-        filename = os.path.basename(resume_url)
-        
-        if resume_url.startswith("/private/files/"):
-            file_type = "private"
-            file_path = frappe.get_site_path("private", "files", filename)
-        else:
-            file_type = "public"
-            file_path = frappe.get_site_path("public", "files", filename)
-
-        file_object = {
-            "applicant_name": applicant.get("applicant_name"),
-            "email": applicant.get("email_id"),
-            "file_type": file_type,
-            "file_url": resume_url,  
-            "file_path": file_path,  
-            "filename": filename 
-        }
-
-        files_data.append(file_object)
+# Cleaned description, experience range and required skills of one open Job Opening, for listings
+# that only loaded titles
+@frappe.whitelist(allow_guest=True)
+def get_job_opening_text(job_opening):
+    entry = get_catalogue_entry(job_opening)
+    if entry is None:
+        frappe.throw(f"Job Opening {job_opening} is not open", frappe.DoesNotExistError)
+    return {field: entry[field] for field in CATALOGUE_FIELDS}
 
-    return files_data
+#This function fetches job applicants, processes their resume URLs, and constructs a list of file data objects.
+# Filters are those of applicant_discovery.get_applicant_conditions; screening streams the same files
+# with iter_applicant_files instead of building this list.
+def get_applicant_files(**filters):
+    return list(iter_applicant_files(**filters))
 
-#Get Job Applicant whose status is open from frappe
+#Get Job Applicant whose status is open from frappe, optionally for one Job Opening or date range applied
 @frappe.whitelist(allow_guest=True)
-def get_job_applicants():
-    applicants = frappe.get_all(
-        "Job Applicant", 
-        filters={"status": "Open"},
-        fields=["applicant_name", "email_id", "resume_attachment","resume_link"]
-    )
+def get_job_applicants(job_opening=None, applied_from=None, applied_to=None, designation=None, source=None):
+    applicants = list(iter_job_applicants(
+        job_opening=job_opening, applied_from=applied_from, applied_to=applied_to, designation=designation,
+        source=source
+    ))
 
     if not applicants:
         return "No Job Applicants Found"
@@ -180,7 +193,8 @@ def get_job_applicants():
 def process_resumes():   
     jd_job_title = frappe.local.form_dict.get('job_title_select') 
     jd_text = frappe.local.form_dict.get('jd_text')
-    resumes_files = get_applicant_files()
+    top_k = frappe.utils.cint(frappe.local.form_dict.get('top_k'))
+    min_score = frappe.local.form_dict.get('min_score')
   
     if frappe.request.method == "OPTIONS":
         frappe.local.response.headers['Access-Control-Allow-Origin'] = '*'
@@ -188,50 +202,247 @@ def process_resumes():
         frappe.local.response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Frappe-CSRF-Token'
         return {}
 
-    try:
-        if jd_text:
-            jd_parsed = parse_jd(jd_text=jd_text)
-    except Exception as e:
-        return {'Error': f"Failed to parse job description: {str(e)}"}
+    profiler = instrumentation.get_requested_profiler()
+    with instrumentation.screening_run("process_resumes", jd_job_title, profiler=profiler) as run:
+        filters = get_request_filters(frappe.local.form_dict)
+        resumes_files = iter_applicant_files(**filters)
 
-    resume_scores = []
-    
-    for resume_file in resumes_files:
-        if not allowed_file(resume_file['filename']):
-            continue
-
-        resume_path = resume_file['file_path']
         try:
-            resume_parsed = parse_resume(resume_path)
-            score = score_resume(jd_parsed, resume_parsed)
-            percentage_score = score * 100
-         
-            experience_years = resume_parsed.get('total_experience', 0)
-            resume_scores.append({
-                'applicant_name': resume_file['applicant_name'],
-                'resume_name': resume_file['filename'],
-                'score': f"{percentage_score:.2f}%",
-                'experience_years': experience_years,
-                'resume_skills': resume_parsed.get('resume_skills', []),
-                'file_url': resume_file['file_url'],
-                'file_path': resume_path
-
-            })
-            
+            if jd_text:
+                jd_parsed = parse_jd(jd_text=jd_text)
         except Exception as e:
-            print(f"Error processing resume {resume_file['filename']}: {e}")
-            continue
-
-    experience_range = jd_parsed.get('experience', [])
+            return run.set_result({'Error': f"Failed to parse job description: {str(e)}"})
+
+        result = run.set_result(
+            screen_resumes(resumes_files, jd_parsed, jd_job_title, top_k, min_score, filters=filters)
+        )
+
+    result['metrics'] = run.as_dict()
+    result['run_log'] = run.log_name
+    return result
+
+# Screen applicant files against a parsed JD: optional vector index shortlist, staged scoring, experience
+# filter and categories. The shortlist is saved on the Job Opening unless save is False. resumes_files
+# may be a generator; it is consumed in batches of resume_lens_screening_batch_size files, so files
+# are parsed as they are discovered and only the scores of earlier batches are kept. filters are the
+# applicant filters resumes_files was discovered with, so the top_k shortlist is taken among them.
+def screen_resumes(resumes_files, jd_parsed, job_title=None, top_k=None, min_score=None, save=True, filters=None):
+    if isinstance(resumes_files, str):
+        resumes_files = []
+    shortlist = get_top_applicants(jd_parsed, top_k, min_score, filters) if top_k or min_score else None
+    if shortlist is not None:
+        top_applicants, index = shortlist
+        resumes_files = (f for f in resumes_files if is_shortlisted(f['job_applicant'], top_applicants, index))
+
+    extraction_results = []
+    stage_counts = {}
+    resume_scores = []
+    deduplicator = make_deduplicator()
+    for batch in iter_batches(resumes_files, get_screening_batch_size()):
+        batch_counts = {}
+        resume_scores.extend(score_resume_files(batch, jd_parsed, extraction_results, batch_counts, deduplicator))
+        for stage, count in batch_counts.items():
+            stage_counts[stage] = stage_counts.get(stage, 0) + count
+
+    experience_range = get_experience_range(jd_parsed)
     if experience_range:
-        min_experience = min(exp[0] for exp in experience_range)
-        max_experience = max(exp[1] for exp in experience_range)
+        min_experience, max_experience = experience_range
     else:
         return {'Error': 'Experience range not found in job description'}
 
     filtered_resumes = filter_resumes_by_experience(resume_scores, min_experience, max_experience,
                                                     jd_parsed['jd_required_skills'])
 
+    matched_resumes = categorize_resumes(filtered_resumes)
+
+    jd_required_skills = jd_parsed['jd_required_skills']
+    if save:
+        with instrumentation.stage("save_shortlist"):
+            save_shortlisted_candidates(matched_resumes, job_title, jd_required_skills)
+    
+    return {
+        'Matched_Resumes': matched_resumes,
+        'jd_required_skills': jd_required_skills,
+        'extraction_stats': summarize_extraction(extraction_results),
+        'stage_counts': stage_counts
+    }
+
+# Files parsed and scored together while streaming applicants (resume_lens_screening_batch_size)
+def get_screening_batch_size():
+    return frappe.utils.cint(get_config("resume_lens_screening_batch_size", DEFAULT_SCREENING_BATCH_SIZE))
+
+# Applicants the vector index ranks in the top_k / above min_score (a percentage) for the JD, with the
+# index itself, or None without a built index. With applicant filters (e.g. a Job Opening) only the
+# matching applicants are ranked, so the top_k are not used up by applicants of other openings.
+@instrumentation.timed("vector_index")
+def get_top_applicants(jd_parsed, top_k=None, min_score=None, filters=None):
+    index = get_applicant_index()
+    if index is None:
+        return None
+    jd_vector = scoring.pool_embedding(get_jd_embedding(jd_parsed))
+    min_score = frappe.utils.flt(min_score) / 100 if min_score not in (None, "") else None
+    job_applicants = get_applicant_file_names(**filters) if filters else None
+    hits = search_index(jd_vector, top_k, min_score, index, job_applicants)
+    return {name for name, score in hits}, index
+
+# Applicants added since the last index rebuild are not in the index yet; they are screened as usual
+# instead of being dropped, like prefilter_resume_files does for the skill index
+def is_shortlisted(job_applicant, top_applicants, index):
+    return job_applicant in top_applicants or job_applicant not in index
+
+# Staged screening of applicant files against a parsed JD. Cheap signals run first and only survivors
+# reach the expensive stages: file type -> experience range (cached or freshly extracted text) ->
+# skill overlap (skill matcher) -> sentence embedding. Candidate counts per stage are written to stage_counts.
+def score_resume_files(resume_files, jd_parsed, extraction_results=None, stage_counts=None, deduplicator=None):
+    if isinstance(resume_files, str):
+        resume_files = []
+    counts = stage_counts if stage_counts is not None else {}
+    counts['applicants'] = len(resume_files)
+    instrumentation.count("applicants", len(resume_files))
+
+    resume_files = [f for f in resume_files if allowed_file(f['filename'])]
+    counts['file_type'] = len(resume_files)
+    instrumentation.count("files_skipped", counts['applicants'] - len(resume_files))
+
+    resume_files = prefilter_resume_files(resume_files, jd_parsed)
+    counts['skill_index'] = len(resume_files)
+
+    content_hashes, features = load_resume_features([f['file_path'] for f in resume_files], extraction_results)
+    resume_files = [f for f in resume_files if f['file_path'] in content_hashes]
+    counts['text_extracted'] = len(resume_files)
+
+    if deduplicator is None:
+        deduplicator = make_deduplicator()
+    duplicates = find_duplicates(resume_files, content_hashes, features, deduplicator)
+    exact_duplicates = sum(1 for representative, kind in duplicates.values() if kind == "exact")
+    counts['exact_duplicates'] = exact_duplicates
+    counts['near_duplicates'] = len(duplicates) - exact_duplicates
+    instrumentation.count("exact_duplicates", exact_duplicates)
+    instrumentation.count("near_duplicates", len(duplicates) - exact_duplicates)
+    if get_duplicate_mode() == "collapse":
+        resume_files = [f for f in resume_files if get_duplicate_key(f) not in duplicates]
+    counts['deduplicated'] = len(resume_files)
+
+    experience_range = get_experience_range(jd_parsed)
+    if experience_range:
+        min_experience, max_experience = experience_range
+        resume_files = [
+            f for f in resume_files
+            if min_experience <= features[content_hashes[f['file_path']]]['total_experience'] <= max_experience
+        ]
+    counts['experience'] = len(resume_files)
+
+    survivors = {content_hashes[f['file_path']]: features[content_hashes[f['file_path']]] for f in resume_files}
+    counts['skills_extracted'] = ensure_resume_skills(survivors)
+
+    min_matched_skills = get_min_matched_skills()
+    if min_matched_skills:
+        jd_required_skills = set(jd_parsed['jd_required_skills'])
+        resume_files = [
+            f for f in resume_files
+            if len(jd_required_skills.intersection(map(str.lower, features[content_hashes[f['file_path']]]['resume_skills'])))
+            >= min_matched_skills
+        ]
+    counts['skill_overlap'] = len(resume_files)
+
+    survivors = {content_hashes[f['file_path']]: features[content_hashes[f['file_path']]] for f in resume_files}
+    counts['embeddings_computed'] = ensure_resume_embeddings(survivors)
+
+    # Files with identical content share one feature set and one score
+    unique_hashes = list(dict.fromkeys(content_hashes[f['file_path']] for f in resume_files))
+    unique_scores = dict(zip(unique_hashes, score_resumes(jd_parsed, [features[h] for h in unique_hashes]), strict=True))
+    scores = [unique_scores[content_hashes[f['file_path']]] for f in resume_files]
+    counts['scored'] = len(scores)
+
+    resume_scores = []
+    for resume_file, score in zip(resume_files, scores, strict=True):
+        resume_parsed = features[content_hashes[resume_file['file_path']]]
+        duplicate_of, duplicate_type = duplicates.get(get_duplicate_key(resume_file), (None, None))
+        resume_scores.append({
+            'job_applicant': resume_file.get('job_applicant'),
+            'applicant_name': resume_file['applicant_name'],
+            'resume_name': resume_file['filename'],
+            'score': format_score(score),
+            'score_value': round(score * 100, 2),
+            'experience_years': resume_parsed.get('total_experience', 0),
+            'resume_skills': resume_parsed.get('resume_skills', []),
+            'file_url': resume_file['file_url'],
+            'file_path': resume_file['file_path'],
+            'duplicate_of': duplicate_of,
+            'duplicate_type': duplicate_type
+        })
+
+    return resume_scores
+
+# Drop applicants the skill index already knows cannot pass the experience range or the skill overlap
+# stage, before any of their files is read. Applicants missing from the index go through unchanged.
+@instrumentation.timed("skill_index")
+def prefilter_resume_files(resume_files, jd_parsed):
+    skill_index = get_skill_index()
+    if skill_index is None:
+        return resume_files
+
+    min_experience, max_experience = get_experience_range(jd_parsed) or (None, None)
+    passing = set(skill_index.query(
+        match_skills=jd_parsed['jd_required_skills'],
+        min_match=get_min_matched_skills(),
+        min_experience=min_experience,
+        max_experience=max_experience
+    ))
+    return [f for f in resume_files if f['job_applicant'] in passing or f['job_applicant'] not in skill_index]
+
+# How duplicate resumes are handled (resume_lens_duplicate_mode): "flag" (default) marks files that are
+# identical or near-identical to an earlier applicant's resume, "collapse" also drops them from the
+# results, "exact" only looks for identical files and skips MinHash signatures
+def get_duplicate_mode():
+    return get_config("resume_lens_duplicate_mode", "flag")
+
+# Deduplication state for one screening run, shared by all of its batches
+def make_deduplicator():
+    if get_duplicate_mode() == "exact":
+        return Deduplicator()
+    threshold = get_config("resume_lens_near_duplicate_threshold", DEFAULT_NEAR_DUPLICATE_THRESHOLD)
+    return Deduplicator(frappe.utils.flt(threshold))
+
+def get_duplicate_key(resume_file):
+    return resume_file.get('job_applicant') or resume_file['file_path']
+
+# MinHash signature of a parsed resume, computed and cached for rows stored before signatures existed
+def get_minhash(content_hash, parsed, pipeline_version=None):
+    if parsed.get('minhash') is None:
+        parsed['minhash'] = minhash_signature(parsed['raw_text'])
+        update_features(content_hash, minhash=parsed['minhash'], pipeline_version=pipeline_version)
+    return parsed['minhash']
+
+# Check files in order against the run's deduplicator. Returns {key: (representative, "exact" | "near")}
+# for every file that duplicates one seen earlier in the run.
+@instrumentation.timed("deduplication")
+def find_duplicates(resume_files, content_hashes, features, deduplicator):
+    duplicates = {}
+    pipeline_version = get_pipeline_version()
+    for resume_file in resume_files:
+        content_hash = content_hashes[resume_file['file_path']]
+        representative, kind = deduplicator.check(
+            get_duplicate_key(resume_file), content_hash,
+            lambda: get_minhash(content_hash, features[content_hash], pipeline_version)
+        )
+        if representative is not None:
+            duplicates[get_duplicate_key(resume_file)] = (representative, kind)
+    return duplicates
+
+# Minimum number of JD skills a resume must share to reach the embedding stage (resume_lens_min_matched_skills)
+def get_min_matched_skills():
+    return frappe.utils.cint(get_config("resume_lens_min_matched_skills", 0))
+
+# Overall (min, max) experience in years required by a parsed JD
+def get_experience_range(jd_parsed):
+    experience_range = jd_parsed.get('experience', [])
+    if not experience_range:
+        return None
+    return min(exp[0] for exp in experience_range), max(exp[1] for exp in experience_range)
+
+# Bucket resumes by their percentage score
+def categorize_resumes(resumes):
     matched_resumes = {
         "PerfectMatched": [],
         "TopMatched": [],
@@ -240,8 +451,8 @@ def process_resumes():
         "NotGood": []
     }
 
-    for resume in filtered_resumes:
-        score = float(resume['score'].strip('%'))
+    for resume in resumes:
+        score = resume['score_value']
         if score >= 80:
             matched_resumes["PerfectMatched"].append(resume)
         elif 70 <= score < 80:
@@ -250,24 +461,124 @@ def process_resumes():
             matched_resumes["GoodMatched"].append(resume)
         elif 50 <= score < 60:
             matched_resumes["PoorMatched"].append(resume)
-        elif score < 50:
+        else:
             matched_resumes["NotGood"].append(resume)
 
-    jd_required_skills = jd_parsed['jd_required_skills']
-    save_shortlisted_candidates(matched_resumes, jd_job_title, jd_required_skills)
-    
-    return {
-        'Matched_Resumes': matched_resumes,
-        'jd_required_skills': jd_required_skills
-    }
+    return matched_resumes
+
+# Format a similarity score as the percentage string shown in the UI and saved on Candidate Score
+def format_score(score):
+    return f"{score * 100:.2f}%"
 
 # check file extention with ALLOWED_EXTENSIONS
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-# Function to save shortlisted candidates for a job opening
+SHORTLIST_CATEGORIES = ["PerfectMatched", "TopMatched", "GoodMatched"]
+CANDIDATE_SCORE_FIELDS = ["job_applicant", "resume_name", "experience_year", "skills_count", "matched_skills", "score"]
+
+# Map each candidate to its Job Applicant name with at most two queries. Candidates coming from
+# process_resumes already carry job_applicant; older callers only send applicant_name.
+def resolve_job_applicants(candidates):
+    known = {c["job_applicant"] for c in candidates if c.get("job_applicant")}
+    if known:
+        known = set(frappe.get_all("Job Applicant", filters={"name": ["in", list(known)]}, pluck="name"))
+
+    by_applicant_name = {}
+    unresolved = {c["applicant_name"] for c in candidates if not c.get("job_applicant") and c.get("applicant_name")}
+    if unresolved:
+        for applicant in frappe.get_all(
+            "Job Applicant",
+            filters={"applicant_name": ["in", list(unresolved)]},
+            fields=["name", "applicant_name"],
+            order_by="creation asc"
+        ):
+            by_applicant_name.setdefault(applicant.applicant_name, applicant.name)
+
+    resolved = []
+    for candidate in candidates:
+        if candidate.get("job_applicant"):
+            resolved.append(candidate["job_applicant"] if candidate["job_applicant"] in known else None)
+        else:
+            resolved.append(by_applicant_name.get(candidate.get("applicant_name")))
+    return resolved
+
+# Comparable values of a Candidate Score row, used to skip rewriting unchanged rows
+def get_candidate_score_values(row):
+    return tuple(
+        frappe.utils.flt(row.get(field)) if field == "experience_year" else str(row.get(field) or "")
+        for field in CANDIDATE_SCORE_FIELDS
+    )
+
+# Cut Data values to their column length; matched skills of a skill-heavy resume easily run past 140
+def trim_candidate_score(row):
+    meta = frappe.get_meta("Candidate Score")
+    row = dict(row)
+    for field in CANDIDATE_SCORE_FIELDS:
+        df = meta.get_field(field)
+        if df and df.fieldtype == "Data" and isinstance(row.get(field), str):
+            row[field] = row[field][:df.length or frappe.db.VARCHAR_LEN]
+    return row
+
+# Reserve count names of a doctype whose autoname is a "format:" expression with one counter,
+# e.g. Candidate Score's {DD}-{MM}-{YY}-{####}. The expression is expanded once with a placeholder
+# for the counter, and the whole block is taken from tabSeries with one locked read and one update
+# instead of one pair per row.
+def reserve_names(doctype, count):
+    autoname = frappe.get_meta(doctype).autoname
+    counter = {}
+
+    def number_generator(key, digits):
+        counter.update(key=key, digits=digits)
+        return "\0"
+
+    template = BRACED_PARAMS_PATTERN.sub(
+        lambda match: parse_naming_series([match.group()[1:-1]], number_generator=number_generator),
+        autoname.split(":", 1)[1]
+    )
+
+    series = frappe.qb.DocType("Series")
+    current = frappe.qb.from_(series).select(series.current).where(series.name == counter["key"]).for_update().run()
+    if current:
+        start = frappe.utils.cint(current[0][0]) + 1
+        frappe.qb.update(series).set(series.current, series.current + count).where(series.name == counter["key"]).run()
+    else:
+        start = 1
+        frappe.qb.into(series).insert(counter["key"], count).run()
+
+    return [template.replace("\0", str(n).zfill(counter["digits"])) for n in range(start, start + count)]
+
+# Insert Candidate Score child rows with a single multi-row INSERT. Rows are named from one reserved
+# block of the child doctype's series and trimmed to the column lengths, as a regular save would.
+def bulk_insert_candidate_scores(parent, rows, start_idx):
+    now = frappe.utils.now()
+    user = frappe.session.user
+    fields = ["name", "parent", "parenttype", "parentfield", "idx", "docstatus",
+              "owner", "modified_by", "creation", "modified"] + CANDIDATE_SCORE_FIELDS
+    values = []
+    for i, (name, row) in enumerate(zip(reserve_names("Candidate Score", len(rows)), rows, strict=True)):
+        row = trim_candidate_score(row)
+        values.append([name, parent, "Shortlisted Candidates", "candidate_score_list",
+                       start_idx + i, 0, user, user, now, now] + [row.get(field) for field in CANDIDATE_SCORE_FIELDS])
+    frappe.db.bulk_insert("Candidate Score", fields, values)
+
+# Delete every Candidate Score row of a shortlist, returns how many there were
+def clear_candidate_scores(shortlist_name):
+    filters = {"parent": shortlist_name, "parenttype": "Shortlisted Candidates", "parentfield": "candidate_score_list"}
+    removed = frappe.db.count("Candidate Score", filters)
+    frappe.db.delete("Candidate Score", filters)
+    return removed
+
+# Function to save shortlisted candidates for the open job opening titled job_opening. Each job opening keeps one Shortlisted
+# Candidates document that is updated incrementally: unchanged rows are kept, changed and new rows are
+# rewritten with one DELETE and one bulk INSERT, and candidates no longer shortlisted are removed.
+# The caller's transaction is not committed here.
 @frappe.whitelist()
 def save_shortlisted_candidates(candidate_score_list, job_opening, jd_required_skills):
+    candidate_score_list = frappe.parse_json(candidate_score_list)
+    if isinstance(jd_required_skills, str):
+        jd_required_skills = frappe.parse_json(jd_required_skills) if jd_required_skills.startswith("[") else [jd_required_skills]
+
     if not job_opening or not candidate_score_list:
         return {"status": "error", "message": "Job Opening and Candidate Score List are required."}
 
@@ -276,38 +587,101 @@ def save_shortlisted_candidates(candidate_score_list, job_opening, jd_required_s
     if not job_opening_id:
         return {"status": "error", "message": f"Job Opening '{job_opening}' not found or not open."}
 
-    shortlisted_candidates = []
+    return save_job_opening_shortlist(job_opening_id, candidate_score_list, jd_required_skills)
 
-    allowed_categories = ["PerfectMatched", "TopMatched", "GoodMatched"]
-    for category in allowed_categories:
-        if category in candidate_score_list:
-            for candidate in candidate_score_list[category]:
-                job_applicant = frappe.db.get_value("Job Applicant", {"applicant_name": candidate["applicant_name"]}, "name")
+# Save categorized screening results as the shortlist of the Job Opening named job_opening_id. Callers
+# that already know the opening use this directly, since several open openings may share a title.
+def save_job_opening_shortlist(job_opening_id, candidate_score_list, jd_required_skills):
+    candidates = [
+        candidate
+        for category in SHORTLIST_CATEGORIES
+        for candidate in candidate_score_list.get(category, [])
+    ]
+
+    shortlisted_candidates = {}
+    for candidate, job_applicant in zip(candidates, resolve_job_applicants(candidates), strict=True):
+        if job_applicant and job_applicant not in shortlisted_candidates:
+            # Trimmed up front so unchanged rows still compare equal to what was stored
+            shortlisted_candidates[job_applicant] = trim_candidate_score({
+                "job_applicant": job_applicant,
+                "resume_name": candidate["resume_name"],
+                "experience_year": frappe.utils.flt(candidate["experience_years"]),
+                "skills_count": candidate["matched_count"],
+                "matched_skills": ", ".join(candidate["matched_skills"]),
+                "score": candidate["score"]
+            })
 
-                if job_applicant:
-                    shortlisted_candidates.append({
-                        "job_applicant": job_applicant,
-                        "resume_name": candidate["resume_name"],
-                        "experience_year": candidate["experience_years"],
-                        "skills_count": candidate["matched_count"],
-                        "matched_skills": ", ".join(candidate["matched_skills"]),
-                        "score": candidate["score"]
-                    })
+    jd_required_skills = ", ".join(jd_required_skills or [])
+    shortlist_name = frappe.db.get_value(
+        "Shortlisted Candidates", {"job_opening": job_opening_id}, "name", order_by="creation desc"
+    )
 
+    # Nobody made the cut this time, so the previous run's shortlist no longer applies
     if not shortlisted_candidates:
-        return {"status": "error", "message": "No valid candidates found for shortlisting."}
+        removed = clear_candidate_scores(shortlist_name) if shortlist_name else 0
+        if shortlist_name:
+            frappe.db.set_value("Shortlisted Candidates", shortlist_name, "jd_required_skills", jd_required_skills)
+        return {
+            "status": "error",
+            "message": "No valid candidates found for shortlisting.",
+            "name": shortlist_name,
+            "removed": removed
+        }
+
+    if not shortlist_name:
+        shortlisted_doc = frappe.get_doc({
+            "doctype": "Shortlisted Candidates",
+            "job_opening": job_opening_id,
+            "jd_required_skills": jd_required_skills
+        })
+        shortlisted_doc.insert(ignore_permissions=True)
+        bulk_insert_candidate_scores(shortlisted_doc.name, list(shortlisted_candidates.values()), 1)
+        return {
+            "status": "success",
+            "message": "Shortlisted candidates saved successfully.",
+            "name": shortlisted_doc.name,
+            "inserted": len(shortlisted_candidates),
+            "updated": 0,
+            "removed": 0
+        }
 
-    shortlisted_doc = frappe.get_doc({
-        "doctype": "Shortlisted Candidates",
-        "job_opening": job_opening_id,
-        "candidate_score_list": shortlisted_candidates,
-        "jd_required_skills": ", ".join(jd_required_skills)
-    })
+    existing_rows = frappe.get_all(
+        "Candidate Score",
+        filters={"parent": shortlist_name, "parenttype": "Shortlisted Candidates", "parentfield": "candidate_score_list"},
+        fields=["name", "idx"] + CANDIDATE_SCORE_FIELDS
+    )
+    existing_applicants = {row.job_applicant for row in existing_rows}
+
+    unchanged, stale_rows = set(), []
+    for row in existing_rows:
+        candidate = shortlisted_candidates.get(row.job_applicant)
+        if (
+            candidate
+            and row.job_applicant not in unchanged
+            and get_candidate_score_values(row) == get_candidate_score_values(candidate)
+        ):
+            unchanged.add(row.job_applicant)
+        else:
+            stale_rows.append(row.name)
 
-    shortlisted_doc.insert(ignore_permissions=True)
-    frappe.db.commit()
+    if stale_rows:
+        frappe.db.delete("Candidate Score", {"name": ["in", stale_rows]})
 
-    return {"status": "success", "message": "Shortlisted candidates saved successfully."}
+    new_rows = [row for job_applicant, row in shortlisted_candidates.items() if job_applicant not in unchanged]
+    if new_rows:
+        max_idx = max((row.idx for row in existing_rows if row.name not in stale_rows), default=0)
+        bulk_insert_candidate_scores(shortlist_name, new_rows, max_idx + 1)
+
+    frappe.db.set_value("Shortlisted Candidates", shortlist_name, "jd_required_skills", jd_required_skills)
+
+    return {
+        "status": "success",
+        "message": "Shortlisted candidates saved successfully.",
+        "name": shortlist_name,
+        "inserted": len([row for row in new_rows if row["job_applicant"] not in existing_applicants]),
+        "updated": len([row for row in new_rows if row["job_applicant"] in existing_applicants]),
+        "removed": len(existing_applicants - set(shortlisted_candidates))
+    }
 
 # Extract experience ranges from text using regex patterns
 def extract_experience(text):
@@ -334,49 +708,8 @@ def extract_experience(text):
 
     return extracted_experience
 
-#Extract Text From PDF File
-def extract_text_from_pdf(file_path):
-    text = ""
-    
-    if not os.path.exists(file_path):
-        return f"File not found: {file_path}"
-
-    try:
-        with open(file_path, 'rb') as file:
-            reader = pypdf.PdfReader(file)
-            for page in reader.pages:
-                if page.extract_text():
-                    text += page.extract_text() + "\n"
-    except Exception as e:
-        return f"Error reading PDF: {str(e)}"
-
-    return text
-
-#Extract Text from doc, docx files
-def extract_text_from_docx(file_path):
-    return docx2txt.process(file_path)
-
-#Extract Skills From text 
-def extract_skills(skills_text):
-    skills_text = re.sub(r'[•\-–]', '', skills_text)
-    skills_text = re.sub(r'\s+', ' ', skills_text)
-    doc = nlp(skills_text)
-    excluded_tokens = ['NOUN', 'ADJ', 'PRON', 'CONJ', 'SCONJ', 'ADP', 'AUX', 'VERB', 'DET', 'CCONJ']
-    excluded_symbols = ['etc','to','to', '(', ')', '-', '_', '.', '/', ',', 'e.g.', '\n', ':', '’s',
-                        'to', 'hands','indepth','+', '2', 'complete','master', 'bachelor’s/', 'bachelor',
-                        'engineering/',' ','3','', 'independently', 'ip', 'identity', 'closely', 'http',
-                        'framework', 'one', 'highly', 'pipeline', 'serverless', 'strong', 'compute', 'code',
-                        'experience', 'web', 'storage', 'also', 'lambda', 'access', 'simple',
-                        'quickly', 'especially', 'certification', 'elastic', 'developer', 'information',
-                        'infrastructure', 'iam', 'service', 'effectively','management', 'dependency', 'entity',
-                        '10', 'core', 'parallel', 'async', 'basics', 'security', 'patterns', 'json','good',
-                        '!','~','`','@','$','%','^','*',]
-
-    excluded_symbols.extend(str(num) for num in range(1, 100001))
-    skills = [token.text.lower() for token in doc if token.pos_ not in excluded_tokens and token.text.lower() not in excluded_symbols]
-    return list(set(skills))
-
 #Parse Job Description file like [pdf,doc,docx] and return text
+@instrumentation.timed("parse_jd")
 def parse_jd(jd_file=None, jd_text=None):
     if jd_text:
         text = jd_text
@@ -393,7 +726,6 @@ def parse_jd(jd_file=None, jd_text=None):
     else:
         return {'error': 'No input provided'}
 
-    doc = nlp(text)
     experience = extract_experience(text)
     
     required_skills = re.search(r"(Skills :|Skills:|Requisite Skills:|Required Skills:|Must Have:)([\s\S]*?)(?=Preferred Skills|Education|Soft Skills|Roles and Responsibilities|$)", text, re.IGNORECASE)
@@ -424,34 +756,135 @@ def extract_experience_from_resume(text):
 
     return max(experience_years) if experience_years else 0
 
-#This method pars resume file [pdf,doc, docx] and return extracted details in [raw_text,total_experience,resume_skills]
-def parse_resume(file_path):
-    if file_path.endswith('.pdf'):
-        text = extract_text_from_pdf(file_path)
-    elif file_path.endswith('.doc') or file_path.endswith('.docx'):
-        text = extract_text_from_docx(file_path)
-    else:
-        with open(file_path, 'r') as f:
-            text = f.read()
+# Hash every file and load its cached features, extracting text and experience for unseen files.
+# Returns ({file_path: content_hash}, {content_hash: parsed}); skills and embedding stay None until
+# ensure_resume_skills / ensure_resume_embeddings compute them. Per-file extraction results (latency and
+# errors) are appended to extraction_results when a list is passed.
+def load_resume_features(file_paths, extraction_results=None):
+    content_hashes = {}
+    pipeline_version = get_pipeline_version()
+    with instrumentation.stage("hash_files"):
+        for file_path in file_paths:
+            try:
+                content_hashes[file_path] = get_content_hash(file_path)
+            except OSError as e:
+                instrumentation.record_file(file_path, 0, {"type": "unreadable", "message": str(e)})
+
+    with instrumentation.stage("feature_cache"):
+        features = get_cached_features(set(content_hashes.values()), pipeline_version)
+    instrumentation.count("cache_hits", len(features))
+
+    # Extract one file per uncached content hash
+    files_to_extract = {}
+    for file_path, content_hash in content_hashes.items():
+        if content_hash not in features and content_hash not in files_to_extract.values():
+            files_to_extract[file_path] = content_hash
+    instrumentation.count("cache_misses", len(files_to_extract))
+
+    with instrumentation.stage("extract_text"):
+        for result in extract_resumes_parallel(files_to_extract):
+            if extraction_results is not None:
+                extraction_results.append(dict(result, text=None))
+            instrumentation.record_file(result['file_path'], result['elapsed'], result['error'])
+            if result['error']:
+                continue
+
+            content_hash = files_to_extract[result['file_path']]
+            features[content_hash] = {
+                'raw_text': result['text'],
+                'total_experience': extract_experience_from_resume(result['text']),
+                'resume_skills': None,
+                'embedding': None,
+                'minhash': minhash_signature(result['text']) if get_duplicate_mode() != "exact" else None
+            }
+            store_features(content_hash, features[content_hash], pipeline_version)
+
+    content_hashes = {path: content_hash for path, content_hash in content_hashes.items() if content_hash in features}
+    return content_hashes, features
+
+# Tag resumes without cached skills in one streaming nlp.pipe pass. Returns how many were tagged.
+@instrumentation.timed("skills")
+def ensure_resume_skills(features):
+    missing = {h: parsed for h, parsed in features.items() if parsed.get('resume_skills') is None}
+    instrumentation.count("skills_cache_hits", len(features) - len(missing))
+    if missing:
+        skills = extract_skills_batch([parsed['raw_text'] for parsed in missing.values()])
+        pipeline_version = get_pipeline_version()
+        for (content_hash, resume_parsed), resume_skills in zip(missing.items(), skills, strict=True):
+            resume_parsed['resume_skills'] = resume_skills
+            update_features(content_hash, resume_skills=resume_skills, pipeline_version=pipeline_version)
+    return len(missing)
+
+# Encode resumes without a cached embedding in batches. Returns how many were encoded.
+@instrumentation.timed("embeddings")
+def ensure_resume_embeddings(features):
+    missing = {h: parsed for h, parsed in features.items() if parsed.get('embedding') is None}
+    instrumentation.count("embeddings_cache_hits", len(features) - len(missing))
+    if missing:
+        embeddings = scoring.encode_documents(get_embedding_model(), [parsed['raw_text'] for parsed in missing.values()])
+        pipeline_version = get_pipeline_version()
+        for (content_hash, resume_parsed), embedding in zip(missing.items(), embeddings, strict=True):
+            resume_parsed['embedding'] = embedding
+            update_features(content_hash, embedding=embedding, pipeline_version=pipeline_version)
+    return len(missing)
+
+# Parse and embed resumes, reusing cached features for files whose content hash was seen before.
+# Returns {file_path: parsed} with the embedding stored under 'embedding'.
+def get_resume_features(file_paths, extraction_results=None):
+    content_hashes, features = load_resume_features(file_paths, extraction_results)
+    ensure_resume_skills(features)
+    ensure_resume_embeddings(features)
+    return {file_path: features[content_hash] for file_path, content_hash in content_hashes.items()}
+
+# Extract resume texts on the process pool configured by resume_lens_extraction_workers,
+# resume_lens_extraction_timeout (seconds), resume_lens_extraction_max_memory_mb and
+# resume_lens_extraction_max_tasks_per_worker
+def extract_resumes_parallel(file_paths):
+    return extract_texts_parallel(
+        file_paths,
+        max_workers=frappe.utils.cint(get_config("resume_lens_extraction_workers")) or None,
+        max_tasks_per_worker=frappe.utils.cint(
+            get_config("resume_lens_extraction_max_tasks_per_worker", DEFAULT_MAX_TASKS_PER_WORKER)
+        ),
+        timeout=frappe.utils.flt(get_config("resume_lens_extraction_timeout", DEFAULT_EXTRACTION_TIMEOUT)),
+        max_memory_mb=frappe.utils.flt(
+            get_config("resume_lens_extraction_max_memory_mb", DEFAULT_EXTRACTION_MAX_MEMORY_MB)
+        ),
+        **get_extraction_limits()
+    )
 
-    total_experience = extract_experience_from_resume(text)
-    resume_skills = extract_skills(text)
-    
-    return {
-        'raw_text': text,
-        'total_experience': total_experience,
-        'resume_skills': resume_skills
-    }
-     
+# Score many resumes against one JD: the JD is embedded once and all similarities come from one
+# matrix-vector product. Returns plain float cosine scores in the order of resumes_parsed.
+@instrumentation.timed("scoring")
+def score_resumes(jd_parsed, resumes_parsed):
+    if not resumes_parsed:
+        return []
+
+    missing = [parsed for parsed in resumes_parsed if parsed.get('embedding') is None]
+    if missing:
+        embeddings = scoring.encode_documents(get_embedding_model(), [parsed['raw_text'] for parsed in missing])
+        for parsed, embedding in zip(missing, embeddings, strict=True):
+            parsed['embedding'] = embedding
+
+    scores = scoring.score_resumes(
+        get_embedding_model(), jd_parsed['raw_text'], [parsed['embedding'] for parsed in resumes_parsed],
+        get_jd_embedding(jd_parsed)
+    )
+    return scores.tolist()
+
+# The JD embedding is computed on first use and kept on jd_parsed, like a resume's on its features, so
+# every batch of a run and the vector index search share one encode of the JD
+def get_jd_embedding(jd_parsed):
+    if jd_parsed.get('embedding') is None:
+        jd_parsed['embedding'] = scoring.encode_jd(get_embedding_model(), jd_parsed['raw_text'])
+    return jd_parsed['embedding']
 
-#Extract Resume Score from Resume Text match with jd & resume text using sklearn.metrics.pairwise
+#Extract Resume Score from Resume Text match with jd & resume text
 def score_resume(jd_parsed, resume_parsed):
-    jd_embedding = model.encode(jd_parsed['raw_text'])
-    resume_embedding = model.encode(resume_parsed['raw_text'])
-    similarity_score = cosine_similarity([jd_embedding], [resume_embedding])[0][0]
-    return similarity_score
+    return score_resumes(jd_parsed, [resume_parsed])[0]
 
 #This Method is Filter Resumes by Experience
+@instrumentation.timed("experience_filter")
 def filter_resumes_by_experience(resume_scores, min_exp, max_exp, jd_required_skills):
     filtered_resumes = []
     for resume in resume_scores:
@@ -463,12 +896,16 @@ def filter_resumes_by_experience(resume_scores, min_exp, max_exp, jd_required_sk
             list_matched_skills = list(matched_skills)
 
             filtered_resumes.append({
+                'job_applicant': resume.get('job_applicant'),
                 'applicant_name': resume['applicant_name'],
                 'resume_name': resume['resume_name'],
                 'score': resume['score'],
+                'score_value': resume['score_value'],
                 'experience_years': resume['experience_years'],
                 'matched_skills': list_matched_skills,
                 'matched_count': f'{matched_count} out of {total_jd_skills}',
-                'view_url': get_secure_view_url(resume['file_url']),
+                'view_url': get_resume_link(resume['job_applicant']),
+                'duplicate_of': resume.get('duplicate_of'),
+                'duplicate_type': resume.get('duplicate_type'),
             })
     return filtered_resumes
@@ -0,0 +1,129 @@
+import os
+from itertools import islice
+
+import frappe
+from frappe.query_builder.functions import Count, IfNull
+from frappe.utils import add_days, cint, getdate
+
+from resume_lens import instrumentation
+from resume_lens.config import get_config
+
+DEFAULT_PAGE_SIZE = 500
+APPLICANT_FIELDS = ("name", "applicant_name", "email_id", "resume_attachment", "resume_link", "creation")
+
+# Rows fetched per query while paging through applicants (resume_lens_applicant_page_size)
+def get_page_size():
+    return cint(get_config("resume_lens_applicant_page_size", DEFAULT_PAGE_SIZE))
+
+# Query conditions for Job Applicants: the Job Opening applied for, the date range applied on
+# (inclusive, by creation date), designation, source and status
+def get_applicant_conditions(table, job_opening=None, applied_from=None, applied_to=None, designation=None,
+                             source=None, status="Open"):
+    conditions = []
+    if status:
+        conditions.append(table.status == status)
+    if job_opening:
+        conditions.append(table.job_title == job_opening)
+    if applied_from:
+        conditions.append(table.creation >= getdate(applied_from))
+    if applied_to:
+        conditions.append(table.creation < add_days(getdate(applied_to), 1))
+    if designation:
+        conditions.append(table.designation == designation)
+    if source:
+        conditions.append(table.source == source)
+    return conditions
+
+# Yield matching Job Applicants in (creation, name) order, one page per query. Pages continue after
+# the last row seen (keyset pagination), so each query stays an index range scan however deep it goes
+# and rows inserted meanwhile are neither skipped nor repeated. Passing the creation and name of a row
+# as `after` resumes the iteration right after that row.
+def iter_job_applicants(page_size=None, after=None, **filters):
+    table = frappe.qb.DocType("Job Applicant")
+    conditions = get_applicant_conditions(table, **filters)
+    page_size = cint(page_size) or get_page_size()
+
+    last = after
+    while True:
+        query = (
+            frappe.qb.from_(table)
+            .select(*[table[field] for field in APPLICANT_FIELDS])
+            .orderby(table.creation)
+            .orderby(table.name)
+            .limit(page_size)
+        )
+        for condition in conditions:
+            query = query.where(condition)
+        if last is not None:
+            query = query.where(
+                (table.creation > last["creation"])
+                | ((table.creation == last["creation"]) & (table.name > last["name"]))
+            )
+
+        with instrumentation.stage("applicant_query"):
+            page = query.run(as_dict=True)
+        yield from page
+        if len(page) < page_size:
+            return
+        last = page[-1]
+
+# File data of an applicant's resume attachment
+def make_applicant_file(applicant):
+    resume_url = applicant.get("resume_attachment")
+    filename = os.path.basename(resume_url)
+
+    if resume_url.startswith("/private/files/"):
+        file_type = "private"
+        file_path = frappe.get_site_path("private", "files", filename)
+    else:
+        file_type = "public"
+        file_path = frappe.get_site_path("public", "files", filename)
+
+    return {
+        "job_applicant": applicant.get("name"),
+        "applicant_name": applicant.get("applicant_name"),
+        "creation": applicant.get("creation"),
+        "email": applicant.get("email_id"),
+        "file_type": file_type,
+        "file_url": resume_url,
+        "file_path": file_path,
+        "filename": filename
+    }
+
+# Yield the resume file of every matching applicant with an attachment, as applicants are paged in
+def iter_applicant_files(page_size=None, after=None, **filters):
+    for applicant in iter_job_applicants(page_size, after, **filters):
+        if applicant.get("resume_attachment"):
+            yield make_applicant_file(applicant)
+
+# Query over the matching applicants with an attachment, i.e. those iter_applicant_files yields files for
+def get_applicant_files_query(table, **filters):
+    query = frappe.qb.from_(table).where(IfNull(table.resume_attachment, "") != "")
+    for condition in get_applicant_conditions(table, **filters):
+        query = query.where(condition)
+    return query
+
+def count_applicant_files(**filters):
+    table = frappe.qb.DocType("Job Applicant")
+    with instrumentation.stage("applicant_query"):
+        return get_applicant_files_query(table, **filters).select(Count(table.name)).run()[0][0]
+
+# Names of the applicants iter_applicant_files yields files for, without reading their other fields
+def get_applicant_file_names(**filters):
+    table = frappe.qb.DocType("Job Applicant")
+    with instrumentation.stage("applicant_query"):
+        return set(get_applicant_files_query(table, **filters).select(table.name).run(pluck=True))
+
+# Split an iterable into lists of at most size items without materializing it
+def iter_batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+# Applicant filters posted with a screening request
+def get_request_filters(form_dict):
+    return {
+        key: form_dict.get(key)
+        for key in ("job_opening", "applied_from", "applied_to", "designation", "source")
+        if form_dict.get(key)
+    }
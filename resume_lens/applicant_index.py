@@ -0,0 +1,210 @@
+import os
+import shutil
+
+import frappe
+from frappe.utils import cint, flt
+from frappe.utils.synchronization import filelock
+
+from resume_lens.config import get_config
+from resume_lens.feature_cache import get_cached_features, get_content_hash, get_pipeline_version
+from resume_lens.scoring import pool_embedding
+from resume_lens.skill_index import SkillIndex
+from resume_lens.vector_index import DEFAULT_NPROBE, VectorIndex
+
+INDEX_DIRNAME = "resume_lens_index"
+SKILL_INDEX_DIRNAME = "resume_lens_skill_index"
+INDEX_LOCK = "resume_lens_applicant_index"
+# Below this many applicants IVF partitions are not worth it and search stays exact
+MIN_IVF_SIZE = 5000
+REBUILD_BATCH_SIZE = 500
+
+def get_index_path():
+    return frappe.get_site_path("private", INDEX_DIRNAME)
+
+def get_skill_index_path():
+    return frappe.get_site_path("private", SKILL_INDEX_DIRNAME)
+
+# "exact" scans every row, "ivf" partitions the index and only scans the nearest partitions
+def get_index_mode():
+    return get_config("resume_lens_index_mode", "exact")
+
+def get_nprobe():
+    return cint(get_config("resume_lens_index_nprobe", DEFAULT_NPROBE))
+
+# Open the applicant index, or None when it was never built or was built by another pipeline version
+def get_applicant_index():
+    index = VectorIndex(get_index_path())
+    if index.dim is None or index.version != get_pipeline_version():
+        return None
+    return index
+
+_skill_indexes = {}
+
+# Open the skill index, or None when it was never built or was built by another pipeline version.
+# The loaded index is kept in this process until the files on disk change.
+def get_skill_index():
+    meta_path = os.path.join(get_skill_index_path(), "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+
+    stamp = (meta_path, os.stat(meta_path).st_mtime_ns)
+    if stamp not in _skill_indexes:
+        _skill_indexes.clear()
+        _skill_indexes[stamp] = SkillIndex(get_skill_index_path())
+    index = _skill_indexes[stamp]
+    return index if index.version == get_pipeline_version() else None
+
+# Drop the skill index, e.g. after the skill taxonomy changed; screening runs unfiltered until rebuilt
+def clear_skill_index():
+    shutil.rmtree(get_skill_index_path(), ignore_errors=True)
+
+# Cached features of open applicants' resumes, {job_applicant: parsed}
+def get_applicant_features(job_applicants):
+    from resume_lens.api import resolve_file_path
+
+    applicants = frappe.get_all(
+        "Job Applicant",
+        filters={"name": ["in", job_applicants], "status": "Open", "resume_attachment": ["is", "set"]},
+        fields=["name", "resume_attachment"]
+    )
+
+    content_hashes = {}
+    for applicant in applicants:
+        file_type, file_path, filename = resolve_file_path(applicant.resume_attachment)
+        if os.path.exists(file_path):
+            content_hashes[applicant.name] = get_content_hash(file_path)
+
+    features = get_cached_features(set(content_hashes.values()))
+    return {name: features[content_hash] for name, content_hash in content_hashes.items() if content_hash in features}
+
+def get_embeddings(features):
+    return {
+        name: pool_embedding(parsed['embedding'])
+        for name, parsed in features.items() if parsed['embedding'] is not None
+    }
+
+def get_skill_entries(features):
+    return [
+        (name, parsed['resume_skills'], parsed['total_experience'])
+        for name, parsed in features.items() if parsed['resume_skills'] is not None
+    ]
+
+# Add, refresh or drop applicants in both indexes after their resume or status changed. Applicants
+# that are no longer open, or have no cached embedding / skills yet, are removed.
+def sync_applicants(job_applicants):
+    features = get_applicant_features(job_applicants)
+    with filelock(INDEX_LOCK):
+        index = get_applicant_index()
+        if index is not None:
+            embeddings = get_embeddings(features)
+            index.remove([name for name in job_applicants if name not in embeddings])
+            index.add(list(embeddings), list(embeddings.values()))
+            index.save()
+
+        skill_index = get_skill_index()
+        if skill_index is not None:
+            entries = get_skill_entries(features)
+            indexed = {entry[0] for entry in entries}
+            skill_index.remove([name for name in job_applicants if name not in indexed])
+            skill_index.add_many(entries)
+            skill_index.save()
+
+def enqueue_sync_applicants(job_applicants):
+    frappe.enqueue(
+        "resume_lens.applicant_index.sync_applicants",
+        queue="short",
+        enqueue_after_commit=True,
+        job_applicants=job_applicants
+    )
+
+# Build the vector and skill indexes from scratch for every open applicant with cached features
+def rebuild_index():
+    from resume_lens.model_registry import get_embedding_model
+
+    job_applicants = frappe.get_all(
+        "Job Applicant",
+        filters={"status": "Open", "resume_attachment": ["is", "set"]},
+        order_by="creation asc, name asc",
+        pluck="name"
+    )
+
+    with filelock(INDEX_LOCK, timeout=600):
+        index = VectorIndex.create(
+            get_index_path(), get_embedding_model().get_sentence_embedding_dimension(), get_pipeline_version()
+        )
+        skill_index = SkillIndex.create(get_skill_index_path(), get_pipeline_version())
+        for start in range(0, len(job_applicants), REBUILD_BATCH_SIZE):
+            features = get_applicant_features(job_applicants[start:start + REBUILD_BATCH_SIZE])
+            embeddings = get_embeddings(features)
+            index.add(list(embeddings), list(embeddings.values()))
+            skill_index.add_many(get_skill_entries(features))
+
+        if get_index_mode() == "ivf" and len(index) >= MIN_IVF_SIZE:
+            index.train(cint(get_config("resume_lens_index_nlist")) or int(len(index) ** 0.5))
+        index.save()
+        skill_index.save()
+
+    return {"applicants": len(index), "skill_index_applicants": len(skill_index), "ivf": index.is_trained}
+
+@frappe.whitelist()
+def rebuild_applicant_index():
+    frappe.only_for("System Manager")
+
+    frappe.enqueue(
+        "resume_lens.applicant_index.rebuild_index",
+        queue="long",
+        timeout=3600,
+        job_id="resume_lens_rebuild_applicant_index",
+        deduplicate=True
+    )
+    return {"status": "success", "message": "Applicant index rebuild queued."}
+
+# Top matching open applicants for an embedded JD as [(job_applicant, score)], or None without an index.
+# With job_applicants the search only ranks those applicants.
+def search_index(jd_vector, top_k=50, min_score=None, index=None, job_applicants=None):
+    if index is None:
+        index = get_applicant_index()
+    if index is None:
+        return None
+    nprobe = get_nprobe() if get_index_mode() == "ivf" else None
+    return index.search(jd_vector, top_k=top_k, min_score=min_score, nprobe=nprobe, keys=job_applicants)
+
+@frappe.whitelist()
+def search_applicants(jd_text, top_k=50, min_score=None):
+    from resume_lens import scoring
+    from resume_lens.model_registry import get_embedding_model
+
+    # Embedded as get_top_applicants does, so chunked mode pools the JD's windows the same way
+    jd_vector = pool_embedding(scoring.encode_jd(get_embedding_model(), jd_text))
+    hits = search_index(jd_vector, cint(top_k), flt(min_score) / 100 if min_score not in (None, "") else None)
+    if hits is None:
+        frappe.throw("Applicant index has not been built yet")
+
+    return [{"job_applicant": name, "score_value": round(score * 100, 2)} for name, score in hits]
+
+def parse_skill_list(skills):
+    if not skills:
+        return None
+    if isinstance(skills, str):
+        skills = frappe.parse_json(skills) if skills.startswith("[") else skills.split(",")
+    return [skill.strip().lower() for skill in skills if skill.strip()]
+
+# Boolean skill search over all open applicants: every skill in all_of, any skill in any_of, none
+# in none_of, at least min_match of match_skills, with experience between min and max years
+@frappe.whitelist()
+def search_skills(all_of=None, any_of=None, none_of=None, match_skills=None, min_match=0,
+                  min_experience=None, max_experience=None, limit=100):
+    skill_index = get_skill_index()
+    if skill_index is None:
+        frappe.throw("Skill index has not been built yet")
+
+    job_applicants = skill_index.query(
+        all_of=parse_skill_list(all_of),
+        any_of=parse_skill_list(any_of),
+        none_of=parse_skill_list(none_of),
+        match_skills=parse_skill_list(match_skills),
+        min_match=cint(min_match),
+        min_experience=flt(min_experience) if min_experience not in (None, "") else None,
+        max_experience=flt(max_experience) if max_experience not in (None, "") else None
+    )
+    return {"total": len(job_applicants), "job_applicants": job_applicants[:cint(limit) or None]}
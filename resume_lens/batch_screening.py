@@ -0,0 +1,131 @@
+import frappe
+import numpy as np
+from frappe.utils import cint
+
+from resume_lens import scoring
+from resume_lens.opening_matching import get_opening_features
+
+
+# Screen many Job Openings against the applicant pool in one pass. Applicant discovery, text
+# extraction, skill tagging and resume embedding happen once for the pool, all JD x resume scores come
+# from one matrix product, and each opening's experience range and skill threshold are applied as
+# boolean masks over that score matrix.
+def run_batch_screening(job_openings=None):
+    from resume_lens.api import (
+        allowed_file,
+        categorize_resumes,
+        format_score,
+        get_applicant_files,
+        get_min_matched_skills,
+        get_resume_features,
+        get_resume_link,
+        save_job_opening_shortlist,
+    )
+
+    opening_features = get_opening_features()
+    columns = [
+        column for column, opening in enumerate(opening_features["openings"])
+        if not job_openings or opening["name"] in job_openings
+    ]
+    openings = [opening_features["openings"][column] for column in columns]
+    if not openings:
+        return {}
+
+    resume_files = get_applicant_files()
+    if isinstance(resume_files, str):
+        resume_files = []
+    resume_files = [f for f in resume_files if allowed_file(f['filename'])]
+    features = get_resume_features([f['file_path'] for f in resume_files])
+    resume_files = [f for f in resume_files if f['file_path'] in features]
+    resumes_parsed = [features[f['file_path']] for f in resume_files]
+    if not resumes_parsed:
+        return {opening["name"]: {"job_title": opening["job_title"], "Matched_Resumes": categorize_resumes([])}
+                for opening in openings}
+
+    # (resumes, openings) cosine scores
+    scores = scoring.score_matrix(
+        [parsed['embedding'] for parsed in resumes_parsed],
+        [opening_features["jd_embeddings"][column] for column in columns]
+    )
+
+    # Experience bounds as columns. An opening whose JD states no range gets (-inf, inf), so its
+    # column is limited only by the skill threshold below.
+    experience = np.array([parsed['total_experience'] for parsed in resumes_parsed], dtype=np.float32)
+    min_experience = np.array([(o["experience_range"] or (-np.inf, np.inf))[0] for o in openings], dtype=np.float32)
+    max_experience = np.array([(o["experience_range"] or (-np.inf, np.inf))[1] for o in openings], dtype=np.float32)
+    mask = (experience[:, None] >= min_experience[None, :]) & (experience[:, None] <= max_experience[None, :])
+
+    # Matched skill counts from resume x skill and opening x skill incidence matrices
+    vocabulary = {skill: i for i, skill in enumerate(sorted({s for o in openings for s in o["jd_required_skills"]}))}
+    resume_skills = [set(map(str.lower, parsed['resume_skills'] or [])) for parsed in resumes_parsed]
+    resume_incidence = np.zeros((len(resumes_parsed), len(vocabulary)), dtype=np.float32)
+    for row, skills in enumerate(resume_skills):
+        resume_incidence[row, [vocabulary[s] for s in skills if s in vocabulary]] = 1
+    opening_incidence = np.zeros((len(openings), len(vocabulary)), dtype=np.float32)
+    for column, opening in enumerate(openings):
+        opening_incidence[column, [vocabulary[s] for s in opening["jd_required_skills"]]] = 1
+    matched_counts = (resume_incidence @ opening_incidence.T).astype(np.int32)
+
+    min_matched_skills = get_min_matched_skills()
+    if min_matched_skills:
+        mask &= matched_counts >= min_matched_skills
+
+    results = {}
+    try:
+        for column, opening in enumerate(openings):
+            jd_required_skills = opening["jd_required_skills"]
+            rows = np.flatnonzero(mask[:, column])
+            rows = rows[np.argsort(-scores[rows, column], kind="stable")]
+
+            resumes = []
+            for row in rows:
+                resume_file, score = resume_files[row], float(scores[row, column])
+                resumes.append({
+                    'job_applicant': resume_file['job_applicant'],
+                    'applicant_name': resume_file['applicant_name'],
+                    'resume_name': resume_file['filename'],
+                    'score': format_score(score),
+                    'score_value': round(score * 100, 2),
+                    'experience_years': resumes_parsed[row]['total_experience'],
+                    'matched_skills': list(resume_skills[row].intersection(jd_required_skills)),
+                    'matched_count': f"{matched_counts[row, column]} out of {len(jd_required_skills)}",
+                    'view_url': get_resume_link(resume_file['job_applicant']),
+                })
+
+            matched_resumes = categorize_resumes(resumes)
+            save_job_opening_shortlist(opening["name"], matched_resumes, jd_required_skills)
+            results[opening["name"]] = {
+                "job_title": opening["job_title"],
+                "jd_required_skills": jd_required_skills,
+                "Matched_Resumes": matched_resumes
+            }
+        # Every opening's shortlist is saved in the same transaction
+        frappe.db.commit()
+    except Exception:
+        frappe.db.rollback()
+        raise
+
+    return results
+
+# Screen a list of Job Openings (all open ones by default). With enqueue=1 the run goes to the long
+# queue and its result is not returned. Screening reads every applicant and rewrites shortlists, so
+# it is limited to System Managers like the Shortlisted Candidates doctype itself.
+@frappe.whitelist()
+def screen_job_openings(job_openings=None, enqueue=0):
+    frappe.only_for("System Manager")
+
+    if isinstance(job_openings, str):
+        job_openings = frappe.parse_json(job_openings) if job_openings.startswith("[") else [job_openings]
+
+    if cint(enqueue):
+        frappe.enqueue(
+            "resume_lens.batch_screening.run_batch_screening",
+            queue="long",
+            timeout=6 * 3600,
+            job_id="resume_lens_batch_screening",
+            deduplicate=True,
+            job_openings=job_openings
+        )
+        return {"status": "queued"}
+
+    return run_batch_screening(job_openings)
@@ -0,0 +1,32 @@
+import json
+import statistics
+import time
+
+
+# Time fn over repeated runs and return throughput and latency percentiles in milliseconds
+def time_runs(fn, runs=20, warmup=2):
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    return {
+        "runs": runs,
+        "mean_ms": round(statistics.fmean(timings), 4),
+        "p50_ms": round(percentile(timings, 50), 4),
+        "p95_ms": round(percentile(timings, 95), 4),
+    }
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def print_report(report):
+    print(json.dumps(report, indent=2))
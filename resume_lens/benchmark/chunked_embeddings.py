@@ -0,0 +1,60 @@
+"""Embedding throughput in docs/sec: single-shot vs chunked encoding.
+
+Single-shot encoding embeds each resume once, truncated to the model's 256 word pieces. Chunked
+encoding embeds every overlapping window of every resume in one batched pass. Reports docs/sec,
+windows per document and the stored embedding size per document.
+
+    python -m resume_lens.benchmark.chunked_embeddings --docs 100 --words 1200
+"""
+import argparse
+
+import numpy as np
+from sentence_transformers import SentenceTransformer
+
+from resume_lens import scoring
+from resume_lens.benchmark import print_report
+from resume_lens.benchmark.nlp_throughput import docs_per_second, make_texts
+from resume_lens.model_registry import EMBEDDING_MODEL_NAME
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=100)
+    parser.add_argument("--words", type=int, default=1200, help="Words per document")
+    parser.add_argument("--chunk-words", type=int, default=scoring.DEFAULT_CHUNK_WORDS)
+    parser.add_argument("--overlap", type=int, default=scoring.DEFAULT_CHUNK_OVERLAP)
+    parser.add_argument("--max-chunks", type=int, default=scoring.DEFAULT_MAX_CHUNKS)
+    parser.add_argument("--batch-size", type=int, default=scoring.DEFAULT_ENCODE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    texts = make_texts(args.docs, words_per_doc=args.words)
+    chunk_settings = {"chunk_words": args.chunk_words, "overlap": args.overlap, "max_chunks": args.max_chunks}
+    output = {}
+
+    def run_single():
+        output["single"] = scoring.encode_texts(model, texts, args.batch_size)
+
+    def run_chunked():
+        output["chunked"] = scoring.encode_chunked(model, texts, args.batch_size, **chunk_settings)
+
+    single = docs_per_second(args.docs, run_single)
+    chunked = docs_per_second(args.docs, run_chunked)
+    windows = [len(matrix) for matrix in output["chunked"]]
+
+    print_report({
+        "benchmark": "chunked_embeddings",
+        "docs": args.docs,
+        "words_per_doc": args.words,
+        **chunk_settings,
+        "single_shot": single,
+        "chunked": chunked,
+        "windows_per_doc": round(float(np.mean(windows)), 2),
+        "bytes_per_doc": {
+            "single_float32": int(output["single"][0].nbytes),
+            "chunked_float16": int(np.mean([matrix.nbytes for matrix in output["chunked"]])),
+        },
+    })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Reproducible synthetic resume and JD corpus for the offline benchmarks.
+
+Resumes are written as real PDF and DOCX files without any third-party writer: the PDF is a
+hand-assembled PDF 1.4 file with one Helvetica text stream per page, the DOCX a zip holding the
+minimal WordprocessingML parts docx2txt reads. The same seed always gives the same corpus.
+
+    python -m resume_lens.benchmark.corpus --resumes 1000 --jds 10 --output /tmp/resume_lens_corpus
+"""
+import argparse
+import json
+import os
+import random
+import zipfile
+from xml.sax.saxutils import escape
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "skill_taxonomy.json")
+
+ROLES = [
+    "Backend Engineer", "Frontend Developer", "Data Scientist", "DevOps Engineer", "Android Developer",
+    "Full Stack Developer", "QA Engineer", "Machine Learning Engineer", "Cloud Architect", "Data Engineer",
+]
+FIRST_NAMES = ["Aarav", "Priya", "Rohan", "Ananya", "Vikram", "Meera", "Arjun", "Sara", "Kabir", "Isha", "Dev", "Nina"]
+LAST_NAMES = ["Shah", "Patel", "Iyer", "Mehta", "Rao", "Kapoor", "Desai", "Nair", "Joshi", "Khan", "Singh", "Das"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Hooli", "Stark Industries", "Wayne Tech", "Vandelay"]
+FILLER = [
+    "Delivered features on time while working closely with product and design.",
+    "Improved reliability of critical services and reduced incident count.",
+    "Mentored junior engineers and reviewed code across teams.",
+    "Automated manual processes and documented the new workflows.",
+    "Collaborated with stakeholders to gather requirements and plan releases.",
+    "Optimized slow queries and cut page load times significantly.",
+]
+
+def load_skills(path=TAXONOMY_PATH):
+    with open(path, encoding="utf-8") as f:
+        return list(json.load(f))
+
+def make_resume_lines(rng, skills, pages=1):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    years = rng.randint(0, 15)
+    role = rng.choice(ROLES)
+    resume_skills = rng.sample(skills, rng.randint(5, 15))
+
+    lines = [
+        name,
+        f"{name.lower().replace(' ', '.')}@example.com | +91 98{rng.randint(10000000, 99999999)}",
+        "Summary",
+        f"{role} with {years} years of experience building production systems.",
+        "Skills: " + ", ".join(resume_skills),
+        "Experience",
+    ]
+    for _ in range(max(1, pages) * 6):
+        skill = rng.choice(resume_skills)
+        lines.append(f"{rng.choice(COMPANIES)} - {role} ({rng.randint(2008, 2020)} - {rng.randint(2021, 2025)})")
+        lines.append(f"Used {skill} daily. {rng.choice(FILLER)} {rng.choice(FILLER)}")
+    lines += ["Education", "B.Tech in Computer Science"]
+    return lines
+
+def make_jd_text(rng, skills):
+    min_years = rng.randint(0, 8)
+    role = rng.choice(ROLES)
+    return "\n".join([
+        f"Job Title: {role}",
+        f"Experience: {min_years}-{min_years + rng.randint(2, 5)} years",
+        "Required Skills: " + ", ".join(rng.sample(skills, rng.randint(4, 10))),
+        "Roles and Responsibilities: " + " ".join(rng.sample(FILLER, 3)),
+    ])
+
+def _pdf_string(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+# Minimal PDF 1.4: catalog, page tree, one font and a page plus content stream per page of lines
+def write_pdf(path, lines, lines_per_page=50):
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    page_ids = [4 + 2 * i for i in range(len(pages))]
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(pages)} >>".encode(),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for page_id, page_lines in zip(page_ids, pages, strict=True):
+        stream = ("BT /F1 10 Tf 14 TL 50 800 Td "
+                  + " ".join(f"({_pdf_string(line)}) Tj T*" for line in page_lines) + " ET").encode("latin-1")
+        objects[page_id] = (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+                            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {page_id + 1} 0 R >>").encode()
+        objects[page_id + 1] = b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = len(output)
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, objects[number])
+
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for number in sorted(objects):
+        output += b"%010d 00000 n \n" % offsets[number]
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+
+    with open(path, "wb") as f:
+        f.write(output)
+
+DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/></Relationships>'
+)
+
+# Minimal DOCX: content types, package relationships and a document with one paragraph per line
+def write_docx(path, lines):
+    paragraphs = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>' for line in lines
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{paragraphs}</w:body></w:document>'
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", DOCX_CONTENT_TYPES)
+        docx.writestr("_rels/.rels", DOCX_RELS)
+        docx.writestr("word/document.xml", document)
+
+# Write `resumes` resume files (a pdf_ratio share as PDF, the rest DOCX) and `jds` JD texts into
+# directory. Returns {"resumes": [{file_path, filename, applicant_name}], "jds": [text]}.
+def generate_corpus(directory, resumes=100, jds=5, pdf_ratio=0.7, pages=1, seed=0):
+    rng = random.Random(seed)
+    skills = load_skills()
+    os.makedirs(directory, exist_ok=True)
+
+    corpus = {"resumes": [], "jds": [make_jd_text(rng, skills) for _ in range(jds)]}
+    for index in range(resumes):
+        lines = make_resume_lines(rng, skills, pages)
+        is_pdf = rng.random() < pdf_ratio
+        filename = f"resume_{index:05d}.{'pdf' if is_pdf else 'docx'}"
+        file_path = os.path.join(directory, filename)
+        if is_pdf:
+            write_pdf(file_path, lines)
+        else:
+            write_docx(file_path, lines)
+        corpus["resumes"].append({"file_path": file_path, "filename": filename, "applicant_name": lines[0]})
+
+    with open(os.path.join(directory, "corpus.json"), "w") as f:
+        json.dump(corpus, f, indent=1)
+    return corpus
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--jds", type=int, default=5)
+    parser.add_argument("--pdf-ratio", type=float, default=0.7)
+    parser.add_argument("--pages", type=int, default=1, help="Approximate resume length in pages")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="resume_lens_corpus")
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.output, args.resumes, args.jds, args.pdf_ratio, args.pages, args.seed)
+    print(f"Wrote {len(corpus['resumes'])} resumes and {len(corpus['jds'])} JDs to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Compare embedding backends: ranking accuracy on a fixture corpus and encode throughput.
+
+Accuracy ranks the fixture resumes for every fixture JD with each backend and compares the ranking
+against the first backend (the reference): Kendall tau, top-k overlap and the largest score
+difference. The run fails (exit code 1) when any JD's tau drops below --min-tau.
+Throughput encodes synthetic resumes and reports docs/sec per backend at the given thread count.
+
+    python -m resume_lens.benchmark.embedding_backends --backends torch,torch_int8 --threads 2
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from resume_lens import scoring
+from resume_lens.benchmark import print_report
+from resume_lens.benchmark.nlp_throughput import docs_per_second, make_texts
+from resume_lens.embedding_backends import load_backend
+from resume_lens.model_registry import EMBEDDING_MODEL_NAME
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "backend_corpus.json")
+
+def load_corpus(path=FIXTURE_PATH):
+    with open(path) as f:
+        corpus = json.load(f)
+    return corpus["job_descriptions"], corpus["resumes"]
+
+# Fraction of concordant minus discordant pairs between two score vectors over the same items
+def kendall_tau(a, b):
+    i, j = np.triu_indices(len(a), k=1)
+    agreement = np.sign(a[i] - a[j]) * np.sign(b[i] - b[j])
+    return float(agreement.sum() / len(agreement)) if len(agreement) else 1.0
+
+def score_matrix(backend, job_descriptions, resumes):
+    jd_matrix = scoring.encode_texts(backend, list(job_descriptions.values()))
+    resume_matrix = scoring.encode_texts(backend, list(resumes.values()))
+    return jd_matrix @ resume_matrix.T
+
+def compare_rankings(reference, candidate, job_descriptions, top_k):
+    per_jd = {}
+    for row, jd_name in enumerate(job_descriptions):
+        ref_top = set(np.argsort(-reference[row])[:top_k])
+        cand_top = set(np.argsort(-candidate[row])[:top_k])
+        per_jd[jd_name] = {
+            "kendall_tau": round(kendall_tau(reference[row], candidate[row]), 4),
+            "top_k_overlap": round(len(ref_top & cand_top) / top_k, 4),
+            "max_score_diff": round(float(np.abs(reference[row] - candidate[row]).max()), 4),
+        }
+    return per_jd
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="torch,torch_int8", help="Comma separated, the first is the reference")
+    parser.add_argument("--threads", type=int, default=0, help="Threads per backend, 0 for the library default")
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--words", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--min-tau", type=float, default=0.8)
+    args = parser.parse_args()
+
+    job_descriptions, resumes = load_corpus()
+    texts = make_texts(args.docs, words_per_doc=args.words)
+    names = args.backends.split(",")
+
+    report = {"benchmark": "embedding_backends", "reference": names[0], "threads": args.threads,
+              "docs": args.docs, "accuracy": {}, "throughput": {}}
+    reference = None
+    passed = True
+    for name in names:
+        backend = load_backend(EMBEDDING_MODEL_NAME, name, args.threads)
+        scores = score_matrix(backend, job_descriptions, resumes)
+        if reference is None:
+            reference = scores
+        else:
+            per_jd = compare_rankings(reference, scores, job_descriptions, args.top_k)
+            min_tau = min(result["kendall_tau"] for result in per_jd.values())
+            passed &= min_tau >= args.min_tau
+            report["accuracy"][name] = {"min_kendall_tau": min_tau, "per_jd": per_jd}
+
+        report["throughput"][name] = docs_per_second(args.docs, lambda: scoring.encode_texts(backend, texts))
+
+    report["accuracy_passed"] = passed
+    print_report(report)
+    sys.exit(0 if passed else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Skill extraction throughput in docs/sec.
+
+Compares the full en_core_web_sm pipeline called one document at a time (the previous
+behaviour) against the trimmed tagger-only pipeline streamed through nlp.pipe.
+
+    python -m resume_lens.benchmark.nlp_throughput --docs 200 --batch-size 32 --n-process 1
+"""
+import argparse
+import random
+import time
+
+import spacy
+
+from resume_lens.benchmark import print_report
+from resume_lens.benchmark.skill_filter import WORDS
+from resume_lens.model_registry import SPACY_EXCLUDED_COMPONENTS, SPACY_MODEL_NAME
+from resume_lens.skills import DEFAULT_STOPLIST, clean_skills_text, get_skills_from_doc
+
+
+def make_texts(count, words_per_doc=600, seed=0):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(words_per_doc)) + "." for _ in range(count)]
+
+def docs_per_second(count, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    return {"seconds": round(elapsed, 3), "docs_per_sec": round(count / elapsed, 2) if elapsed else None}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+
+    texts = [clean_skills_text(text) for text in make_texts(args.docs)]
+
+    full_nlp = spacy.load(SPACY_MODEL_NAME)
+    trimmed_nlp = spacy.load(SPACY_MODEL_NAME, exclude=SPACY_EXCLUDED_COMPONENTS)
+
+    def run_full():
+        for text in texts:
+            get_skills_from_doc(full_nlp(text), DEFAULT_STOPLIST)
+
+    def run_trimmed_pipe():
+        for doc in trimmed_nlp.pipe(texts, batch_size=args.batch_size, n_process=args.n_process):
+            get_skills_from_doc(doc, DEFAULT_STOPLIST)
+
+    print_report({
+        "benchmark": "nlp_throughput",
+        "docs": args.docs,
+        "batch_size": args.batch_size,
+        "n_process": args.n_process,
+        "full_pipeline_per_doc": docs_per_second(args.docs, run_full),
+        "trimmed_pipeline_pipe": docs_per_second(args.docs, run_trimmed_pipe),
+        "trimmed_components": trimmed_nlp.pipe_names,
+    })
+
+if __name__ == "__main__":
+    main()
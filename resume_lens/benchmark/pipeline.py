@@ -0,0 +1,221 @@
+"""Per-stage and end to end benchmark of resume screening on a synthetic corpus.
+
+Generates a reproducible corpus with benchmark.corpus (or reuses one passed with --corpus) and times
+each stage of the pipeline on it in isolation: PDF and DOCX text extraction, skill extraction, resume
+experience parsing, single resume scoring and the experience filter. It then screens the whole corpus
+against every JD through api.screen_resumes, first with an empty feature cache (cold) and then with
+the features cached by the first pass (warm). Throughput, p50/p95 latency and peak RSS are reported
+as JSON so runs on different commits can be compared.
+
+A site is needed for config, redis and the feature cache tables, but no network: Hugging Face is put
+in offline mode, and with --embedder stub (or auto, when the model weights are not downloaded) a hashed
+bag-of-words encoder replaces the sentence-transformer. The database is rolled back at the end.
+Peak RSS is the process high-water mark after each stage; extraction workers are reported separately.
+Run it from the bench's sites directory:
+
+    python -m resume_lens.benchmark.pipeline --site mysite --resumes 1000 --jds 5 --output report.json
+"""
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import tempfile
+import time
+
+import frappe
+
+from resume_lens.benchmark import percentile, print_report, time_runs
+from resume_lens.benchmark.corpus import generate_corpus
+
+
+def peak_rss_mb(who=resource.RUSAGE_SELF):
+    return round(resource.getrusage(who).ru_maxrss / 1024, 1)
+
+# Call fn once per item and return throughput, latency percentiles (ms) and peak RSS
+def time_items(fn, items):
+    timings = []
+    start = time.perf_counter()
+    for item in items:
+        item_start = time.perf_counter()
+        fn(item)
+        timings.append((time.perf_counter() - item_start) * 1000)
+    elapsed = time.perf_counter() - start
+
+    timings.sort()
+    return {
+        "items": len(items),
+        "seconds": round(elapsed, 3),
+        "items_per_sec": round(len(items) / elapsed, 2) if elapsed else None,
+        "p50_ms": round(percentile(timings, 50), 4),
+        "p95_ms": round(percentile(timings, 95), 4),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+def load_corpus(directory):
+    with open(os.path.join(directory, "corpus.json")) as f:
+        return json.load(f)
+
+def get_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=frappe.get_app_path("resume_lens"), text=True,
+            stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# Load the configured embedding backend, or the stub when asked to or when auto finds no weights
+def setup_embedder(embedder):
+    from resume_lens.embedding_backends import STUB_BACKEND
+    from resume_lens.model_registry import get_embedding_model
+
+    if embedder == "stub":
+        frappe.local.conf["resume_lens_embedding_backend"] = STUB_BACKEND
+    try:
+        return get_embedding_model().name
+    except Exception:
+        if embedder != "auto":
+            raise
+    frappe.local.conf["resume_lens_embedding_backend"] = STUB_BACKEND
+    return get_embedding_model().name
+
+def run_stages(corpus, sample=None):
+    from resume_lens import api
+
+    resumes = corpus["resumes"][:sample or None]
+    pdf_paths = [r["file_path"] for r in resumes if r["file_path"].endswith(".pdf")]
+    docx_paths = [r["file_path"] for r in resumes if r["file_path"].endswith(".docx")]
+    texts = {}
+
+    stages = {}
+    stages["extract_text_from_pdf"] = time_items(
+        lambda path: texts.__setitem__(path, api.extract_text_from_pdf(path)), pdf_paths
+    )
+    stages["extract_text_from_docx"] = time_items(
+        lambda path: texts.__setitem__(path, api.extract_text_from_docx(path)), docx_paths
+    )
+    texts = list(texts.values())
+    stages["extract_skills"] = time_items(api.extract_skills, texts)
+    stages["extract_experience_from_resume"] = time_items(api.extract_experience_from_resume, texts)
+
+    jd_parsed = api.parse_jd(jd_text=corpus["jds"][0])
+    stages["score_resume"] = time_items(lambda text: api.score_resume(jd_parsed, {"raw_text": text}), texts)
+
+    scores = api.score_resumes(jd_parsed, [{"raw_text": text} for text in texts])
+    resume_scores = [
+        {
+            "job_applicant": f"BENCH-{index:05d}",
+            "applicant_name": resume["applicant_name"],
+            "resume_name": resume["filename"],
+            "score": api.format_score(score),
+            "score_value": round(score * 100, 2),
+            "experience_years": api.extract_experience_from_resume(text),
+            "resume_skills": api.extract_skills(text),
+        }
+        for index, (resume, text, score) in enumerate(zip(resumes, texts, scores, strict=True))
+    ]
+    min_experience, max_experience = api.get_experience_range(jd_parsed)
+    stages["filter_resumes_by_experience"] = dict(time_runs(
+        lambda: api.filter_resumes_by_experience(resume_scores, min_experience, max_experience,
+                                                 jd_parsed["jd_required_skills"]),
+        runs=10, warmup=1
+    ), items=len(resume_scores), peak_rss_mb=peak_rss_mb())
+    return stages
+
+# Screen every resume against every JD without saving shortlists; returns per-JD latency, throughput
+# and the stage timings and counters collected by resume_lens.instrumentation
+def run_end_to_end(corpus):
+    from resume_lens import api, instrumentation
+
+    resume_files = [
+        dict(resume, job_applicant=f"BENCH-{index:05d}", file_url=None)
+        for index, resume in enumerate(corpus["resumes"])
+    ]
+    timings = []
+    stage_counts = None
+    start = time.perf_counter()
+    with instrumentation.screening_run("benchmark") as run:
+        for jd_text in corpus["jds"]:
+            jd_start = time.perf_counter()
+            result = api.screen_resumes(resume_files, api.parse_jd(jd_text=jd_text), save=False)
+            timings.append((time.perf_counter() - jd_start) * 1000)
+            stage_counts = result.get("stage_counts", stage_counts)
+    elapsed = time.perf_counter() - start
+    metrics = run.as_dict()
+
+    timings.sort()
+    return {
+        "jds": len(timings),
+        "resumes": len(resume_files),
+        "seconds": round(elapsed, 3),
+        "resumes_per_sec": round(len(resume_files) * len(timings) / elapsed, 2) if elapsed else None,
+        "p50_ms": round(percentile(timings, 50), 4),
+        "p95_ms": round(percentile(timings, 95), 4),
+        "peak_rss_mb": peak_rss_mb(),
+        "last_stage_counts": stage_counts,
+        "stage_seconds": metrics["stages"],
+        "counters": metrics["counters"],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--site", required=True)
+    parser.add_argument("--sites-path", default=".")
+    parser.add_argument("--corpus", help="Directory of a corpus made by benchmark.corpus, generated when missing")
+    parser.add_argument("--resumes", type=int, default=100, help="Corpus size, 100 to 50000")
+    parser.add_argument("--jds", type=int, default=5)
+    parser.add_argument("--pdf-ratio", type=float, default=0.7)
+    parser.add_argument("--pages", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sample", type=int, default=0, help="Resumes used by the per-stage runs, 0 for all")
+    parser.add_argument("--embedder", choices=["auto", "configured", "stub"], default="auto")
+    parser.add_argument("--skip-end-to-end", action="store_true")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+    corpus_dir = args.corpus or tempfile.mkdtemp(prefix="resume_lens_corpus_")
+    start = time.perf_counter()
+    if os.path.exists(os.path.join(corpus_dir, "corpus.json")):
+        corpus = load_corpus(corpus_dir)
+    else:
+        corpus = generate_corpus(corpus_dir, args.resumes, args.jds, args.pdf_ratio, args.pages, args.seed)
+    corpus_seconds = round(time.perf_counter() - start, 3)
+
+    frappe.init(site=args.site, sites_path=args.sites_path)
+    frappe.connect()
+    try:
+        from resume_lens.feature_cache import get_pipeline_version
+        from resume_lens.model_registry import get_model_stats
+
+        embedder = setup_embedder(args.embedder)
+        report = {
+            "benchmark": "pipeline",
+            "commit": get_commit(),
+            "embedder": embedder,
+            "pipeline_version": get_pipeline_version(),
+            "corpus": {"resumes": len(corpus["resumes"]), "jds": len(corpus["jds"]), "seed": args.seed,
+                       "generate_seconds": corpus_seconds},
+            "models": get_model_stats()["models"],
+            "stages": run_stages(corpus, args.sample),
+        }
+        if not args.skip_end_to_end:
+            report["end_to_end"] = {"cold": run_end_to_end(corpus), "warm": run_end_to_end(corpus)}
+        report["peak_rss_mb"] = {"self": peak_rss_mb(), "children": peak_rss_mb(resource.RUSAGE_CHILDREN)}
+    finally:
+        frappe.db.rollback()
+        frappe.destroy()
+        if not args.corpus:
+            shutil.rmtree(corpus_dir, ignore_errors=True)
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Micro-benchmark for the skill token filter used by extract_skills.
+
+Compares the previous per-call list of ~100k excluded strings against the precomputed
+frozenset stop-list. Tokens are synthetic (text, POS) pairs so no spaCy model is needed.
+
+    python -m resume_lens.benchmark.skill_filter --tokens 1500 --runs 20
+"""
+import argparse
+import random
+
+from resume_lens.benchmark import print_report, time_runs
+from resume_lens.skills import DEFAULT_STOPLIST, is_skill_token
+
+WORDS = [
+    "python", "django", "kubernetes", "docker", "aws", "react", "sql", "experience", "team", "developed",
+    "the", "and", "with", "2019", "5", "years", "framework", "api", "rest", "microservices", "led", "of",
+]
+POS_TAGS = ["PROPN", "NOUN", "VERB", "ADJ", "NUM", "DET", "ADP", "X", "CCONJ"]
+
+def make_tokens(count, seed=0):
+    rng = random.Random(seed)
+    return [(rng.choice(WORDS), rng.choice(POS_TAGS)) for _ in range(count)]
+
+# The filter as it was: the list is rebuilt on every call and membership is a linear scan
+def legacy_filter(tokens):
+    excluded_tokens = ['NOUN', 'ADJ', 'PRON', 'CONJ', 'SCONJ', 'ADP', 'AUX', 'VERB', 'DET', 'CCONJ']
+    excluded_symbols = list(DEFAULT_STOPLIST) + ['2', '3', '10']
+    excluded_symbols.extend(str(num) for num in range(1, 100001))
+    return list({text for text, pos in tokens if pos not in excluded_tokens and text not in excluded_symbols})
+
+def frozenset_filter(tokens):
+    return list({text for text, pos in tokens if is_skill_token(text, pos, DEFAULT_STOPLIST)})
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=1500, help="tokens per synthetic resume")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    tokens = make_tokens(args.tokens)
+    assert sorted(legacy_filter(tokens)) == sorted(frozenset_filter(tokens))
+
+    legacy = time_runs(lambda: legacy_filter(tokens), runs=args.runs)
+    current = time_runs(lambda: frozenset_filter(tokens), runs=args.runs)
+    print_report({
+        "benchmark": "skill_filter",
+        "tokens_per_resume": args.tokens,
+        "legacy_list": legacy,
+        "frozenset": current,
+        "speedup": round(legacy["mean_ms"] / current["mean_ms"], 1) if current["mean_ms"] else None,
+    })
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Skill extraction throughput in docs/sec: POS filtering vs taxonomy trie matching.
+
+Runs the trimmed spaCy tagger through nlp.pipe with the POS/stop-list filter (the "pos" matcher)
+against one trie scan per document over the shipped skill taxonomy (the "taxonomy" matcher).
+
+    python -m resume_lens.benchmark.skill_matching --docs 200 --batch-size 32
+"""
+import argparse
+import random
+
+import spacy
+
+from resume_lens.benchmark import print_report
+from resume_lens.benchmark.nlp_throughput import docs_per_second
+from resume_lens.benchmark.skill_filter import WORDS
+from resume_lens.model_registry import SPACY_EXCLUDED_COMPONENTS, SPACY_MODEL_NAME
+from resume_lens.skill_taxonomy import SkillMatcher, load_taxonomy
+from resume_lens.skills import DEFAULT_STOPLIST, clean_skills_text, get_skills_from_doc
+
+
+# Filler words with a skill phrase from the taxonomy mixed in every few words
+def make_texts(count, phrases, words_per_doc=600, skill_every=15, seed=0):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        words = [rng.choice(phrases) if i % skill_every == 0 else rng.choice(WORDS) for i in range(words_per_doc)]
+        texts.append(" ".join(words) + ".")
+    return texts
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    taxonomy = load_taxonomy()
+    phrases = [phrase for skill, aliases in taxonomy.items() for phrase in [skill, *aliases]]
+    texts = make_texts(args.docs, phrases)
+
+    nlp = spacy.load(SPACY_MODEL_NAME, exclude=SPACY_EXCLUDED_COMPONENTS)
+    matcher = SkillMatcher.from_taxonomy(taxonomy)
+    skill_counts = {}
+
+    def run_pos():
+        docs = nlp.pipe((clean_skills_text(text) for text in texts), batch_size=args.batch_size)
+        skill_counts["pos"] = sum(len(get_skills_from_doc(doc, DEFAULT_STOPLIST)) for doc in docs)
+
+    def run_taxonomy():
+        skill_counts["taxonomy"] = sum(len(matcher.match(text)) for text in texts)
+
+    print_report({
+        "benchmark": "skill_matching",
+        "docs": args.docs,
+        "taxonomy_phrases": len(matcher.skills),
+        "pos_tagger_pipe": docs_per_second(args.docs, run_pos),
+        "taxonomy_trie": docs_per_second(args.docs, run_taxonomy),
+        "skills_found": skill_counts,
+    })
+
+if __name__ == "__main__":
+    main()
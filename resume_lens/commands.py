@@ -0,0 +1,54 @@
+import click
+import frappe
+from frappe.commands import get_site, pass_context
+
+
+@click.command("resume-lens-warm-models")
+@click.option("--model", "models", multiple=True, help="Model to load (nlp, embedding). Defaults to all.")
+@pass_context
+def warm_models(context, models=None):
+    "Load the Resume Lens NLP and embedding models and print load time and memory usage"
+    from resume_lens.model_registry import get_model_stats, preload_models
+
+    site = get_site(context)
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        preload_models(list(models) or None)
+        click.echo(frappe.as_json(get_model_stats()))
+    finally:
+        frappe.destroy()
+
+@click.command("resume-lens-backfill-features")
+@click.option("--batch-size", type=int, help="Applicants per background job (default 50)")
+@click.option("--now", is_flag=True, help="Run the batches in this process instead of enqueueing them")
+@pass_context
+def backfill_features(context, batch_size=None, now=False):
+    "Precompute resume features for all existing Job Applicants in parallel background batches"
+    from resume_lens.precompute import backfill_features
+
+    site = get_site(context)
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        result = backfill_features(batch_size, enqueue=not now)
+        click.echo(f"{result['applicants']} applicants in {result['batches']} batches "
+                   + ("processed" if now else "queued on the long queue"))
+    finally:
+        frappe.destroy()
+
+@click.command("resume-lens-rebuild-index")
+@pass_context
+def rebuild_index(context):
+    "Rebuild the applicant vector index from the resume feature cache"
+    from resume_lens.applicant_index import rebuild_index
+
+    site = get_site(context)
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        click.echo(frappe.as_json(rebuild_index()))
+    finally:
+        frappe.destroy()
+
+commands = [warm_models, backfill_features, rebuild_index]
@@ -0,0 +1,22 @@
+import hashlib
+import os
+from functools import lru_cache
+
+import frappe
+
+
+# Read a resume_lens setting from site_config.json, falling back to the default outside a site context
+def get_config(key, default=None):
+    conf = getattr(frappe.local, "conf", None)
+    if not conf:
+        return default
+    return conf.get(key, default)
+
+@lru_cache(maxsize=32)
+def _get_file_digest(path, mtime_ns):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+# Digest of a config file's contents, re-read only when the file's mtime changes
+def get_file_digest(path):
+    return _get_file_digest(os.path.abspath(path), os.stat(path).st_mtime_ns)
@@ -0,0 +1,81 @@
+import zlib
+
+import numpy as np
+
+NUM_PERM = 64
+# 16 bands of 4 rows: pairs above ~0.5 Jaccard share a band bucket with high probability and are
+# then compared on the full signature against the threshold
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.9
+SHINGLE_WORDS = 5
+PRIME = (1 << 31) - 1
+
+# Fixed permutations, so signatures stored in the feature cache stay comparable across processes
+_rng = np.random.RandomState(20261018)
+PERM_A = _rng.randint(1, PRIME, size=NUM_PERM).astype(np.uint64)
+PERM_B = _rng.randint(0, PRIME, size=NUM_PERM).astype(np.uint64)
+
+# crc32 of every distinct run of SHINGLE_WORDS consecutive lowercased words
+def shingle_hashes(text, size=SHINGLE_WORDS):
+    words = text.lower().split()
+    shingles = {" ".join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+    return np.fromiter((zlib.crc32(shingle.encode()) for shingle in shingles), dtype=np.uint64)
+
+# MinHash signature of a text's word shingles: for each of NUM_PERM hash permutations, the smallest
+# permuted shingle hash. The share of equal positions in two signatures estimates their Jaccard similarity.
+def minhash_signature(text):
+    hashes = shingle_hashes(text) % PRIME
+    return ((PERM_A[:, None] * hashes[None, :] + PERM_B[:, None]) % PRIME).min(axis=1).astype(np.uint32)
+
+def similarity(signature_a, signature_b):
+    return float(np.mean(signature_a == signature_b))
+
+# LSH index over MinHash signatures. Each key added is compared only with keys that share at least
+# one band bucket, and is linked to the earliest added key it nearly duplicates.
+class NearDuplicateIndex:
+    def __init__(self, threshold=DEFAULT_THRESHOLD, bands=DEFAULT_BANDS):
+        self.threshold = threshold
+        self.bands = bands
+        self.buckets = [{} for _ in range(bands)]
+        self.signatures = {}
+        self.order = {}
+        self.representatives = {}
+
+    # Register key and return the representative it nearly duplicates, or None for a new document
+    def add(self, key, signature):
+        band_keys = [band.tobytes() for band in np.array_split(signature, self.bands)]
+        candidates = {candidate for buckets, band_key in zip(self.buckets, band_keys, strict=True)
+                      for candidate in buckets.get(band_key, ())}
+
+        representative = None
+        for candidate in sorted(candidates, key=self.order.get):
+            if similarity(signature, self.signatures[candidate]) >= self.threshold:
+                representative = self.representatives[candidate]
+                break
+
+        self.signatures[key] = signature
+        self.order[key] = len(self.order)
+        self.representatives[key] = representative or key
+        for buckets, band_key in zip(self.buckets, band_keys, strict=True):
+            buckets.setdefault(band_key, []).append(key)
+        return representative
+
+# Duplicate detection for one screening run, fed one file at a time across batches. A file whose
+# content hash was already seen is an exact duplicate of that file's representative; otherwise its
+# signature is checked against the near-duplicate index, when one is enabled.
+class Deduplicator:
+    def __init__(self, threshold=None):
+        self.near_duplicates = NearDuplicateIndex(threshold) if threshold else None
+        self.representatives = {}
+
+    # Returns (representative key, "exact" | "near") for a duplicate, (None, None) otherwise.
+    # get_signature is only called for content not seen before.
+    def check(self, key, content_hash, get_signature):
+        if content_hash in self.representatives:
+            return self.representatives[content_hash], "exact"
+
+        representative = None
+        if self.near_duplicates is not None:
+            representative = self.near_duplicates.add(key, get_signature())
+        self.representatives[content_hash] = representative or key
+        return (representative, "near") if representative else (None, None)
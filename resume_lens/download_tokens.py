@@ -0,0 +1,58 @@
+import secrets
+
+import frappe
+from frappe.utils import cint
+
+from resume_lens.config import get_config
+
+# Reusable tokens and single-use tokens live under separate prefixes so a lookup never has to read
+# the token before deciding whether to delete it
+TOKEN_PREFIX = "resume_lens_download_token:"
+SINGLE_USE_TOKEN_PREFIX = "resume_lens_download_token_once:"
+DEFAULT_TOKEN_TTL = 15 * 60
+
+def get_token_ttl():
+    return cint(get_config("resume_lens_download_token_ttl", DEFAULT_TOKEN_TTL))
+
+def _key(prefix, token):
+    return frappe.cache().make_key(prefix + token)
+
+# Store filepath under a new random token in redis, shared by every web and background worker.
+# The token expires after ttl seconds; a single-use token is also deleted by its first lookup.
+def mint_token(filepath, single_use=False, ttl=None):
+    token = secrets.token_urlsafe(16)
+    prefix = SINGLE_USE_TOKEN_PREFIX if single_use else TOKEN_PREFIX
+    frappe.cache().set(_key(prefix, token), filepath, ex=ttl or get_token_ttl())
+    return token
+
+# Return the filepath for a token, or None when it is unknown or expired. Reading and consuming a
+# single-use token happen in one MULTI/EXEC transaction, so concurrent requests cannot both use it.
+def resolve_token(token):
+    if not token:
+        return None
+
+    pipeline = frappe.cache().pipeline(transaction=True)
+    pipeline.get(_key(TOKEN_PREFIX, token))
+    pipeline.get(_key(SINGLE_USE_TOKEN_PREFIX, token))
+    pipeline.delete(_key(SINGLE_USE_TOKEN_PREFIX, token))
+    filepath, single_use_filepath, _ = pipeline.execute()
+
+    filepath = filepath or single_use_filepath
+    return frappe.safe_decode(filepath) if filepath else None
+
+def revoke_token(token):
+    frappe.cache().delete(_key(TOKEN_PREFIX, token), _key(SINGLE_USE_TOKEN_PREFIX, token))
+
+# Number of live (unexpired) tokens for this site
+def count_live_tokens():
+    cache = frappe.cache()
+    return {
+        "reusable": sum(1 for _ in cache.scan_iter(match=_key(TOKEN_PREFIX, "*"))),
+        "single_use": sum(1 for _ in cache.scan_iter(match=_key(SINGLE_USE_TOKEN_PREFIX, "*"))),
+    }
+
+@frappe.whitelist()
+def get_token_stats():
+    frappe.only_for("System Manager")
+    live = count_live_tokens()
+    return {"live_tokens": live["reusable"] + live["single_use"], "ttl": get_token_ttl(), **live}
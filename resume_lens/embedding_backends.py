@@ -0,0 +1,88 @@
+import zlib
+
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+from resume_lens.config import get_config
+
+DEFAULT_EMBEDDING_BACKEND = "torch"
+STUB_BACKEND = "stub"
+# Output size of paraphrase-MiniLM-L6-v2, so stub vectors fit the same indexes and cache rows
+STUB_EMBEDDING_DIM = 384
+
+# Wraps a SentenceTransformer so every encode call runs under a fixed thread budget. Several workers
+# on one host each get `threads` BLAS/OpenMP threads instead of one per core each. Exposes the two
+# SentenceTransformer methods the rest of the app uses, so backends are interchangeable.
+class EmbeddingBackend:
+    def __init__(self, name, model, threads=None):
+        self.name = name
+        self.model = model
+        self.threads = threads or None
+        if self.threads and name != STUB_BACKEND:
+            import torch
+            torch.set_num_threads(self.threads)
+
+    def get_sentence_embedding_dimension(self):
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts, **kwargs):
+        with threadpool_limits(limits=self.threads):
+            return self.model.encode(texts, **kwargs)
+
+    # Word pieces the model reads for texts, after truncation to its maximum sequence length
+    def count_tokens(self, texts):
+        tokenizer = getattr(self.model, "tokenizer", None)
+        if tokenizer is None:
+            return sum(len(text.split()) for text in texts)
+        encoded = tokenizer(list(texts), truncation=True, max_length=self.model.max_seq_length)
+        return sum(len(ids) for ids in encoded["input_ids"])
+
+def _load_torch(model_name):
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name, device="cpu")
+
+# Linear layers quantized to int8 weights with dynamically quantized activations. Roughly halves CPU
+# encode time at a small cost in accuracy; compare rankings with benchmark.embedding_backends.
+def _load_torch_int8(model_name):
+    import torch
+    model = _load_torch(model_name)
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+# Hashed bag-of-words vectors: deterministic, needs no weights, torch or network. Lets benchmarks and
+# CI run the whole pipeline offline; the scores it produces say nothing about resume quality.
+class StubEncoder:
+    def __init__(self, dim=STUB_EMBEDDING_DIM):
+        self.dim = dim
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+    def encode(self, texts, **kwargs):
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in text.lower().split():
+                matrix[row, zlib.crc32(token.encode()) % self.dim] += 1
+        return matrix
+
+def _load_stub(model_name):
+    return StubEncoder()
+
+BACKEND_LOADERS = {
+    "torch": _load_torch,
+    "torch_int8": _load_torch_int8,
+    STUB_BACKEND: _load_stub,
+}
+
+# Backend configured for the site (resume_lens_embedding_backend)
+def get_backend_name():
+    return get_config("resume_lens_embedding_backend", DEFAULT_EMBEDDING_BACKEND)
+
+# Threads per encode call (resume_lens_embedding_threads), 0 leaves the library default
+def get_backend_threads():
+    return int(get_config("resume_lens_embedding_threads", 0))
+
+def load_backend(model_name, name=None, threads=None):
+    name = name or get_backend_name()
+    if name not in BACKEND_LOADERS:
+        raise ValueError(f"Unknown embedding backend {name!r}, expected one of {', '.join(BACKEND_LOADERS)}")
+    return EmbeddingBackend(name, BACKEND_LOADERS[name](model_name), threads or get_backend_threads())
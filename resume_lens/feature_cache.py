@@ -0,0 +1,204 @@
+import base64
+import hashlib
+import json
+import os
+
+import frappe
+import numpy as np
+
+from resume_lens.config import get_config
+from resume_lens.embedding_backends import DEFAULT_EMBEDDING_BACKEND, get_backend_name
+from resume_lens.model_registry import EMBEDDING_MODEL_NAME
+from resume_lens.scoring import get_chunk_settings, is_chunked
+from resume_lens.skills import get_skill_settings
+from resume_lens.text_extraction import DEFAULT_MAX_CHARS, DEFAULT_MAX_PAGES
+
+CACHE_DOCTYPE = "Resume Feature Cache"
+
+# Bump whenever parsing, skill extraction or embedding output changes so stale rows are ignored
+PIPELINE_VERSION = "4"
+
+# Memoized content hashes live under FILE_HASH_CACHE_KEY:<path>:<size>:<mtime>, each expiring on its
+# own so entries of deleted or rewritten files do not pile up
+FILE_HASH_CACHE_KEY = "resume_lens_file_hash"
+FILE_HASH_TTL = 7 * 24 * 3600
+
+# Page and character budget for resume text (resume_lens_pdf_max_pages, resume_lens_max_text_chars)
+def get_extraction_limits():
+    return {
+        "max_pages": frappe.utils.cint(get_config("resume_lens_pdf_max_pages", DEFAULT_MAX_PAGES)),
+        "max_chars": frappe.utils.cint(get_config("resume_lens_max_text_chars", DEFAULT_MAX_CHARS))
+    }
+
+# Digest of the settings that change the cached text and skills: extraction limits, skill matcher,
+# taxonomy file and stop-list
+def get_parsing_digest():
+    settings = {"extraction": get_extraction_limits(), "skills": get_skill_settings()}
+    return hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:8]
+
+# Version string stored with every cached row. Chunked and quantized embeddings are cached under
+# their own version so switching the embedding mode, window settings or backend never mixes vectors,
+# and changing how text or skills are extracted starts a new version as well.
+def get_pipeline_version():
+    version = f"{EMBEDDING_MODEL_NAME}:{PIPELINE_VERSION}:{get_parsing_digest()}"
+    if get_backend_name() != DEFAULT_EMBEDDING_BACKEND:
+        version += f":{get_backend_name()}"
+    if is_chunked():
+        version += ":chunked-{chunk_words}-{overlap}-{max_chunks}".format(**get_chunk_settings())
+    return version
+
+# Document name for a content hash under the current pipeline version. Code handling a batch of
+# hashes passes the version it read once, as get_pipeline_version re-reads every setting.
+def get_cache_key(content_hash, pipeline_version=None):
+    version_digest = hashlib.sha1((pipeline_version or get_pipeline_version()).encode()).hexdigest()[:10]
+    return f"{content_hash}-{version_digest}"
+
+# Hash file contents in fixed size chunks so large resumes are never fully loaded
+def hash_file(file_path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Content hash of a file, memoized in redis by path, size and mtime to skip re-reading unchanged files
+def get_content_hash(file_path):
+    stat = os.stat(file_path)
+    key = f"{FILE_HASH_CACHE_KEY}:{os.path.abspath(file_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    content_hash = frappe.cache().get_value(key)
+    if not content_hash:
+        content_hash = hash_file(file_path)
+        frappe.cache().set_value(key, content_hash, expires_in_sec=FILE_HASH_TTL)
+    return content_hash
+
+def encode_vector(vector):
+    return base64.b64encode(np.asarray(vector, dtype=np.float32).tobytes()).decode()
+
+def decode_vector(value):
+    return np.frombuffer(base64.b64decode(value), dtype=np.float32)
+
+# Chunked embeddings are (windows, dim) matrices stored as float16 to halve their size
+def encode_matrix(matrix):
+    return base64.b64encode(np.asarray(matrix, dtype=np.float16).tobytes()).decode()
+
+def decode_matrix(value, dim):
+    return np.frombuffer(base64.b64decode(value), dtype=np.float16).reshape(-1, dim)
+
+def decode_embedding(value, dim):
+    return decode_matrix(value, dim) if is_chunked() else decode_vector(value)
+
+def encode_signature(signature):
+    return base64.b64encode(np.asarray(signature, dtype=np.uint32).tobytes()).decode()
+
+def decode_signature(value):
+    return np.frombuffer(base64.b64decode(value), dtype=np.uint32)
+
+# Fetch cached features for many content hashes with one query, returns {content_hash: parsed}
+def get_cached_features(content_hashes, pipeline_version=None):
+    content_hashes = list(content_hashes)
+    if not content_hashes:
+        return {}
+
+    pipeline_version = pipeline_version or get_pipeline_version()
+    rows = frappe.get_all(
+        CACHE_DOCTYPE,
+        filters={"name": ["in", [get_cache_key(h, pipeline_version) for h in content_hashes]]},
+        fields=["content_hash", "raw_text", "total_experience", "resume_skills", "embedding", "embedding_dim", "minhash"]
+    )
+
+    cached = {}
+    for row in rows:
+        cached[row.content_hash] = {
+            'raw_text': row.raw_text or "",
+            'total_experience': row.total_experience or 0,
+            'resume_skills': frappe.parse_json(row.resume_skills) if row.resume_skills else None,
+            'embedding': decode_embedding(row.embedding, row.embedding_dim) if row.embedding else None,
+            'minhash': decode_signature(row.minhash) if row.minhash else None
+        }
+    return cached
+
+def _get_feature_values(resume_skills=None, embedding=None, minhash=None):
+    values = {}
+    if minhash is not None:
+        values["minhash"] = encode_signature(minhash)
+    if resume_skills is not None:
+        values["resume_skills"] = frappe.as_json(resume_skills)
+    if embedding is not None:
+        embedding = np.asarray(embedding)
+        values["embedding"] = encode_matrix(embedding) if embedding.ndim == 2 else encode_vector(embedding)
+        values["embedding_dim"] = embedding.shape[-1]
+    return values
+
+# Persist parsed features for a content hash. Skills, embedding and signature may be None and filled in later
+# with update_features once a resume survives the cheaper screening stages.
+def store_features(content_hash, parsed, pipeline_version=None):
+    pipeline_version = pipeline_version or get_pipeline_version()
+    cache_key = get_cache_key(content_hash, pipeline_version)
+    doc = frappe.get_doc({
+        "doctype": CACHE_DOCTYPE,
+        "name": cache_key,
+        "cache_key": cache_key,
+        "content_hash": content_hash,
+        "pipeline_version": pipeline_version,
+        "raw_text": parsed.get('raw_text', ""),
+        "total_experience": parsed.get('total_experience', 0),
+        **_get_feature_values(parsed.get('resume_skills'), parsed.get('embedding'), parsed.get('minhash'))
+    })
+    try:
+        doc.db_insert()
+    except frappe.DuplicateEntryError:
+        # Another worker cached the same file first
+        pass
+
+# Add skills, the embedding and/or the MinHash signature to an existing cache row
+def update_features(content_hash, resume_skills=None, embedding=None, minhash=None, pipeline_version=None):
+    values = _get_feature_values(resume_skills, embedding, minhash)
+    if values:
+        frappe.db.set_value(CACHE_DOCTYPE, get_cache_key(content_hash, pipeline_version), values, update_modified=False)
+
+# Forget cached skills (e.g. after the skill taxonomy changed) so they are re-extracted from the cached text
+def clear_cached_skills():
+    frappe.qb.update(CACHE_DOCTYPE).set("resume_skills", None).run()
+
+# Delete cached rows, either for one file hash, only rows from older pipeline versions, or everything
+def clear_feature_cache(content_hash=None, stale_only=False):
+    filters = {}
+    if content_hash:
+        filters["content_hash"] = content_hash
+    if stale_only:
+        filters["pipeline_version"] = ["!=", get_pipeline_version()]
+
+    frappe.db.delete(CACHE_DOCTYPE, filters)
+    if not content_hash and not stale_only:
+        frappe.cache().delete_keys(FILE_HASH_CACHE_KEY)
+
+@frappe.whitelist()
+def clear_resume_feature_cache(content_hash=None, stale_only=False):
+    frappe.only_for("System Manager")
+    clear_feature_cache(content_hash, frappe.utils.cint(stale_only))
+    return {"status": "success", "message": "Resume feature cache cleared."}
+
+# Drop stale rows and recompute features for every open applicant in the background
+@frappe.whitelist()
+def rebuild_resume_feature_cache(force=False):
+    frappe.only_for("System Manager")
+
+    frappe.enqueue(
+        "resume_lens.feature_cache.rebuild_feature_cache",
+        queue="long",
+        timeout=3600,
+        force=frappe.utils.cint(force),
+        job_id="resume_lens_rebuild_feature_cache",
+        deduplicate=True
+    )
+    return {"status": "success", "message": "Resume feature cache rebuild queued."}
+
+def rebuild_feature_cache(force=False):
+    from resume_lens.api import allowed_file, get_resume_features, get_screening_batch_size
+    from resume_lens.applicant_discovery import iter_applicant_files, iter_batches
+
+    clear_feature_cache(stale_only=not force)
+
+    for resume_files in iter_batches(iter_applicant_files(), get_screening_batch_size()):
+        get_resume_features([f['file_path'] for f in resume_files if allowed_file(f['filename'])])
+        frappe.db.commit()
@@ -0,0 +1,63 @@
+import os
+from urllib.parse import quote
+
+import frappe
+from frappe.utils import cint
+from werkzeug.utils import send_file
+from werkzeug.wrappers import Response
+
+from resume_lens.config import get_config
+
+CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".doc": "application/msword"
+}
+# Seconds a browser may reuse a resume before revalidating it with If-None-Match / If-Modified-Since
+DEFAULT_MAX_AGE = 300
+
+def get_content_type(filepath):
+    return CONTENT_TYPES.get(os.path.splitext(filepath)[1].lower(), "text/plain")
+
+# Internal nginx path for a file under the site directory. Frappe's nginx config sends
+# X-Use-X-Accel-Redirect and maps /protected/ to the site directory, so nginx can serve the
+# file (including Range and conditional requests) without the bytes passing through Python.
+def get_x_accel_path(filepath):
+    if not frappe.local.request.headers.get("X-Use-X-Accel-Redirect"):
+        return None
+    if not cint(get_config("resume_lens_use_x_accel_redirect", 1)):
+        return None
+
+    site_path = os.path.abspath(frappe.get_site_path())
+    abs_path = os.path.abspath(filepath)
+    if not abs_path.startswith(site_path + os.sep):
+        return None
+    return "/protected/" + os.path.relpath(abs_path, site_path)
+
+# Serve a resume from disk as a streamed response. Python serves it in chunks with Range,
+# ETag and Last-Modified support unless nginx can take over through X-Accel-Redirect.
+def send_resume_file(filepath, as_attachment=False):
+    filename = os.path.basename(filepath)
+    content_type = get_content_type(filepath)
+
+    accel_path = get_x_accel_path(filepath)
+    if accel_path:
+        response = Response(mimetype=content_type)
+        response.headers["X-Accel-Redirect"] = quote(frappe.utils.encode(accel_path))
+        response.headers.set("Content-Disposition", "attachment" if as_attachment else "inline", filename=filename)
+        return response
+
+    response = send_file(
+        filepath,
+        frappe.local.request.environ,
+        mimetype=content_type,
+        as_attachment=as_attachment,
+        download_name=filename,
+        conditional=True,
+        etag=True,
+        max_age=cint(get_config("resume_lens_file_max_age", DEFAULT_MAX_AGE))
+    )
+    # Resumes are personal data, never let shared proxies cache them
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
@@ -146,6 +146,28 @@ app_license = "mit"
 # 	}
 # }
 
+doc_events = {
+	"Job Applicant": {
+		"after_insert": "resume_lens.precompute.on_job_applicant_insert",
+		"on_update": "resume_lens.precompute.on_job_applicant_update",
+		"on_trash": "resume_lens.precompute.on_job_applicant_trash"
+	},
+	"Job Opening": {
+		"after_insert": [
+			"resume_lens.job_catalogue.on_job_opening_save",
+			"resume_lens.opening_matching.on_job_opening_change"
+		],
+		"on_update": [
+			"resume_lens.job_catalogue.on_job_opening_save",
+			"resume_lens.opening_matching.on_job_opening_update"
+		],
+		"on_trash": [
+			"resume_lens.job_catalogue.on_job_opening_trash",
+			"resume_lens.opening_matching.on_job_opening_change"
+		]
+	}
+}
+
 # Scheduled Tasks
 # ---------------
 
@@ -235,6 +257,10 @@ app_license = "mit"
 # default_log_clearing_doctypes = {
 # 	"Logging DocType Name": 30  # days to retain logs
 # }
+default_log_clearing_doctypes = {
+	"Screening Run Log": 30
+}
+
 # Overriding Methods
 # ------------------------------
 #
@@ -0,0 +1,207 @@
+import cProfile
+import functools
+import io
+import os
+import pstats
+import time
+from contextlib import contextmanager
+
+import frappe
+import psutil
+from frappe.utils import cint
+
+from resume_lens.config import get_config
+
+RUN_LOG_DOCTYPE = "Screening Run Log"
+PROFILERS = ("cprofile", "pyinstrument")
+# Lines of cProfile output kept on the run log
+PROFILE_TOP_N = 60
+# Only the slowest files are kept with their timings, so logs of large runs stay small
+SLOWEST_FILES = 20
+
+def get_logger():
+    return frappe.logger("resume_lens")
+
+def get_rss_mb():
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+# Timers and counters of one screening run. A stage entered several times (once per chunk, per JD)
+# adds up its time; counters add up the same way. Files keep their extraction latency and error.
+class RunMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.rss_before = get_rss_mb()
+        self.stages = {}
+        self.counters = {}
+        self.files = []
+        self.total_seconds = None
+        self.rss_after = None
+        self.profile = None
+        self.log_name = None
+        self.status = "Success"
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0) + time.perf_counter() - start
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def record_file(self, file_path, elapsed, error=None):
+        self.files.append({"file": os.path.basename(file_path), "elapsed": elapsed, "error": error})
+        if error:
+            self.count("files_failed")
+
+    # Endpoints report some failures as a returned {"Error": ...} or {"status": "error"} dict instead
+    # of raising; such a result marks the run as failed
+    def set_result(self, result):
+        if isinstance(result, dict) and (result.get("Error") or result.get("status") == "error"):
+            self.status = "Failed"
+        return result
+
+    def finish(self):
+        self.total_seconds = time.perf_counter() - self.started
+        self.rss_after = get_rss_mb()
+
+    def as_dict(self):
+        return {
+            "total_seconds": round(self.total_seconds or time.perf_counter() - self.started, 4),
+            "stages": {name: round(seconds, 4) for name, seconds in self.stages.items()},
+            "counters": dict(self.counters),
+            "rss_mb": round(self.rss_after or get_rss_mb(), 1),
+            "rss_delta_mb": round((self.rss_after or get_rss_mb()) - self.rss_before, 1),
+            "slowest_files": sorted(self.files, key=lambda f: -f["elapsed"])[:SLOWEST_FILES],
+            "failed_files": [f for f in self.files if f["error"]],
+        }
+
+# Metrics of the screening run in progress in this request or job, None outside one
+def get_current_run():
+    return getattr(frappe.local, "resume_lens_run", None)
+
+# Time a block as a stage of the current run; does nothing outside a run
+@contextmanager
+def stage(name):
+    run = get_current_run()
+    if run is None:
+        yield
+        return
+    with run.stage(name):
+        yield
+
+# Decorator form of stage()
+def timed(name):
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def count(name, value=1):
+    run = get_current_run()
+    if run is not None:
+        run.count(name, value)
+
+# Record one file's extraction; failures are also logged, with or without a run
+def record_file(file_path, elapsed, error=None):
+    if error:
+        get_logger().warning(f"Error processing resume {file_path}: {error['message']}")
+    run = get_current_run()
+    if run is not None:
+        run.record_file(file_path, elapsed, error)
+
+# Profiler named by the request's `profile` parameter (cprofile or pyinstrument, 1 means cprofile).
+# Profiling slows the run down and exposes code paths, so only System Managers may ask for it.
+def get_requested_profiler():
+    profiler = frappe.local.form_dict.get("profile")
+    if not profiler or profiler == "0":
+        return None
+    if profiler == "1":
+        profiler = "cprofile"
+    if profiler not in PROFILERS:
+        frappe.throw(f"Unknown profiler {profiler!r}, expected one of {', '.join(PROFILERS)}")
+    frappe.only_for("System Manager")
+    return profiler
+
+def start_profiler(profiler):
+    if profiler == "cprofile":
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+    if profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            frappe.throw("pyinstrument is not installed, use profile=cprofile")
+        profile = Profiler()
+        profile.start()
+        return profile
+    return None
+
+# Stop a profiler and return its report as text
+def stop_profiler(profile):
+    if isinstance(profile, cProfile.Profile):
+        profile.disable()
+        output = io.StringIO()
+        pstats.Stats(profile, stream=output).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+        return output.getvalue()
+    profile.stop()
+    return profile.output_text(unicode=True, color=False)
+
+def is_run_log_enabled():
+    return cint(get_config("resume_lens_run_log", 1))
+
+def save_run_log(run, source, status, job_title=None, screening_job=None, profiler=None):
+    counters = run.counters
+    log = frappe.get_doc({
+        "doctype": RUN_LOG_DOCTYPE,
+        "source": source,
+        "status": status,
+        "job_title": job_title,
+        "screening_job": screening_job,
+        "total_seconds": run.total_seconds,
+        "applicants": counters.get("applicants", 0),
+        "files_skipped": counters.get("files_skipped", 0),
+        "files_failed": counters.get("files_failed", 0),
+        "cache_hits": counters.get("cache_hits", 0),
+        "tokens_encoded": counters.get("tokens_encoded", 0),
+        "documents_deduplicated": counters.get("exact_duplicates", 0) + counters.get("near_duplicates", 0),
+        "rss_delta_mb": run.rss_after - run.rss_before,
+        "metrics": frappe.as_json(run.as_dict()),
+        "profiler": profiler,
+        "profile": run.profile,
+    })
+    log.insert(ignore_permissions=True)
+    return log.name
+
+# Collect metrics for the screening run inside the block and persist them as a Screening Run Log
+# (unless resume_lens_run_log is 0). A run that raised is logged after rolling back its partial writes;
+# one that returned an error result (RunMetrics.set_result) is logged as failed as well.
+@contextmanager
+def screening_run(source, job_title=None, screening_job=None, profiler=None):
+    run = RunMetrics()
+    frappe.local.resume_lens_run = run
+    profile = start_profiler(profiler)
+    raised = False
+    try:
+        yield run
+    except Exception:
+        run.status = "Failed"
+        raised = True
+        raise
+    finally:
+        frappe.local.resume_lens_run = None
+        if profile is not None:
+            run.profile = stop_profiler(profile)
+        run.finish()
+        if is_run_log_enabled():
+            if raised:
+                frappe.db.rollback()
+            run.log_name = save_run_log(run, source, run.status, job_title, screening_job, profiler)
+            if raised:
+                frappe.db.commit()
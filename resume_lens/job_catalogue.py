@@ -0,0 +1,169 @@
+import pickle
+
+import frappe
+from frappe.utils import cint
+
+from resume_lens.feature_cache import get_pipeline_version
+
+# Redis hash of open Job Openings, {name: entry}, plus the pipeline version it was built with
+CATALOGUE_CACHE_KEY = "resume_lens_job_catalogue"
+CATALOGUE_VERSION_KEY = "resume_lens_job_catalogue_version"
+# A build fills this hash and renames it over the catalogue
+CATALOGUE_BUILD_KEY = "resume_lens_job_catalogue_build"
+CATALOGUE_LOCK = "resume_lens_job_catalogue_lock"
+CATALOGUE_BUILD_TIMEOUT = 600
+CATALOGUE_FIELDS = ("name", "job_title", "description", "experience_range", "jd_required_skills")
+DEFAULT_RECORD_FIELDS = ("name", "job_title", "description")
+
+# Catalogue entry for a Job Opening: description cleaned of HTML once, with its parsed experience
+# range and required skills
+def make_entry(opening):
+    from resume_lens.api import get_experience_range, parse_jd, strip_html
+
+    description = strip_html(opening.description or "")
+    jd_parsed = parse_jd(jd_text=description or opening.job_title)
+    return {
+        "name": opening.name,
+        "job_title": opening.job_title,
+        "description": description,
+        "experience_range": get_experience_range(jd_parsed),
+        "jd_required_skills": jd_parsed["jd_required_skills"],
+        "modified": opening.modified,
+    }
+
+def get_open_openings(names=None):
+    filters = {"status": "Open"}
+    if names is not None:
+        filters["name"] = ["in", names]
+    return frappe.get_all(
+        "Job Opening", filters=filters, fields=["name", "job_title", "description", "modified"]
+    )
+
+# Pipeline version of the catalogue in redis, or None when there is none. Read past the request-local
+# cache of frappe.cache().get_value, since another process may build the catalogue during a request.
+def get_catalogue_version():
+    cache = frappe.cache()
+    version = cache.get(cache.make_key(CATALOGUE_VERSION_KEY))
+    return pickle.loads(version) if version is not None else None
+
+def is_catalogue_built():
+    return get_catalogue_version() == get_pipeline_version()
+
+# Held while the catalogue is written, so builds and refreshes of single openings do not interleave
+def catalogue_lock():
+    cache = frappe.cache()
+    return cache.lock(cache.make_key(CATALOGUE_LOCK), timeout=CATALOGUE_BUILD_TIMEOUT)
+
+# Clean and parse every open Job Opening into a separate hash, then rename it over the catalogue and
+# set its version in one transaction. Readers see the old catalogue or the new one, never a partial one.
+def write_catalogue():
+    cache = frappe.cache()
+    entries = {opening.name: make_entry(opening) for opening in get_open_openings()}
+    build_key = cache.make_key(CATALOGUE_BUILD_KEY)
+
+    pipeline = cache.pipeline()
+    pipeline.delete(build_key)
+    if entries:
+        pipeline.hset(build_key, mapping={name: pickle.dumps(entry) for name, entry in entries.items()})
+        pipeline.rename(build_key, cache.make_key(CATALOGUE_CACHE_KEY))
+    else:
+        pipeline.delete(cache.make_key(CATALOGUE_CACHE_KEY))
+    pipeline.set(cache.make_key(CATALOGUE_VERSION_KEY), pickle.dumps(get_pipeline_version()))
+    pipeline.execute()
+
+def build_catalogue():
+    with catalogue_lock():
+        write_catalogue()
+
+def enqueue_build_catalogue():
+    frappe.enqueue(
+        "resume_lens.job_catalogue.build_catalogue",
+        queue="long",
+        job_id="resume_lens_build_job_catalogue",
+        deduplicate=True
+    )
+
+# Make sure the catalogue can be read. A catalogue of another pipeline version is served as is while a
+# background job rebuilds it. Only when there is no catalogue at all is it built in the request, under
+# the lock so concurrent requests wait for one build instead of each parsing every opening.
+def ensure_catalogue():
+    version = get_catalogue_version()
+    if version == get_pipeline_version():
+        return
+    if version is not None:
+        enqueue_build_catalogue()
+        return
+    with catalogue_lock():
+        if get_catalogue_version() is None:
+            write_catalogue()
+
+def clear_catalogue():
+    frappe.cache().delete_value([CATALOGUE_CACHE_KEY, CATALOGUE_VERSION_KEY])
+
+# All catalogue entries, most recently modified first. Built on first use.
+def get_catalogue():
+    ensure_catalogue()
+    entries = frappe.cache().hgetall(CATALOGUE_CACHE_KEY).values()
+    return sorted(entries, key=lambda entry: (entry["modified"], entry["name"]), reverse=True)
+
+def get_catalogue_entry(job_opening):
+    ensure_catalogue()
+    return frappe.cache().hget(CATALOGUE_CACHE_KEY, job_opening)
+
+# Re-read the given openings into the catalogue: open ones are (re)parsed, others dropped.
+# Skipped while the catalogue is not built, the next read builds it in full. The embedded openings
+# of reverse matching are derived from the catalogue, so they are dropped as well.
+def refresh_openings(job_openings):
+    from resume_lens.opening_matching import clear_opening_features
+
+    cache = frappe.cache()
+    with catalogue_lock():
+        if not is_catalogue_built():
+            return
+        open_openings = {opening.name: opening for opening in get_open_openings(job_openings)}
+        for name in job_openings:
+            if name in open_openings:
+                cache.hset(CATALOGUE_CACHE_KEY, name, make_entry(open_openings[name]))
+            else:
+                cache.hdel(CATALOGUE_CACHE_KEY, name)
+    clear_opening_features()
+
+# doc_events: Job Opening after_insert / on_update. Only text, title or status changes touch the
+# catalogue; the opening is re-parsed in the background once the save is committed. An insert runs
+# on_update as well, which is left to after_insert so a new opening is queued once.
+def on_job_opening_save(doc, method=None):
+    if method == "on_update" and doc.flags.in_insert:
+        return
+    if method == "on_update" and not any(
+        doc.has_value_changed(field) for field in ("description", "status", "job_title")
+    ):
+        return
+    frappe.enqueue(
+        "resume_lens.job_catalogue.refresh_openings",
+        queue="short",
+        enqueue_after_commit=True,
+        job_openings=[doc.name]
+    )
+
+# doc_events: Job Opening on_trash
+def on_job_opening_trash(doc, method=None):
+    frappe.cache().hdel(CATALOGUE_CACHE_KEY, doc.name)
+
+def parse_fields(fields):
+    if not fields:
+        return list(DEFAULT_RECORD_FIELDS)
+    if isinstance(fields, str):
+        fields = frappe.parse_json(fields) if fields.startswith("[") else fields.split(",")
+    fields = [field.strip() for field in fields if field.strip()]
+    unknown = set(fields) - set(CATALOGUE_FIELDS)
+    if unknown:
+        frappe.throw(f"Unknown fields {', '.join(sorted(unknown))}, expected any of {', '.join(CATALOGUE_FIELDS)}")
+    return fields
+
+# A page of catalogue entries with only the requested fields
+def get_catalogue_records(fields=None, start=0, page_length=0):
+    fields = parse_fields(fields)
+    start = cint(start)
+    entries = get_catalogue()
+    entries = entries[start:start + cint(page_length)] if cint(page_length) else entries[start:]
+    return [{field: entry[field] for field in fields} for entry in entries]
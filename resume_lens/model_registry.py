@@ -0,0 +1,87 @@
+import threading
+import time
+
+import frappe
+import psutil
+
+SPACY_MODEL_NAME = "en_core_web_sm"
+# Only token.pos_ is read, which needs tok2vec, tagger and attribute_ruler
+SPACY_EXCLUDED_COMPONENTS = ["parser", "ner", "lemmatizer"]
+EMBEDDING_MODEL_NAME = "paraphrase-MiniLM-L6-v2"
+
+# Loaded models and their load statistics, shared by every request handled in this process
+_models = {}
+_model_stats = {}
+_lock = threading.Lock()
+
+def get_rss_mb():
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+def _load_nlp():
+    import spacy
+    return spacy.load(SPACY_MODEL_NAME, exclude=SPACY_EXCLUDED_COMPONENTS)
+
+# The sentence-transformer behind the configured embedding backend (torch or torch_int8)
+def _load_embedding_model():
+    from resume_lens.embedding_backends import load_backend
+    return load_backend(EMBEDDING_MODEL_NAME)
+
+MODEL_LOADERS = {
+    "nlp": _load_nlp,
+    "embedding": _load_embedding_model,
+}
+
+# Return a model by name, loading it on first use. The lock makes concurrent first calls load once.
+def get_model(name):
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    with _lock:
+        if name not in _models:
+            rss_before = get_rss_mb()
+            start = time.perf_counter()
+            _models[name] = MODEL_LOADERS[name]()
+            _model_stats[name] = {
+                "load_time": round(time.perf_counter() - start, 3),
+                "rss_delta_mb": round(get_rss_mb() - rss_before, 1),
+                "loaded_at": frappe.utils.now() if getattr(frappe.local, "conf", None) else None,
+            }
+    return _models[name]
+
+def get_nlp():
+    return get_model("nlp")
+
+def get_embedding_model():
+    return get_model("embedding")
+
+def is_loaded(name):
+    return name in _models
+
+# Load models ahead of time, e.g. in the gunicorn master before workers fork so pages are shared copy-on-write
+def preload_models(names=None):
+    for name in names or MODEL_LOADERS:
+        get_model(name)
+
+def get_model_stats():
+    return {
+        "pid": psutil.Process().pid,
+        "rss_mb": round(get_rss_mb(), 1),
+        "models": {
+            name: dict(_model_stats.get(name, {}), loaded=is_loaded(name))
+            for name in MODEL_LOADERS
+        },
+        "embedding_backend": {"name": _models["embedding"].name, "threads": _models["embedding"].threads}
+        if is_loaded("embedding") else None,
+    }
+
+@frappe.whitelist()
+def warm_models(names=None):
+    frappe.only_for("System Manager")
+    preload_models(frappe.parse_json(names) if names else None)
+    return get_model_stats()
+
+@frappe.whitelist()
+def model_stats():
+    frappe.only_for("System Manager")
+    return get_model_stats()
@@ -0,0 +1,116 @@
+import os
+
+import frappe
+from frappe.utils import cint
+
+from resume_lens import scoring
+from resume_lens.feature_cache import get_pipeline_version
+from resume_lens.model_registry import get_embedding_model
+from resume_lens.vector_index import top_k_indices
+
+OPENING_FEATURES_CACHE_KEY = "resume_lens_opening_features"
+DEFAULT_TOP_OPENINGS = 5
+
+# Embedded open Job Openings from the Job Opening catalogue, kept in redis until an opening changes.
+# Returns {"openings": [{name, job_title, jd_required_skills, experience_range}], "jd_embeddings": [...]}
+# where jd_embeddings[i] is the JD of openings[i] embedded by encode_documents: a normalized vector,
+# or a window matrix in chunked mode.
+def get_opening_features():
+    cached = frappe.cache().get_value(OPENING_FEATURES_CACHE_KEY)
+    if cached and cached["version"] == get_pipeline_version() and "jd_embeddings" in cached:
+        return cached
+
+    from resume_lens.job_catalogue import get_catalogue
+
+    openings = []
+    jd_texts = []
+    for entry in get_catalogue():
+        openings.append({
+            "name": entry["name"],
+            "job_title": entry["job_title"],
+            "jd_required_skills": entry["jd_required_skills"],
+            "experience_range": entry["experience_range"]
+        })
+        jd_texts.append(entry["description"] or entry["job_title"])
+
+    cached = {
+        "version": get_pipeline_version(),
+        "openings": openings,
+        "jd_embeddings": scoring.encode_documents(get_embedding_model(), jd_texts)
+    }
+    frappe.cache().set_value(OPENING_FEATURES_CACHE_KEY, cached)
+    return cached
+
+def clear_opening_features():
+    frappe.cache().delete_value(OPENING_FEATURES_CACHE_KEY)
+
+# doc_events: Job Opening after_insert / on_trash
+def on_job_opening_change(doc, method=None):
+    clear_opening_features()
+
+# doc_events: Job Opening on_update, only when the text or open status changed
+def on_job_opening_update(doc, method=None):
+    if any(doc.has_value_changed(field) for field in ("description", "status", "job_title")):
+        clear_opening_features()
+
+# Parsed resume features for Job Applicants, computing and caching any that are missing.
+# Returns {job_applicant: parsed} for applicants whose resume could be read.
+def get_applicant_features(job_applicants):
+    from resume_lens.api import allowed_file, get_resume_features, resolve_file_path
+
+    applicants = frappe.get_all(
+        "Job Applicant",
+        filters={"name": ["in", job_applicants], "resume_attachment": ["is", "set"]},
+        fields=["name", "resume_attachment"]
+    )
+
+    file_paths = {}
+    for applicant in applicants:
+        file_type, file_path, filename = resolve_file_path(applicant.resume_attachment)
+        if allowed_file(filename) and os.path.exists(file_path):
+            file_paths[applicant.name] = file_path
+
+    features = get_resume_features(list(file_paths.values()))
+    return {name: features[file_path] for name, file_path in file_paths.items() if file_path in features}
+
+# Rank open Job Openings for one or many applicants. All applicant x opening similarities come from
+# one matrix product against the cached JD embeddings.
+@frappe.whitelist()
+def match_openings(job_applicants, top_k=DEFAULT_TOP_OPENINGS):
+    from resume_lens.api import format_score
+
+    if isinstance(job_applicants, str):
+        job_applicants = frappe.parse_json(job_applicants) if job_applicants.startswith("[") else [job_applicants]
+    for job_applicant in job_applicants:
+        frappe.has_permission("Job Applicant", "read", job_applicant, throw=True)
+
+    opening_features = get_opening_features()
+    openings = opening_features["openings"]
+    applicant_features = get_applicant_features(job_applicants)
+    if not openings or not applicant_features:
+        return {name: [] for name in job_applicants}
+
+    names = list(applicant_features)
+    scores = scoring.score_matrix(
+        [applicant_features[name]["embedding"] for name in names], opening_features["jd_embeddings"]
+    )
+
+    matches = {name: [] for name in job_applicants}
+    for row, name in enumerate(names):
+        resume_parsed = applicant_features[name]
+        resume_skills = set(map(str.lower, resume_parsed["resume_skills"] or []))
+        for column in top_k_indices(scores[row], cint(top_k) or None):
+            opening = openings[column]
+            experience_range = opening["experience_range"]
+            matches[name].append({
+                "job_opening": opening["name"],
+                "job_title": opening["job_title"],
+                "score": format_score(float(scores[row, column])),
+                "score_value": round(float(scores[row, column]) * 100, 2),
+                "matched_skills": sorted(resume_skills.intersection(opening["jd_required_skills"])),
+                "experience_match": bool(
+                    experience_range is None
+                    or experience_range[0] <= resume_parsed["total_experience"] <= experience_range[1]
+                )
+            })
+    return matches
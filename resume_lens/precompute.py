@@ -0,0 +1,103 @@
+import os
+
+import frappe
+from frappe.utils import cint
+
+from resume_lens.applicant_index import enqueue_sync_applicants, sync_applicants
+from resume_lens.config import get_config
+
+DEFAULT_BACKFILL_BATCH_SIZE = 50
+
+def is_precompute_enabled():
+    return cint(get_config("resume_lens_precompute_on_save", 1))
+
+def get_precompute_job_id(job_applicant):
+    return f"resume_lens_precompute::{job_applicant}"
+
+# doc_events: Job Applicant after_insert
+def on_job_applicant_insert(doc, method=None):
+    if doc.resume_attachment:
+        enqueue_precompute(doc.name)
+
+# doc_events: Job Applicant on_update. A replaced resume is precomputed again; a status change only
+# adds the applicant to or drops it from the applicant index.
+def on_job_applicant_update(doc, method=None):
+    if doc.flags.in_insert:
+        return
+    if doc.resume_attachment and doc.has_value_changed("resume_attachment"):
+        enqueue_precompute(doc.name)
+    elif doc.has_value_changed("status"):
+        enqueue_sync_applicants([doc.name])
+
+# doc_events: Job Applicant on_trash
+def on_job_applicant_trash(doc, method=None):
+    enqueue_sync_applicants([doc.name])
+
+def enqueue_precompute(job_applicant):
+    if not is_precompute_enabled():
+        return
+
+    frappe.enqueue(
+        "resume_lens.precompute.precompute_applicant_features",
+        queue="long",
+        job_id=get_precompute_job_id(job_applicant),
+        deduplicate=True,
+        enqueue_after_commit=True,
+        job_applicants=[job_applicant]
+    )
+
+# Resume file paths for the given applicants, skipping missing files and unsupported types
+def get_applicant_resume_paths(job_applicants):
+    from resume_lens.api import allowed_file, resolve_file_path
+
+    resume_urls = frappe.get_all(
+        "Job Applicant",
+        filters={"name": ["in", job_applicants], "resume_attachment": ["is", "set"]},
+        pluck="resume_attachment"
+    )
+
+    file_paths = []
+    for resume_url in resume_urls:
+        file_type, file_path, filename = resolve_file_path(resume_url)
+        if allowed_file(filename) and os.path.exists(file_path):
+            file_paths.append(file_path)
+    return file_paths
+
+# Background job: extract text, experience, skills and the embedding for the applicants' resumes
+# into the feature cache and the applicant index, so screening only has to look them up and rank them
+def precompute_applicant_features(job_applicants):
+    from resume_lens.api import get_resume_features
+
+    file_paths = get_applicant_resume_paths(job_applicants)
+    if file_paths:
+        get_resume_features(file_paths)
+        frappe.db.commit()
+    sync_applicants(job_applicants)
+    return len(file_paths)
+
+# Split every applicant with a resume into batches. With enqueue=True each batch becomes its own
+# long-queue job so several workers backfill in parallel, otherwise batches run here one by one.
+def backfill_features(batch_size=None, enqueue=True):
+    batch_size = cint(batch_size) or DEFAULT_BACKFILL_BATCH_SIZE
+    job_applicants = frappe.get_all(
+        "Job Applicant",
+        filters={"resume_attachment": ["is", "set"]},
+        order_by="creation asc, name asc",
+        pluck="name"
+    )
+
+    batches = [job_applicants[i:i + batch_size] for i in range(0, len(job_applicants), batch_size)]
+    for index, batch in enumerate(batches):
+        if enqueue:
+            frappe.enqueue(
+                "resume_lens.precompute.precompute_applicant_features",
+                queue="long",
+                timeout=3600,
+                job_id=f"resume_lens_backfill::{index}",
+                deduplicate=True,
+                job_applicants=batch
+            )
+        else:
+            precompute_applicant_features(batch)
+
+    return {"applicants": len(job_applicants), "batches": len(batches)}
@@ -58,4 +58,4 @@ Error generating stack: `+c.message+`
  *
  * This source code is licensed under the MIT license found in the
  * LICENSE file in the root directory of this source tree.
- */var zd;function Yv(){if(zd)return vo;zd=1;var i=So,r=Symbol.for("react.element"),o=Symbol.for("react.fragment"),l=Object.prototype.hasOwnProperty,f=i.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,a={key:!0,ref:!0,__self:!0,__source:!0};function d(g,v,h){var S,E={},j=null,A=null;h!==void 0&&(j=""+h),v.key!==void 0&&(j=""+v.key),v.ref!==void 0&&(A=v.ref);for(S in v)l.call(v,S)&&!a.hasOwnProperty(S)&&(E[S]=v[S]);if(g&&g.defaultProps)for(S in v=g.defaultProps,v)E[S]===void 0&&(E[S]=v[S]);return{$$typeof:r,type:g,key:j,ref:A,props:E,_owner:f.current}}return vo.Fragment=o,vo.jsx=d,vo.jsxs=d,vo}(function(i){i.exports=Yv()})(Np);const Md=Np.exports.jsx,Gv=me.createContext(null),Xv=({url:i="",tokenParams:r,socketPort:o,swrConfig:l,siteName:f,enableSocket:a=!0,children:d,customHeaders:g})=>{const v=me.useMemo(()=>{const h=new Pg.FrappeApp(i,r,void 0,g);return{url:i,tokenParams:r,app:h,auth:h.auth(),db:h.db(),call:h.call(),file:h.file(),socket:a?new Jv(i,f,o,r).socket:void 0,enableSocket:a,socketPort:o}},[i,r,o,a,g]);return Md(Gv.Provider,{value:v,children:Md(iv,{value:l,children:d})})},Zv=()=>{var we,M,q,I;const[i,r]=me.useState([]),[o,l]=me.useState(null),[f,a]=me.useState(""),[d,g]=me.useState(null),[v,h]=me.useState(!1),[S,E]=me.useState(null),[j,A]=me.useState([]),[D,O]=me.useState(!1),[U,ie]=me.useState(null),[te,X]=me.useState(null),[ae,fe]=me.useState(null),[ne,ge]=me.useState([]),[_e,De]=me.useState("");me.useRef(null),me.useRef(null),me.useEffect(()=>{wt(_n,null,function*(){try{h(!0);const N=yield fetch("/api/method/resume_lens.api.get_all_records",{method:"GET",credentials:"include",headers:{"Content-Type":"application/json"}});if(!N.ok)throw new Error("Failed to fetch job options");const b=yield N.json();ge(b.message||[]),console.log("Fetched job options:",b.message)}catch(N){console.error("Error fetching job options:",N),E("Failed to load job options")}finally{h(!1)}})},[]);const Ie=m=>{De(m.target.value);const N=ne.find(b=>b.job_title===m.target.value);N&&(a(N.description),l(null))},dt=m=>{a(m.target.value),m.target.value&&l(null)},ze=m=>wt(_n,null,function*(){var J,Z,re,pe,le,ye,We,En,Cr,Tn,Kn,Nr;m.preventDefault(),h(!0),g(null),E(null),A([]);const N=new FormData;N.append("jd_text",f),_e&&N.append("job_title_select",_e);const b=window.csrf_token;try{const Vt=yield fetch("/api/method/resume_lens.api.process_resumes",{method:"POST",credentials:"include",headers:{"X-Frappe-CSRF-Token":b},body:N});if(!Vt.ok){const Ht=yield Vt.json();let Cn="An error occurred while processing resumes.";throw Ht&&Ht.exception?Cn=`Backend Error: ${Ht.exception}`:Ht&&Ht.message&&(Cn=Ht.message),new Error(Cn)}const Je=yield Vt.json();console.log("Response data:",Je),!((J=Je.message)!=null&&J.Matched_Resumes)||((re=(Z=Je.message)==null?void 0:Z.Matched_Resumes.PerfectMatched)==null?void 0:re.length)===0&&((le=(pe=Je.message)==null?void 0:pe.Matched_Resumes.TopMatched)==null?void 0:le.length)===0&&((We=(ye=Je.message)==null?void 0:ye.Matched_Resumes.GoodMatched)==null?void 0:We.length)===0&&((Cr=(En=Je.message)==null?void 0:En.Matched_Resumes.PoorMatched)==null?void 0:Cr.length)===0&&((Kn=(Tn=Je.message)==null?void 0:Tn.Matched_Resumes.NotGood)==null?void 0:Kn.length)===0?(g(null),E("No resumes matched your job description.")):(g(Je.message.Matched_Resumes),E(null)),(Nr=Je.message)!=null&&Nr.jd_required_skills?(A(Je.message.jd_required_skills),console.log("JD Skills extracted:",Je.message.jd_required_skills)):(A([]),console.warn("JD Skills not found in API response."))}catch(Vt){console.error("Error:",Vt),E(Vt.message||"An unexpected error occurred. Please try again later.")}finally{h(!1)}}),de=(m,N)=>wt(_n,null,function*(){console.log("handleViewResume START for:",N,"URL:",m),h(!0),ie(null),X(N),fe(null),E(null),O(!0);try{const b=yield fetch(m,{method:"GET"});if(!b.ok)throw new Error(`Failed to fetch resume content: ${b.statusText}`);const J=yield b.json();console.log("API Response Data:",J),console.log("File Content Type:",typeof J.message.file_content,J.message.file_content),console.log("Content Type String:",typeof J.message.content_type,J.message.content_type),ie(J.message.file_content),fe(J.message.content_type)}catch(b){console.error("Error viewing resume:",b),E(b.message||"Failed to view resume."),ie(null),fe(null)}finally{h(!1),console.log("handleViewResume FINISHED for:",N)}}),Xe=()=>{O(!1),ie(null),X(null),fe(null),E(null)},it=m=>{let N="";const b=new Uint8Array(m),J=4096;for(let Z=0;Z<b.length;Z+=J){const re=b.subarray(Z,Z+J);N+=String.fromCharCode.apply(null,Array.from(re))}return btoa(N)},He=()=>{if(!U)return T.jsx("p",{children:"Loading resume content..."});if(ae==="application/pdf")try{let m;typeof U=="string"?m=U:U instanceof ArrayBuffer?m=it(U):m=it(new Uint8Array(U));const N=`data:application/pdf;base64,${m}`;return T.jsx("iframe",{src:N,width:"100%",height:"600px",title:"Resume Preview",className:"resume-preview-iframe"})}catch(m){return console.error("Error rendering PDF:",m),T.jsx("p",{className:"error-message",children:"Error rendering PDF resume."})}else{if(ae==="application/vnd.openxmlformats-officedocument.wordprocessingml.document"||ae==="application/msword")return T.jsx("p",{children:"Word documents cannot be rendered directly. Please download to view."});try{return T.jsx("pre",{style:{whiteSpace:"pre-wrap",wordWrap:"break-word"},children:String(U)})}catch(m){return console.error("Error rendering Text Content:",m),T.jsx("p",{className:"error-message",children:"Error rendering text-based resume."})}}};return T.jsxs("div",{className:"container",children:[T.jsxs("div",{className:"card",children:[T.jsx("div",{className:"card-header",children:T.jsx("h1",{children:"ResumeLens"})}),T.jsxs("div",{className:"card-body",children:[T.jsxs("form",{onSubmit:ze,encType:"multipart/form-data",children:[T.jsxs("div",{className:"form-group",children:[T.jsx("label",{htmlFor:"job_title_select",children:T.jsx("strong",{children:"Select Job Title"})}),T.jsxs("select",{id:"job_title_select",className:"form-control",value:_e,onChange:Ie,required:!0,children:[T.jsx("option",{value:"",children:"Select a job title"}),ne.map((m,N)=>T.jsx("option",{value:m.job_title,children:m.job_title},N))]})]}),T.jsxs("div",{className:"form-group",children:[T.jsx("label",{htmlFor:"jd_text",children:T.jsx("strong",{children:"Job Description"})}),T.jsx("textarea",{name:"jd_text",id:"jd_text",className:"form-control",rows:6,value:f,onChange:dt,disabled:!!o,required:!o,placeholder:"Enter job description text here..."})]}),T.jsx("div",{className:"text-center",children:T.jsxs("button",{type:"submit",className:"btn btn-dark",disabled:v,children:[" ","Match Resume"]})})]}),v&&T.jsxs("div",{className:"loader-container",children:[T.jsx("div",{className:"loader"}),T.jsx("p",{children:"Loading..."})]}),S&&T.jsx("div",{className:"alert alert-danger mt-3",children:S}),j.length>0&&T.jsxs("div",{className:"jd-skills-section mt-4",children:[T.jsx("h2",{children:T.jsx("strong",{children:"Job Description Skills:"})}),T.jsx("div",{className:"jd-skills-display",children:j.map((m,N)=>T.jsx("span",{className:"skill-chip jd-skill-chip",children:m},N))})]}),d&&T.jsxs("div",{className:"matched-results mt-4",children:[T.jsx("h2",{children:T.jsx("strong",{children:"Filter Resumes:"})}),(d==null?void 0:d.PerfectMatched)&&d.PerfectMatched.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Perfectly Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (above 80%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.PerfectMatched.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]}),(d==null?void 0:d.TopMatched)&&d.TopMatched.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Top Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (above 70%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.TopMatched.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),console.log(`Clicked TopMatched resume ${N+1}:`,m.resume_name,"viewUrl:",m.view_url),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]}),d===null&&!v&&!S&&T.jsx("div",{className:"alert alert-warning mt-3",children:"No resumes matched your job description."}),(d==null?void 0:d.GoodMatched)&&d.GoodMatched.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Good Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (above 60%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.GoodMatched.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]}),(d==null?void 0:d.PoorMatched)&&d.PoorMatched.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Poor Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (above 50%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.PoorMatched.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]}),(d==null?void 0:d.NotGood)&&d.NotGood.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Not Good Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (below 50%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.NotGood.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]})]})]})]}),D&&T.jsx("div",{className:"modal",children:T.jsxs("div",{className:"modal-content",children:[T.jsxs("div",{className:"modal-header",children:[T.jsxs("h4",{className:"modal-title",children:["View Resume: ",te]}),T.jsx("button",{type:"button",className:"close-button",onClick:Xe,children:"×"})]}),T.jsxs("div",{className:"modal-body",children:[He(),S&&T.jsx("div",{className:"alert alert-danger mt-3",children:S})]}),T.jsxs("div",{className:"modal-footer",children:[T.jsx("a",{href:((M=(we=d==null?void 0:d.PerfectMatched)==null?void 0:we.find(m=>m.resume_name===te))==null?void 0:M.file_url)||((I=(q=d==null?void 0:d.TopMatched)==null?void 0:q.find(m=>m.resume_name===te))==null?void 0:I.file_url)||"#",download:te||"resume",className:"btn btn-dark download-button",style:{position:"absolute",left:"20px",bottom:"20px"},children:"Download"}),T.jsx("button",{type:"button",className:"btn btn-secondary",onClick:Xe,children:"Close"})]})]})})]})};function e0(){return T.jsx("div",{className:"App",children:T.jsx(Xv,{children:T.jsx(Zv,{})})})}Im.createRoot(document.getElementById("root")).render(T.jsx(me.StrictMode,{children:T.jsx(e0,{})}))});export default t0();
+ */var zd;function Yv(){if(zd)return vo;zd=1;var i=So,r=Symbol.for("react.element"),o=Symbol.for("react.fragment"),l=Object.prototype.hasOwnProperty,f=i.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,a={key:!0,ref:!0,__self:!0,__source:!0};function d(g,v,h){var S,E={},j=null,A=null;h!==void 0&&(j=""+h),v.key!==void 0&&(j=""+v.key),v.ref!==void 0&&(A=v.ref);for(S in v)l.call(v,S)&&!a.hasOwnProperty(S)&&(E[S]=v[S]);if(g&&g.defaultProps)for(S in v=g.defaultProps,v)E[S]===void 0&&(E[S]=v[S]);return{$$typeof:r,type:g,key:j,ref:A,props:E,_owner:f.current}}return vo.Fragment=o,vo.jsx=d,vo.jsxs=d,vo}(function(i){i.exports=Yv()})(Np);const Md=Np.exports.jsx,Gv=me.createContext(null),Xv=({url:i="",tokenParams:r,socketPort:o,swrConfig:l,siteName:f,enableSocket:a=!0,children:d,customHeaders:g})=>{const v=me.useMemo(()=>{const h=new Pg.FrappeApp(i,r,void 0,g);return{url:i,tokenParams:r,app:h,auth:h.auth(),db:h.db(),call:h.call(),file:h.file(),socket:a?new Jv(i,f,o,r).socket:void 0,enableSocket:a,socketPort:o}},[i,r,o,a,g]);return Md(Gv.Provider,{value:v,children:Md(iv,{value:l,children:d})})},Zv=()=>{var we,M,q,I;const[i,r]=me.useState([]),[o,l]=me.useState(null),[f,a]=me.useState(""),[d,g]=me.useState(null),[v,h]=me.useState(!1),[S,E]=me.useState(null),[j,A]=me.useState([]),[D,O]=me.useState(!1),[U,ie]=me.useState(null),[te,X]=me.useState(null),[ae,fe]=me.useState(null),[ne,ge]=me.useState([]),[_e,De]=me.useState("");me.useRef(null),me.useRef(null),me.useEffect(()=>{wt(_n,null,function*(){try{h(!0);const N=yield fetch("/api/method/resume_lens.api.get_all_records?fields=name,job_title",{method:"GET",credentials:"include",headers:{"Content-Type":"application/json"}});if(!N.ok)throw new Error("Failed to fetch job options");const b=yield N.json();ge(b.message||[]),console.log("Fetched job options:",b.message)}catch(N){console.error("Error fetching job options:",N),E("Failed to load job options")}finally{h(!1)}})},[]);const Ie=m=>{De(m.target.value);const N=ne.find(b=>b.job_title===m.target.value);N&&(l(null),fetch("/api/method/resume_lens.api.get_job_opening_text?job_opening="+encodeURIComponent(N.name),{credentials:"include"}).then(b=>b.json()).then(b=>a(b.message&&b.message.description||"")).catch(()=>E("Failed to load job description")))},dt=m=>{a(m.target.value),m.target.value&&l(null)},ze=m=>wt(_n,null,function*(){var J,Z,re,pe,le,ye,We,En,Cr,Tn,Kn,Nr;m.preventDefault(),h(!0),g(null),E(null),A([]);const N=new FormData;N.append("jd_text",f),_e&&N.append("job_title_select",_e);const b=window.csrf_token;try{const Vt=yield fetch("/api/method/resume_lens.api.process_resumes",{method:"POST",credentials:"include",headers:{"X-Frappe-CSRF-Token":b},body:N});if(!Vt.ok){const Ht=yield Vt.json();let Cn="An error occurred while processing resumes.";throw Ht&&Ht.exception?Cn=`Backend Error: ${Ht.exception}`:Ht&&Ht.message&&(Cn=Ht.message),new Error(Cn)}const Je=yield Vt.json();console.log("Response data:",Je),!((J=Je.message)!=null&&J.Matched_Resumes)||((re=(Z=Je.message)==null?void 0:Z.Matched_Resumes.PerfectMatched)==null?void 0:re.length)===0&&((le=(pe=Je.message)==null?void 0:pe.Matched_Resumes.TopMatched)==null?void 0:le.length)===0&&((We=(ye=Je.message)==null?void 0:ye.Matched_Resumes.GoodMatched)==null?void 0:We.length)===0&&((Cr=(En=Je.message)==null?void 0:En.Matched_Resumes.PoorMatched)==null?void 0:Cr.length)===0&&((Kn=(Tn=Je.message)==null?void 0:Tn.Matched_Resumes.NotGood)==null?void 0:Kn.length)===0?(g(null),E("No resumes matched your job description.")):(g(Je.message.Matched_Resumes),E(null)),(Nr=Je.message)!=null&&Nr.jd_required_skills?(A(Je.message.jd_required_skills),console.log("JD Skills extracted:",Je.message.jd_required_skills)):(A([]),console.warn("JD Skills not found in API response."))}catch(Vt){console.error("Error:",Vt),E(Vt.message||"An unexpected error occurred. Please try again later.")}finally{h(!1)}}),rlContentType=m=>{const N=(m.split(".").pop()||"").toLowerCase();return N==="pdf"?"application/pdf":N==="docx"?"application/vnd.openxmlformats-officedocument.wordprocessingml.document":N==="doc"?"application/msword":"text/plain"},de=(m,N)=>{X(N),E(null),ie(m),fe(rlContentType(N)),O(!0)},Xe=()=>{O(!1),ie(null),X(null),fe(null),E(null)},He=()=>{if(!U)return T.jsx("p",{children:"Loading resume content..."});return ae==="application/vnd.openxmlformats-officedocument.wordprocessingml.document"||ae==="application/msword"?T.jsx("p",{children:"Word documents cannot be rendered directly. Please download to view."}):T.jsx("iframe",{src:U,width:"100%",height:"600px",title:"Resume Preview",className:"resume-preview-iframe"})};return T.jsxs("div",{className:"container",children:[T.jsxs("div",{className:"card",children:[T.jsx("div",{className:"card-header",children:T.jsx("h1",{children:"ResumeLens"})}),T.jsxs("div",{className:"card-body",children:[T.jsxs("form",{onSubmit:ze,encType:"multipart/form-data",children:[T.jsxs("div",{className:"form-group",children:[T.jsx("label",{htmlFor:"job_title_select",children:T.jsx("strong",{children:"Select Job Title"})}),T.jsxs("select",{id:"job_title_select",className:"form-control",value:_e,onChange:Ie,required:!0,children:[T.jsx("option",{value:"",children:"Select a job title"}),ne.map((m,N)=>T.jsx("option",{value:m.job_title,children:m.job_title},N))]})]}),T.jsxs("div",{className:"form-group",children:[T.jsx("label",{htmlFor:"jd_text",children:T.jsx("strong",{children:"Job Description"})}),T.jsx("textarea",{name:"jd_text",id:"jd_text",className:"form-control",rows:6,value:f,onChange:dt,disabled:!!o,required:!o,placeholder:"Enter job description text here..."})]}),T.jsx("div",{className:"text-center",children:T.jsxs("button",{type:"submit",className:"btn btn-dark",disabled:v,children:[" ","Match Resume"]})})]}),v&&T.jsxs("div",{className:"loader-container",children:[T.jsx("div",{className:"loader"}),T.jsx("p",{children:"Loading..."})]}),S&&T.jsx("div",{className:"alert alert-danger mt-3",children:S}),j.length>0&&T.jsxs("div",{className:"jd-skills-section mt-4",children:[T.jsx("h2",{children:T.jsx("strong",{children:"Job Description Skills:"})}),T.jsx("div",{className:"jd-skills-display",children:j.map((m,N)=>T.jsx("span",{className:"skill-chip jd-skill-chip",children:m},N))})]}),d&&T.jsxs("div",{className:"matched-results mt-4",children:[T.jsx("h2",{children:T.jsx("strong",{children:"Filter Resumes:"})}),(d==null?void 0:d.PerfectMatched)&&d.PerfectMatched.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Perfectly Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (above 80%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.PerfectMatched.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]}),(d==null?void 0:d.TopMatched)&&d.TopMatched.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Top Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (above 70%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.TopMatched.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),console.log(`Clicked TopMatched resume ${N+1}:`,m.resume_name,"viewUrl:",m.view_url),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]}),d===null&&!v&&!S&&T.jsx("div",{className:"alert alert-warning mt-3",children:"No resumes matched your job description."}),(d==null?void 0:d.GoodMatched)&&d.GoodMatched.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Good Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (above 60%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.GoodMatched.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]}),(d==null?void 0:d.PoorMatched)&&d.PoorMatched.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Poor Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (above 50%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.PoorMatched.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]}),(d==null?void 0:d.NotGood)&&d.NotGood.length>0&&T.jsxs("div",{className:"result-card mt-3",children:[T.jsx("h4",{children:"Not Good Matched Resumes:"}),T.jsxs("table",{className:"table table-striped",children:[T.jsx("thead",{children:T.jsxs("tr",{children:[T.jsx("th",{className:"applicant-col",style:{width:"40%"},children:"Applicant Name"}),T.jsx("th",{className:"resume-col",style:{width:"40%"},children:"Resume Name"}),T.jsx("th",{className:"score-col",style:{width:"10%"},children:"Score (below 50%)"}),T.jsx("th",{className:"experience-col",style:{width:"10%"},children:"Experience (years)"}),T.jsx("th",{className:"matched_skills-col",style:{width:"10%"},children:"Skills Count"}),T.jsx("th",{className:"matched_skills-col",style:{width:"20%"},children:"Matched Skills"})]})}),T.jsx("tbody",{children:d.NotGood.map((m,N)=>T.jsxs("tr",{children:[T.jsx("td",{className:"applicant-col",children:m.applicant_name}),T.jsx("td",{className:"resume-col",children:T.jsx("a",{href:"#",onClick:b=>{b.preventDefault(),de(m.view_url,m.resume_name)},children:m.resume_name})}),T.jsx("td",{className:"score-col",children:m.score}),T.jsx("td",{className:"experience-col",children:m.experience_years}),T.jsx("td",{className:"matched_skills-col",children:m.matched_count}),T.jsx("td",{className:"matched_skills-col",children:m.matched_skills.join(", ")})]},N))})]})]})]})]})]}),D&&T.jsx("div",{className:"modal",children:T.jsxs("div",{className:"modal-content",children:[T.jsxs("div",{className:"modal-header",children:[T.jsxs("h4",{className:"modal-title",children:["View Resume: ",te]}),T.jsx("button",{type:"button",className:"close-button",onClick:Xe,children:"×"})]}),T.jsxs("div",{className:"modal-body",children:[He(),S&&T.jsx("div",{className:"alert alert-danger mt-3",children:S})]}),T.jsxs("div",{className:"modal-footer",children:[T.jsx("a",{href:((M=(we=d==null?void 0:d.PerfectMatched)==null?void 0:we.find(m=>m.resume_name===te))==null?void 0:M.file_url)||((I=(q=d==null?void 0:d.TopMatched)==null?void 0:q.find(m=>m.resume_name===te))==null?void 0:I.file_url)||"#",download:te||"resume",className:"btn btn-dark download-button",style:{position:"absolute",left:"20px",bottom:"20px"},children:"Download"}),T.jsx("button",{type:"button",className:"btn btn-secondary",onClick:Xe,children:"Close"})]})]})})]})};function e0(){return T.jsx("div",{className:"App",children:T.jsx(Xv,{children:T.jsx(Zv,{})})})}Im.createRoot(document.getElementById("root")).render(T.jsx(me.StrictMode,{children:T.jsx(e0,{})}))});export default t0();
@@ -0,0 +1,15 @@
+# Copyright (c) 2026, AT and contributors
+# For license information, please see license.txt
+
+# import frappe
+from frappe.model.document import Document
+
+from resume_lens.skill_taxonomy import clear_skill_taxonomy
+
+
+class ResumeSkill(Document):
+	def on_update(self):
+		clear_skill_taxonomy()
+
+	def on_trash(self):
+		clear_skill_taxonomy()
@@ -1,9 +1,156 @@
 # Copyright (c) 2025, AT and Contributors
 # See license.txt
 
-# import frappe
+import frappe
 from frappe.tests.utils import FrappeTestCase
 
+from resume_lens.api import reserve_names, resolve_job_applicants, save_job_opening_shortlist
+
+
+def make_job_opening():
+	if not frappe.db.exists("Designation", "Resume Lens Tester"):
+		frappe.get_doc({"doctype": "Designation", "designation_name": "Resume Lens Tester"}).insert()
+	job_opening = frappe.get_doc(
+		{
+			"doctype": "Job Opening",
+			"job_title": "Resume Lens Test Opening",
+			"designation": "Resume Lens Tester",
+			"status": "Open",
+			"description": "Python developer",
+		}
+	)
+	job_opening.insert(ignore_mandatory=True)
+	return job_opening.name
+
+
+def make_job_applicant(applicant_name):
+	return (
+		frappe.get_doc(
+			{
+				"doctype": "Job Applicant",
+				"applicant_name": applicant_name,
+				"email_id": f"{frappe.scrub(applicant_name)}@resume-lens.test",
+			}
+		)
+		.insert()
+		.name
+	)
+
+
+def make_candidate(job_applicant, score="85.00%", **kwargs):
+	return {
+		"job_applicant": job_applicant,
+		"resume_name": f"{job_applicant}.pdf",
+		"experience_years": 3,
+		"matched_count": 2,
+		"matched_skills": ["python", "django"],
+		"score": score,
+		**kwargs,
+	}
+
+
+def get_rows(shortlist_name):
+	return frappe.get_all(
+		"Candidate Score",
+		filters={"parent": shortlist_name, "parenttype": "Shortlisted Candidates"},
+		fields=["name", "idx", "job_applicant", "score"],
+		order_by="idx asc",
+	)
+
 
 class TestShortlistedCandidates(FrappeTestCase):
-	pass
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.alice = make_job_applicant("Resume Lens Alice")
+		cls.bob = make_job_applicant("Resume Lens Bob")
+
+	def setUp(self):
+		# A fresh opening per test, so every test starts without a shortlist
+		self.job_opening = make_job_opening()
+
+	def test_reserve_names_is_consecutive(self):
+		first, second, third = reserve_names("Candidate Score", 3)
+		prefix = frappe.utils.now_datetime().strftime("%d-%m-%y-")
+		for name in (first, second, third):
+			self.assertTrue(name.startswith(prefix))
+		self.assertEqual(
+			[int(name[len(prefix) :]) for name in (second, third)],
+			[int(first[len(prefix) :]) + 1, int(first[len(prefix) :]) + 2],
+		)
+		self.assertEqual(
+			int(reserve_names("Candidate Score", 1)[0][len(prefix) :]), int(third[len(prefix) :]) + 1
+		)
+
+	def test_resolve_job_applicants(self):
+		candidates = [
+			{"job_applicant": self.alice},
+			{"applicant_name": "Resume Lens Bob"},
+			{"job_applicant": "Missing Applicant"},
+			{"applicant_name": "Nobody"},
+		]
+		self.assertEqual(resolve_job_applicants(candidates), [self.alice, self.bob, None, None])
+
+	def test_insert(self):
+		result = save_job_opening_shortlist(
+			self.job_opening,
+			{
+				"PerfectMatched": [make_candidate(self.alice)],
+				"GoodMatched": [make_candidate(self.bob, "65.00%")],
+				"NotGood": [make_candidate("Ignored Applicant")],
+			},
+			["python"],
+		)
+
+		self.assertEqual((result["inserted"], result["updated"], result["removed"]), (2, 0, 0))
+		rows = get_rows(result["name"])
+		self.assertEqual([(row.idx, row.job_applicant) for row in rows], [(1, self.alice), (2, self.bob)])
+		self.assertEqual(len({row.name for row in rows}), 2)
+		self.assertEqual(
+			frappe.db.get_value("Shortlisted Candidates", result["name"], "job_opening"), self.job_opening
+		)
+
+	def test_incremental_update(self):
+		first = save_job_opening_shortlist(
+			self.job_opening,
+			{"PerfectMatched": [make_candidate(self.alice), make_candidate(self.bob)]},
+			["python"],
+		)
+		alice_row = next(row for row in get_rows(first["name"]) if row.job_applicant == self.alice)
+
+		second = save_job_opening_shortlist(
+			self.job_opening,
+			{
+				"PerfectMatched": [make_candidate(self.alice)],
+				"TopMatched": [make_candidate(self.bob, "75.00%")],
+			},
+			["python", "django"],
+		)
+
+		self.assertEqual(second["name"], first["name"])
+		self.assertEqual((second["inserted"], second["updated"], second["removed"]), (0, 1, 0))
+		rows = {row.job_applicant: row for row in get_rows(second["name"])}
+		self.assertEqual(rows[self.alice].name, alice_row.name)
+		self.assertEqual(rows[self.bob].score, "75.00%")
+		self.assertEqual(rows[self.bob].idx, 2)
+		self.assertEqual(
+			frappe.db.get_value("Shortlisted Candidates", second["name"], "jd_required_skills"),
+			"python, django",
+		)
+
+	def test_removes_stale_rows(self):
+		first = save_job_opening_shortlist(
+			self.job_opening,
+			{"PerfectMatched": [make_candidate(self.alice), make_candidate(self.bob)]},
+			["python"],
+		)
+
+		second = save_job_opening_shortlist(
+			self.job_opening, {"PerfectMatched": [make_candidate(self.alice)]}, ["python"]
+		)
+		self.assertEqual((second["inserted"], second["updated"], second["removed"]), (0, 0, 1))
+		self.assertEqual([row.job_applicant for row in get_rows(first["name"])], [self.alice])
+
+		third = save_job_opening_shortlist(self.job_opening, {"NotGood": [make_candidate(self.alice)]}, [])
+		self.assertEqual((third["status"], third["name"], third["removed"]), ("error", first["name"], 1))
+		self.assertEqual(get_rows(first["name"]), [])
@@ -0,0 +1,156 @@
+import numpy as np
+
+from resume_lens import instrumentation
+from resume_lens.config import get_config
+
+DEFAULT_ENCODE_BATCH_SIZE = 64
+# Instrumented runs tokenize at most this many texts per encode call and scale the count up, instead of
+# tokenizing every text a second time next to model.encode
+TOKEN_COUNT_SAMPLE_SIZE = 32
+
+# The model only reads the first 256 word pieces of a text. In "chunked" mode documents are split into
+# overlapping word windows that each fit, every window is embedded, and scores are pooled over windows.
+DEFAULT_EMBEDDING_MODE = "single"
+DEFAULT_CHUNK_WORDS = 150
+DEFAULT_CHUNK_OVERLAP = 30
+DEFAULT_MAX_CHUNKS = 32
+# "max": each JD window is matched by its best resume window, averaged over JD windows.
+# "mean": average similarity over all resume x JD window pairs.
+DEFAULT_CHUNK_POOLING = "max"
+
+def get_encode_batch_size():
+    return int(get_config("resume_lens_encode_batch_size", DEFAULT_ENCODE_BATCH_SIZE))
+
+def is_chunked():
+    return get_config("resume_lens_embedding_mode", DEFAULT_EMBEDDING_MODE) == "chunked"
+
+# Window settings (resume_lens_chunk_words, resume_lens_chunk_overlap, resume_lens_max_chunks)
+def get_chunk_settings():
+    return {
+        "chunk_words": int(get_config("resume_lens_chunk_words", DEFAULT_CHUNK_WORDS)),
+        "overlap": int(get_config("resume_lens_chunk_overlap", DEFAULT_CHUNK_OVERLAP)),
+        "max_chunks": int(get_config("resume_lens_max_chunks", DEFAULT_MAX_CHUNKS)),
+    }
+
+def get_chunk_pooling():
+    return get_config("resume_lens_chunk_pooling", DEFAULT_CHUNK_POOLING)
+
+# Scale every row to unit length so a dot product is the cosine similarity
+def normalize_rows(matrix):
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=np.float32))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+# Encode texts with SentenceTransformer in batches and return a normalized (n, dim) float32 matrix
+def encode_texts(model, texts, batch_size=None):
+    texts = list(texts)
+    if not texts:
+        return np.empty((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+
+    if instrumentation.get_current_run() is not None:
+        instrumentation.count("texts_encoded", len(texts))
+        instrumentation.count("tokens_encoded", estimate_tokens(model, texts))
+
+    embeddings = model.encode(
+        texts,
+        batch_size=batch_size or get_encode_batch_size(),
+        convert_to_numpy=True,
+        show_progress_bar=False
+    )
+    return normalize_rows(embeddings)
+
+# Word pieces encoding texts reads, counted on an evenly spaced sample of at most sample_size texts
+def estimate_tokens(model, texts, sample_size=TOKEN_COUNT_SAMPLE_SIZE):
+    sample = texts[::-(-len(texts) // sample_size)]
+    return round(model.count_tokens(sample) * len(texts) / len(sample))
+
+# Split text into windows of chunk_words words, consecutive windows sharing `overlap` words
+def split_chunks(text, chunk_words=DEFAULT_CHUNK_WORDS, overlap=DEFAULT_CHUNK_OVERLAP, max_chunks=DEFAULT_MAX_CHUNKS):
+    words = text.split()
+    if len(words) <= chunk_words:
+        return [" ".join(words)]
+    step = max(1, chunk_words - overlap)
+    chunks = [" ".join(words[start:start + chunk_words]) for start in range(0, len(words) - overlap, step)]
+    return chunks[:max_chunks] if max_chunks else chunks
+
+# Encode every window of every text in one batched pass. Returns one normalized float16
+# (windows, dim) matrix per text.
+def encode_chunked(model, texts, batch_size=None, **chunk_settings):
+    chunked = [split_chunks(text, **(chunk_settings or get_chunk_settings())) for text in texts]
+    if not chunked:
+        return []
+    matrix = encode_texts(model, [chunk for chunks in chunked for chunk in chunks], batch_size).astype(np.float16)
+    return np.split(matrix, np.cumsum([len(chunks) for chunks in chunked])[:-1])
+
+# Embed resume or JD documents the way the configured embedding mode stores them: one vector per
+# document, or a float16 window matrix per document in chunked mode
+def encode_documents(model, texts, batch_size=None):
+    if is_chunked():
+        return encode_chunked(model, texts, batch_size)
+    return encode_texts(model, texts, batch_size)
+
+# One unit vector per document: window matrices are mean pooled
+def pool_embedding(embedding):
+    embedding = np.asarray(embedding, dtype=np.float32)
+    if embedding.ndim == 2:
+        embedding = normalize_rows(embedding).mean(axis=0)
+    return embedding
+
+# Stack per-resume embeddings into one normalized matrix
+def stack_embeddings(embeddings):
+    if not len(embeddings):
+        return np.empty((0, 0), dtype=np.float32)
+    return normalize_rows(np.vstack([pool_embedding(embedding) for embedding in embeddings]))
+
+# Score window matrices against the windows of many JDs with one product over all stacked resume and
+# JD windows, then pool per resume and per JD with reduceat. Returns (resumes, jds) scores.
+def pooled_score_matrix(resume_chunks, jd_chunks_list, pooling=DEFAULT_CHUNK_POOLING):
+    if not len(resume_chunks) or not len(jd_chunks_list):
+        return np.empty((len(resume_chunks), len(jd_chunks_list)), dtype=np.float32)
+    sizes = np.array([len(chunks) for chunks in resume_chunks])
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    jd_sizes = np.array([len(chunks) for chunks in jd_chunks_list])
+    jd_starts = np.concatenate([[0], np.cumsum(jd_sizes)[:-1]])
+    similarities = normalize_rows(np.vstack(resume_chunks)) @ normalize_rows(np.vstack(jd_chunks_list)).T
+
+    if pooling == "mean":
+        per_resume = np.add.reduceat(similarities, starts, axis=0) / sizes[:, None]
+    else:
+        per_resume = np.maximum.reduceat(similarities, starts, axis=0)
+    return np.add.reduceat(per_resume, jd_starts, axis=1) / jd_sizes[None, :]
+
+# Pooled scores of window matrices against the windows of a single JD
+def pooled_scores(resume_chunks, jd_chunks, pooling=DEFAULT_CHUNK_POOLING):
+    if not len(resume_chunks):
+        return np.empty(0, dtype=np.float32)
+    return pooled_score_matrix(resume_chunks, [jd_chunks], pooling)[:, 0]
+
+# Cosine similarity of every resume row against the JD vector with a single matrix-vector product
+def similarity_scores(resume_matrix, jd_vector):
+    if not len(resume_matrix):
+        return np.empty(0, dtype=np.float32)
+    return resume_matrix @ normalize_rows(jd_vector)[0]
+
+# Embed a JD the way score_resumes compares it: one vector, or a window matrix in chunked mode
+def encode_jd(model, jd_text):
+    return encode_documents(model, [jd_text])[0]
+
+# Score the JD against all resume embeddings, returns float scores in [-1, 1]. The JD is embedded here
+# unless its encode_jd embedding is passed, so runs scoring many batches encode it once. In chunked
+# mode the JD is split into windows as well and scores are pooled over windows.
+def score_resumes(model, jd_text, resume_embeddings, jd_embedding=None):
+    if jd_embedding is None:
+        jd_embedding = encode_jd(model, jd_text)
+    if is_chunked():
+        return pooled_scores(resume_embeddings, jd_embedding, get_chunk_pooling())
+    return similarity_scores(stack_embeddings(resume_embeddings), jd_embedding)
+
+# Score resume embeddings against many JD embeddings from encode_documents, (resumes, jds). Each column
+# matches what score_resumes gives for that JD, so chunked mode pools over JD windows here as well.
+def score_matrix(resume_embeddings, jd_embeddings):
+    if is_chunked():
+        return pooled_score_matrix(resume_embeddings, jd_embeddings, get_chunk_pooling())
+    if not len(resume_embeddings) or not len(jd_embeddings):
+        return np.empty((len(resume_embeddings), len(jd_embeddings)), dtype=np.float32)
+    return stack_embeddings(resume_embeddings) @ normalize_rows(np.vstack(jd_embeddings)).T
@@ -0,0 +1,226 @@
+import frappe
+from frappe.utils import cint, now_datetime
+
+from resume_lens import instrumentation
+from resume_lens.api import (
+    categorize_resumes,
+    filter_resumes_by_experience,
+    get_experience_range,
+    make_deduplicator,
+    parse_jd,
+    save_job_opening_shortlist,
+    save_shortlisted_candidates,
+    score_resume_files,
+)
+from resume_lens.applicant_discovery import count_applicant_files, iter_applicant_files, iter_batches
+from resume_lens.config import get_config
+
+SCREENING_JOB_DOCTYPE = "Screening Job"
+CHUNK_DOCTYPE = "Screening Job Chunk"
+PROGRESS_EVENT = "resume_lens_screening_progress"
+DEFAULT_CHUNK_SIZE = 100
+# Number of best partial results kept on the job and pushed with each progress event
+PROGRESS_TOP_N = 20
+
+def get_chunk_size(chunk_size=None):
+    return cint(chunk_size) or cint(get_config("resume_lens_screening_chunk_size", DEFAULT_CHUNK_SIZE))
+
+def get_rq_job_id(job_id):
+    return f"resume_lens_screening::{job_id}"
+
+def rank_resumes(resumes):
+    return sorted(resumes, key=lambda resume: resume['score_value'], reverse=True)
+
+# Create a Screening Job for the posted JD and run it in chunks on the long queue
+@frappe.whitelist()
+def start_screening_job(job_title_select=None, jd_text=None, chunk_size=None):
+    if not jd_text:
+        frappe.throw("Job description text is required")
+
+    job = frappe.get_doc({
+        "doctype": SCREENING_JOB_DOCTYPE,
+        "job_title": job_title_select,
+        "job_opening": frappe.db.get_value("Job Opening", {"job_title": job_title_select, "status": "Open"}, "name"),
+        "jd_text": jd_text,
+        "chunk_size": get_chunk_size(chunk_size),
+        "status": "Queued"
+    })
+    job.insert(ignore_permissions=True)
+    enqueue_screening_job(job.name)
+
+    return {"job_id": job.name, "status": job.status, "event": PROGRESS_EVENT}
+
+# Re-queue a failed or interrupted job; it continues after the last applicant of the last completed chunk
+@frappe.whitelist()
+def resume_screening_job(job_id):
+    job = get_screening_job_doc(job_id)
+    if job.status == "Completed":
+        return {"job_id": job.name, "status": job.status}
+
+    job.db_set("status", "Queued")
+    enqueue_screening_job(job.name)
+    return {"job_id": job.name, "status": "Queued", "event": PROGRESS_EVENT}
+
+# Status, progress and, once completed, the ranked result of a screening job
+@frappe.whitelist()
+def get_screening_job(job_id):
+    # Read the fields only, so polling never loads the per-chunk result rows
+    job = frappe.db.get_value(
+        SCREENING_JOB_DOCTYPE, job_id,
+        ["name", "owner", "status", "total_applicants", "processed_applicants", "started_on", "finished_on",
+         "top_results", "result", "error"],
+        as_dict=True
+    )
+    if not job:
+        frappe.throw(f"Screening Job {job_id} not found", frappe.DoesNotExistError)
+    check_job_owner(job.owner)
+
+    response = {
+        "job_id": job.name,
+        "status": job.status,
+        "total_applicants": job.total_applicants,
+        "processed_applicants": job.processed_applicants,
+        "started_on": job.started_on,
+        "finished_on": job.finished_on,
+    }
+    if job.status == "Completed":
+        response["result"] = frappe.parse_json(job.result)
+    elif job.status == "Failed":
+        response["error"] = job.error
+    else:
+        response["partial_results"] = frappe.parse_json(job.top_results) or []
+    return response
+
+def check_job_owner(owner):
+    if owner != frappe.session.user:
+        frappe.only_for("System Manager")
+
+def get_screening_job_doc(job_id):
+    job = frappe.get_doc(SCREENING_JOB_DOCTYPE, job_id)
+    check_job_owner(job.owner)
+    return job
+
+# Store one chunk's filtered results as a child row of the job, without rewriting earlier chunks
+def save_chunk_results(job, idx, processed_applicants, results):
+    frappe.get_doc({
+        "doctype": CHUNK_DOCTYPE,
+        "parent": job.name,
+        "parenttype": SCREENING_JOB_DOCTYPE,
+        "parentfield": "chunks",
+        "idx": idx,
+        "processed_applicants": processed_applicants,
+        "results": frappe.as_json(results)
+    }).db_insert()
+
+# Filtered results of every completed chunk, in chunk order
+def get_chunk_results(job_name):
+    rows = frappe.get_all(
+        CHUNK_DOCTYPE,
+        filters={"parent": job_name, "parenttype": SCREENING_JOB_DOCTYPE, "parentfield": "chunks"},
+        fields=["results"],
+        order_by="idx asc"
+    )
+    return [result for row in rows for result in frappe.parse_json(row.results) or []]
+
+def enqueue_screening_job(job_id):
+    frappe.enqueue(
+        "resume_lens.screening_jobs.run_screening_job",
+        queue="long",
+        timeout=6 * 3600,
+        job_id=get_rq_job_id(job_id),
+        deduplicate=True,
+        enqueue_after_commit=True,
+        screening_job=job_id
+    )
+
+def publish_progress(job, **message):
+    message.update({
+        "job_id": job.name,
+        "status": job.status,
+        "total_applicants": job.total_applicants,
+        "processed_applicants": job.processed_applicants,
+    })
+    frappe.publish_realtime(PROGRESS_EVENT, message, user=job.owner)
+
+# Background worker: stream the applicants of the job's Job Opening chunk by chunk, checkpointing after
+# every chunk. Each chunk's results are appended as a Screening Job Chunk row and only the running top
+# results and the keyset cursor (last applicant's creation and name) are rewritten on the job, so a
+# checkpoint costs the same however many chunks came before and a resumed job pages straight to where
+# it stopped. Stage timings and counters of the whole job are kept as a Screening Run Log.
+def run_screening_job(screening_job):
+    job = frappe.get_doc(SCREENING_JOB_DOCTYPE, screening_job)
+    if job.status == "Completed":
+        return
+
+    with instrumentation.screening_run("Screening Job", job.job_title, screening_job=job.name):
+        try:
+            job.db_set({"status": "Running", "started_on": job.started_on or now_datetime()}, commit=True)
+
+            jd_parsed = parse_jd(jd_text=job.jd_text)
+            min_experience, max_experience = get_experience_range(jd_parsed)
+            jd_required_skills = jd_parsed['jd_required_skills']
+
+            filters = {"job_opening": job.job_opening} if job.job_opening else {}
+            after = None
+            if job.last_applicant:
+                after = {"creation": job.last_applicant_creation, "name": job.last_applicant}
+            resume_files = iter_applicant_files(after=after, **filters)
+
+            chunk_size = get_chunk_size(job.chunk_size)
+            processed_applicants = cint(job.processed_applicants)
+            top_results = frappe.parse_json(job.top_results) or []
+            chunk_index = frappe.db.count(CHUNK_DOCTYPE, {"parent": job.name, "parenttype": SCREENING_JOB_DOCTYPE})
+            stage_counts = {}
+            # Files of chunks completed before a resume are not seen again, so duplicates are only
+            # detected among the chunks scored by this run
+            deduplicator = make_deduplicator()
+            job.db_set("total_applicants", count_applicant_files(**filters), commit=True)
+
+            for chunk in iter_batches(resume_files, chunk_size):
+                chunk_counts = {}
+                chunk_scores = score_resume_files(chunk, jd_parsed, stage_counts=chunk_counts, deduplicator=deduplicator)
+                for stage, count in chunk_counts.items():
+                    stage_counts[stage] = stage_counts.get(stage, 0) + count
+                chunk_results = rank_resumes(
+                    filter_resumes_by_experience(chunk_scores, min_experience, max_experience, jd_required_skills)
+                )
+                top_results = rank_resumes(top_results + chunk_results)[:PROGRESS_TOP_N]
+
+                chunk_index += 1
+                processed_applicants += len(chunk)
+                save_chunk_results(job, chunk_index, len(chunk), chunk_results)
+                job.db_set({
+                    "processed_applicants": processed_applicants,
+                    "last_applicant": chunk[-1]['job_applicant'],
+                    "last_applicant_creation": chunk[-1]['creation'],
+                    "top_results": frappe.as_json(top_results)
+                }, commit=True)
+                publish_progress(
+                    job,
+                    stage_counts=chunk_counts,
+                    chunk_results=chunk_results,
+                    top_results=top_results
+                )
+
+            matched_resumes = categorize_resumes(rank_resumes(get_chunk_results(job.name)))
+            if job.job_opening:
+                save_job_opening_shortlist(job.job_opening, matched_resumes, jd_required_skills)
+            else:
+                save_shortlisted_candidates(matched_resumes, job.job_title, jd_required_skills)
+
+            result = {
+                'Matched_Resumes': matched_resumes,
+                'jd_required_skills': jd_required_skills,
+                'stage_counts': stage_counts
+            }
+            job.db_set({
+                "status": "Completed",
+                "finished_on": now_datetime(),
+                "result": frappe.as_json(result)
+            }, commit=True)
+            publish_progress(job)
+        except Exception:
+            frappe.db.rollback()
+            job.db_set({"status": "Failed", "error": frappe.get_traceback()}, commit=True)
+            publish_progress(job, error=job.error)
+            raise
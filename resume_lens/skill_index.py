@@ -0,0 +1,174 @@
+import json
+import os
+
+import numpy as np
+
+POSTINGS_FILE = "postings.npz"
+META_FILE = "meta.json"
+
+def _save_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+# Inverted index from normalized skill to the rows of the applicants that have it. Each posting list is
+# a sorted int32 array of row ids; queries turn the postings they need into boolean row masks, so
+# AND / OR / NOT are single vectorized operations and a min-match count is a sum over those masks.
+# Rows map to keys (Job Applicant names) through meta.json and are reused after removal, like the
+# rows of the vector index. On disk all posting lists are one concatenated array with offsets, and the
+# skill of each list is kept in meta.json, so skill names never become array names in the .npz.
+class SkillIndex:
+    def __init__(self, path, version=None):
+        self.path = path
+        self.version = version
+        self.keys = []
+        self.postings = {}
+        self.experience = np.empty(0, dtype=np.float32)
+
+        if os.path.exists(self._file(META_FILE)):
+            with open(self._file(META_FILE)) as f:
+                meta = json.load(f)
+            self.version = meta["version"]
+            self.keys = meta["keys"]
+            # Indexes written before the skill list moved to meta.json load empty and are rejected
+            # by their pipeline version
+            if "skills" in meta:
+                with np.load(self._file(POSTINGS_FILE)) as data:
+                    self.experience = data["experience"]
+                    postings, offsets = data["postings"], data["offsets"]
+                self.postings = {
+                    skill: postings[offsets[i]:offsets[i + 1]] for i, skill in enumerate(meta["skills"])
+                }
+            else:
+                self.keys = []
+
+        self.rows = {key: row for row, key in enumerate(self.keys) if key is not None}
+        self.free_rows = [row for row, key in enumerate(self.keys) if key is None]
+
+    @classmethod
+    def create(cls, path, version=None):
+        os.makedirs(path, exist_ok=True)
+        for filename in (POSTINGS_FILE, META_FILE):
+            if os.path.exists(os.path.join(path, filename)):
+                os.remove(os.path.join(path, filename))
+        index = cls(path, version)
+        index.save()
+        return index
+
+    def _file(self, filename):
+        return os.path.join(self.path, filename)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    # Drop a row from every posting list that holds it
+    def _clear_row(self, row):
+        for skill, posting in list(self.postings.items()):
+            position = np.searchsorted(posting, row)
+            if position < len(posting) and posting[position] == row:
+                posting = np.delete(posting, position)
+                if len(posting):
+                    self.postings[skill] = posting
+                else:
+                    del self.postings[skill]
+
+    # Insert or replace the skills and experience of many keys, entries are (key, skills, experience).
+    # New rows are merged into each posting list once per call, so bulk loads stay fast.
+    def add_many(self, entries):
+        new_rows = {}
+        experience_rows = []
+        for key, skills, experience in entries:
+            row = self.rows.get(key)
+            if row is None:
+                row = self.free_rows.pop() if self.free_rows else len(self.keys)
+                if row == len(self.keys):
+                    self.keys.append(None)
+                self.keys[row] = key
+                self.rows[key] = row
+            else:
+                self._clear_row(row)
+
+            experience_rows.append((row, experience or 0))
+            for skill in {skill.lower() for skill in skills or []}:
+                new_rows.setdefault(skill, []).append(row)
+
+        if len(self.experience) < len(self.keys):
+            self.experience = np.concatenate([
+                self.experience, np.full(len(self.keys) - len(self.experience), np.nan, dtype=np.float32)
+            ])
+        for row, experience in experience_rows:
+            self.experience[row] = experience
+
+        for skill, rows in new_rows.items():
+            posting = self.postings.get(skill)
+            rows = np.array(rows, dtype=np.int32)
+            self.postings[skill] = np.sort(rows) if posting is None else np.union1d(posting, rows).astype(np.int32)
+
+    def add(self, key, skills, experience=0):
+        self.add_many([(key, skills, experience)])
+
+    def remove(self, keys):
+        for key in keys:
+            row = self.rows.pop(key, None)
+            if row is None:
+                continue
+            self._clear_row(row)
+            self.keys[row] = None
+            self.experience[row] = np.nan
+            self.free_rows.append(row)
+
+    def _mask(self, skill):
+        mask = np.zeros(len(self.keys), dtype=bool)
+        posting = self.postings.get(skill.lower())
+        if posting is not None:
+            mask[posting] = True
+        return mask
+
+    # Boolean row mask of the applicants that have every skill in all_of, at least one skill in any_of,
+    # no skill in none_of, at least min_match of match_skills, and experience within the given range
+    def query_mask(self, all_of=None, any_of=None, none_of=None, match_skills=None, min_match=0,
+                   min_experience=None, max_experience=None):
+        mask = ~np.isnan(self.experience)
+        for skill in all_of or []:
+            mask &= self._mask(skill)
+        if any_of:
+            mask &= np.logical_or.reduce([self._mask(skill) for skill in any_of])
+        for skill in none_of or []:
+            mask &= ~self._mask(skill)
+        if match_skills and min_match:
+            counts = np.zeros(len(self.keys), dtype=np.int32)
+            for skill in set(map(str.lower, match_skills)):
+                if skill in self.postings:
+                    counts[self.postings[skill]] += 1
+            mask &= counts >= min_match
+        if min_experience is not None:
+            mask &= self.experience >= min_experience
+        if max_experience is not None:
+            mask &= self.experience <= max_experience
+        return mask
+
+    # Keys matching query_mask, in row order
+    def query(self, **filters):
+        return [self.keys[row] for row in np.flatnonzero(self.query_mask(**filters))]
+
+    # Number of applicants per skill, most common first
+    def skill_counts(self, limit=None):
+        counts = sorted(((skill, len(posting)) for skill, posting in self.postings.items()), key=lambda c: -c[1])
+        return counts[:limit] if limit else counts
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        skills = list(self.postings)
+        lists = [self.postings[skill] for skill in skills]
+        offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(posting) for posting in lists])
+        postings = np.concatenate(lists).astype(np.int32) if lists else np.empty(0, dtype=np.int32)
+
+        tmp_path = self._file(f"{POSTINGS_FILE}.tmp.npz")
+        np.savez(tmp_path, experience=self.experience, postings=postings, offsets=offsets)
+        os.replace(tmp_path, self._file(POSTINGS_FILE))
+        _save_json(self._file(META_FILE), {"version": self.version, "keys": self.keys, "skills": skills})
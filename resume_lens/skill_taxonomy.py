@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import re
+
+import frappe
+import marisa_trie
+
+from resume_lens.config import get_config
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(__file__), "config", "skill_taxonomy.json")
+SKILL_DOCTYPE = "Resume Skill"
+TAXONOMY_CACHE_KEY = "resume_lens_skill_taxonomy"
+
+# Canonical names that are also everyday words or letters ("I will go", "grade C"). These skills are only
+# matched through their aliases ("golang", "c programming").
+ALIAS_ONLY_SKILLS = frozenset({"c", "go"})
+
+# Characters that can be part of a skill name (c++, c#, node.js); everything else separates words. A slash
+# is a word of its own, so "HTML/CSS" reads as "html / css" and both skills match, while aliases that
+# contain one (ci/cd, tcp/ip) normalize the same way and still match as multi-word phrases.
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#.]+|/")
+
+# Lowercase text and reduce it to single-space separated words, dropping sentence punctuation
+# at word ends so "Python." and "Python" match the same way
+def normalize_text(text):
+    words = (word.rstrip(".") for word in TOKEN_PATTERN.findall(text.lower()))
+    return " ".join(word for word in words if word)
+
+# {canonical skill: [aliases]} from a taxonomy JSON file
+def load_taxonomy(path=TAXONOMY_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+# Matches canonical skills and their aliases as whole-word phrases. All phrases are compiled into a
+# marisa trie; matching walks the normalized text once, and at every word start asks the trie for the
+# phrases that are a prefix of the remaining text, keeping the longest one that ends on a word boundary.
+# "spring boot" therefore wins over "spring", and multi-word skills are never split into tokens.
+class SkillMatcher:
+    def __init__(self, aliases):
+        self.skills = {}
+        for alias, skill in aliases.items():
+            phrase = normalize_text(alias)
+            if phrase:
+                self.skills[phrase] = skill.lower()
+        self.trie = marisa_trie.Trie(self.skills)
+        self.max_length = max(map(len, self.skills), default=0)
+
+    @classmethod
+    def from_taxonomy(cls, taxonomy):
+        return cls(get_alias_map(taxonomy))
+
+    # Canonical skills found in text, in order of first appearance
+    def match(self, text):
+        text = normalize_text(text)
+        length = len(text)
+        found = {}
+        position = 0
+        while position < length:
+            end = -1
+            for phrase in self.trie.prefixes(text[position:position + self.max_length]):
+                phrase_end = position + len(phrase)
+                if phrase_end > end and (phrase_end == length or text[phrase_end] == " "):
+                    end = phrase_end
+                    longest = phrase
+
+            if end > 0:
+                found.setdefault(self.skills[longest], None)
+            else:
+                end = text.find(" ", position)
+                if end < 0:
+                    break
+            position = end + 1
+        return list(found)
+
+# {alias or skill name: canonical skill}, leaving out the bare names in ALIAS_ONLY_SKILLS
+def get_alias_map(taxonomy):
+    aliases = {}
+    for skill, skill_aliases in taxonomy.items():
+        for alias in [skill, *skill_aliases]:
+            if normalize_text(alias) not in ALIAS_ONLY_SKILLS:
+                aliases[alias] = skill
+    return aliases
+
+def split_aliases(aliases):
+    return [alias.strip() for alias in re.split(r"[\n,]", aliases or "") if alias.strip()]
+
+# Site taxonomy: the shipped list (or resume_lens_skill_taxonomy_file) merged with Resume Skill
+# records. A disabled record removes a shipped skill, an enabled one adds or replaces it. Names are
+# compared normalized, so a record "python" replaces the shipped "Python".
+def merge_skill_records(taxonomy, records):
+    names = {normalize_text(skill): skill for skill in taxonomy}
+    for record in records:
+        name = normalize_text(record.skill)
+        taxonomy.pop(names.pop(name, None), None)
+        if record.enabled:
+            taxonomy[record.skill] = split_aliases(record.aliases)
+            names[name] = record.skill
+    return taxonomy
+
+def build_taxonomy():
+    return merge_skill_records(
+        load_taxonomy(get_config("resume_lens_skill_taxonomy_file") or TAXONOMY_PATH),
+        frappe.get_all(SKILL_DOCTYPE, fields=["skill", "aliases", "enabled"])
+    )
+
+def get_taxonomy():
+    return frappe.cache().get_value(TAXONOMY_CACHE_KEY, build_taxonomy)
+
+_matchers = {}
+
+# Compiled matcher for the site taxonomy, rebuilt in this process only when the taxonomy changed
+def get_skill_matcher():
+    taxonomy = get_taxonomy()
+    digest = hashlib.sha1(json.dumps(taxonomy, sort_keys=True).encode()).hexdigest()
+    if digest not in _matchers:
+        _matchers.clear()
+        _matchers[digest] = SkillMatcher.from_taxonomy(taxonomy)
+    return _matchers[digest]
+
+# Called when a Resume Skill changes: drop the cached taxonomy and every skill set derived from it.
+# Cached resume skills are recomputed on the next screening; embeddings are kept. The skill index
+# has to be rebuilt.
+def clear_skill_taxonomy():
+    from resume_lens.applicant_index import clear_skill_index
+    from resume_lens.feature_cache import clear_cached_skills
+    from resume_lens.job_catalogue import clear_catalogue
+    from resume_lens.opening_matching import clear_opening_features
+
+    frappe.cache().delete_value(TAXONOMY_CACHE_KEY)
+    clear_cached_skills()
+    clear_skill_index()
+    clear_catalogue()
+    clear_opening_features()
@@ -0,0 +1,91 @@
+import json
+import os
+import re
+from functools import lru_cache
+
+from frappe.utils import cint
+
+from resume_lens.config import get_config, get_file_digest
+from resume_lens.model_registry import get_nlp
+from resume_lens.skill_taxonomy import TAXONOMY_PATH, get_skill_matcher
+
+STOPLIST_PATH = os.path.join(os.path.dirname(__file__), "config", "skill_stoplist.json")
+
+# POS tags that never count as a skill
+EXCLUDED_POS_TAGS = frozenset(['NOUN', 'ADJ', 'PRON', 'CONJ', 'SCONJ', 'ADP', 'AUX', 'VERB', 'DET', 'CCONJ'])
+# Plain integers up to this value are treated as noise (years, counts, bullet numbers)
+MAX_EXCLUDED_NUMBER = 100000
+
+DEFAULT_NLP_BATCH_SIZE = 32
+
+# "taxonomy" matches skills from the Resume Skill dictionary with a trie, no tagger involved.
+# "pos" keeps the older approach: every token that survives the POS and stop-list filters is a skill.
+DEFAULT_SKILL_MATCHER = "taxonomy"
+
+def get_skill_matcher_mode():
+    return get_config("resume_lens_skill_matcher", DEFAULT_SKILL_MATCHER)
+
+def load_stoplist(path=STOPLIST_PATH):
+    with open(path, encoding="utf-8") as f:
+        return frozenset(word.lower() for word in json.load(f))
+
+DEFAULT_STOPLIST = load_stoplist()
+
+@lru_cache(maxsize=16)
+def _build_stoplist(extra_words, stoplist_file):
+    stoplist = load_stoplist(stoplist_file) if stoplist_file else DEFAULT_STOPLIST
+    return stoplist | frozenset(extra_words)
+
+# Stop-list for the current site: the shipped list (or resume_lens_skill_stoplist_file) plus any
+# words listed under resume_lens_skill_stoplist in site_config.json
+def get_stoplist():
+    extra_words = get_config("resume_lens_skill_stoplist") or []
+    stoplist_file = get_config("resume_lens_skill_stoplist_file")
+    if not extra_words and not stoplist_file:
+        return DEFAULT_STOPLIST
+    return _build_stoplist(tuple(sorted(word.lower() for word in extra_words)), stoplist_file)
+
+# Everything besides Resume Skill records that decides which skills are extracted: the matcher, the
+# taxonomy file and the stop-list. Part of the feature cache's pipeline version.
+def get_skill_settings():
+    return {
+        "matcher": get_skill_matcher_mode(),
+        "taxonomy": get_file_digest(get_config("resume_lens_skill_taxonomy_file") or TAXONOMY_PATH),
+        "stoplist": get_file_digest(get_config("resume_lens_skill_stoplist_file") or STOPLIST_PATH),
+        "stoplist_words": sorted(word.lower() for word in get_config("resume_lens_skill_stoplist") or []),
+    }
+
+# Equivalent to membership in {str(n) for n in range(1, MAX_EXCLUDED_NUMBER + 1)} without building it
+def is_excluded_number(text):
+    return text.isascii() and text.isdigit() and text[0] != '0' and int(text) <= MAX_EXCLUDED_NUMBER
+
+def is_skill_token(text, pos, stoplist):
+    return pos not in EXCLUDED_POS_TAGS and text not in stoplist and not is_excluded_number(text)
+
+def clean_skills_text(skills_text):
+    skills_text = re.sub(r'[•\-–]', '', skills_text)
+    return re.sub(r'\s+', ' ', skills_text)
+
+def get_skills_from_doc(doc, stoplist):
+    return list({token.lower_ for token in doc if is_skill_token(token.lower_, token.pos_, stoplist)})
+
+#Extract Skills From text 
+def extract_skills(skills_text):
+    if get_skill_matcher_mode() == "taxonomy":
+        return get_skill_matcher().match(skills_text)
+    return get_skills_from_doc(get_nlp()(clean_skills_text(skills_text)), get_stoplist())
+
+# Extract skills from many texts. With the taxonomy matcher each text is one trie scan; with the POS
+# matcher all texts go through one nlp.pipe pass, batch_size and n_process defaulting to
+# resume_lens_nlp_batch_size / resume_lens_nlp_n_process from site config.
+def extract_skills_batch(texts, batch_size=None, n_process=None):
+    if get_skill_matcher_mode() == "taxonomy":
+        matcher = get_skill_matcher()
+        return [matcher.match(text) for text in texts]
+
+    batch_size = cint(batch_size) or cint(get_config("resume_lens_nlp_batch_size", DEFAULT_NLP_BATCH_SIZE))
+    n_process = cint(n_process) or cint(get_config("resume_lens_nlp_n_process", 1))
+    stoplist = get_stoplist()
+
+    docs = get_nlp().pipe((clean_skills_text(text) for text in texts), batch_size=batch_size, n_process=n_process)
+    return [get_skills_from_doc(doc, stoplist) for doc in docs]
@@ -0,0 +1,99 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import get_datetime
+
+from resume_lens.applicant_discovery import iter_applicant_files, iter_job_applicants
+
+# Applicants are dated in 2001 so the date filter keeps other applicants on the site out of the pages
+FILTERS = {"applied_from": "2001-01-01", "applied_to": "2001-01-02"}
+CREATIONS = {
+	"Discovery A": "2001-01-01 10:00:00",
+	"Discovery B": "2001-01-01 10:00:00",
+	"Discovery C": "2001-01-01 10:00:00",
+	"Discovery D": "2001-01-01 09:00:00",
+	"Discovery E": "2001-01-02 08:00:00",
+}
+
+
+def make_job_applicant(applicant_name, creation, resume_attachment=None):
+	name = (
+		frappe.get_doc(
+			{
+				"doctype": "Job Applicant",
+				"applicant_name": applicant_name,
+				"email_id": f"{frappe.scrub(applicant_name)}@resume-lens.test",
+				"resume_attachment": resume_attachment,
+			}
+		)
+		.insert()
+		.name
+	)
+	frappe.db.set_value("Job Applicant", name, "creation", creation, update_modified=False)
+	return name
+
+
+def get_names(rows):
+	return [row["name"] for row in rows]
+
+
+class TestIterJobApplicants(FrappeTestCase):
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.names = {
+			applicant_name: make_job_applicant(applicant_name, creation)
+			for applicant_name, creation in CREATIONS.items()
+		}
+		# (creation, name) order; the three applicants created in the same second are ordered by name
+		cls.expected = (
+			[cls.names["Discovery D"]]
+			+ sorted(
+				cls.names[applicant_name] for applicant_name in ("Discovery A", "Discovery B", "Discovery C")
+			)
+			+ [cls.names["Discovery E"]]
+		)
+
+	def test_every_page_size_yields_the_same_order(self):
+		for page_size in (1, 2, 3, 5, 100):
+			with self.subTest(page_size=page_size):
+				self.assertEqual(get_names(iter_job_applicants(page_size, **FILTERS)), self.expected)
+
+	def test_pages_split_inside_a_creation_tie(self):
+		rows = list(iter_job_applicants(2, **FILTERS))
+		self.assertEqual(get_names(rows), self.expected)
+		self.assertEqual(rows[1]["creation"], rows[2]["creation"])
+
+	def test_resume_after_a_row(self):
+		for position in range(len(self.expected)):
+			after = frappe.db.get_value(
+				"Job Applicant", self.expected[position], ["creation", "name"], as_dict=True
+			)
+			with self.subTest(after=after.name):
+				self.assertEqual(
+					get_names(iter_job_applicants(2, after=after, **FILTERS)), self.expected[position + 1 :]
+				)
+
+	def test_rows_inserted_while_paging(self):
+		applicants = iter_job_applicants(2, **FILTERS)
+		seen = [next(applicants)["name"], next(applicants)["name"], next(applicants)["name"]]
+
+		# One applicant sorts before the cursor and is not revisited, the other is reached once
+		before = make_job_applicant("Discovery Early", "2001-01-01 08:00:00")
+		after = make_job_applicant("Discovery Late", "2001-01-02 09:00:00")
+		seen += get_names(applicants)
+
+		self.assertEqual(seen, self.expected + [after])
+		self.assertNotIn(before, seen)
+		frappe.delete_doc("Job Applicant", before)
+		frappe.delete_doc("Job Applicant", after)
+
+	def test_applicant_files(self):
+		name = make_job_applicant("Discovery Resume", "2001-01-01 11:00:00", "/private/files/discovery.pdf")
+		files = list(iter_applicant_files(2, **FILTERS))
+		self.assertEqual([f["job_applicant"] for f in files], [name])
+		self.assertEqual(files[0]["file_path"], frappe.get_site_path("private", "files", "discovery.pdf"))
+		self.assertEqual(files[0]["creation"], get_datetime("2001-01-01 11:00:00"))
+		frappe.delete_doc("Job Applicant", name)
@@ -0,0 +1,69 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import unittest
+
+from resume_lens.dedup import NUM_PERM, Deduplicator, minhash_signature, similarity
+
+WORDS = (
+	"experienced backend engineer building python services with django and postgres running on aws "
+	"leading a team of five engineers through design reviews deployments on call rotations and hiring "
+	"improved api latency by forty percent and introduced automated testing across three product lines"
+).split()
+
+
+def make_text(words):
+	return " ".join(words)
+
+
+class TestMinhashSignature(unittest.TestCase):
+	def test_signature_shape_and_determinism(self):
+		signature = minhash_signature(make_text(WORDS))
+		self.assertEqual(signature.shape, (NUM_PERM,))
+		self.assertEqual(signature.tolist(), minhash_signature(make_text(WORDS)).tolist())
+
+	def test_case_and_whitespace_insensitive(self):
+		text = make_text(WORDS)
+		self.assertEqual(similarity(minhash_signature(text), minhash_signature("  " + text.upper())), 1.0)
+
+	def test_similarity_tracks_overlap(self):
+		original = minhash_signature(make_text(WORDS))
+		edited = minhash_signature(make_text(WORDS[:-1] + ["lines."]))
+		unrelated = minhash_signature(make_text(reversed(WORDS)))
+		self.assertGreater(similarity(original, edited), 0.8)
+		self.assertLess(similarity(original, unrelated), 0.2)
+
+	def test_short_text(self):
+		self.assertEqual(minhash_signature("python").shape, (NUM_PERM,))
+
+
+class TestDeduplicator(unittest.TestCase):
+	def test_exact_duplicates_by_content_hash(self):
+		deduplicator = Deduplicator()
+		self.assertEqual(deduplicator.check("a", "hash-1", None), (None, None))
+		self.assertEqual(deduplicator.check("b", "hash-1", None), ("a", "exact"))
+		self.assertEqual(deduplicator.check("c", "hash-2", None), (None, None))
+
+	def test_near_duplicates(self):
+		deduplicator = Deduplicator(threshold=0.8)
+		text = make_text(WORDS)
+		self.assertEqual(deduplicator.check("a", "hash-1", lambda: minhash_signature(text)), (None, None))
+		near = make_text(WORDS[:-1] + ["lines."])
+		self.assertEqual(deduplicator.check("b", "hash-2", lambda: minhash_signature(near)), ("a", "near"))
+		other = make_text(reversed(WORDS))
+		self.assertEqual(deduplicator.check("c", "hash-3", lambda: minhash_signature(other)), (None, None))
+
+		# An exact copy of a near duplicate points at the earliest document
+		self.assertEqual(deduplicator.check("d", "hash-2", None), ("a", "exact"))
+
+	def test_signature_only_computed_for_new_content(self):
+		calls = []
+
+		def get_signature():
+			calls.append(1)
+			return minhash_signature(make_text(WORDS))
+
+		deduplicator = Deduplicator(threshold=0.9)
+		deduplicator.check("a", "hash-1", get_signature)
+		deduplicator.check("b", "hash-1", get_signature)
+		self.assertEqual(len(calls), 1)
@@ -0,0 +1,132 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import fnmatch
+import unittest
+from unittest.mock import patch
+
+import frappe
+
+from resume_lens import download_tokens
+from resume_lens.download_tokens import (
+	SINGLE_USE_TOKEN_PREFIX,
+	TOKEN_PREFIX,
+	count_live_tokens,
+	mint_token,
+	resolve_token,
+	revoke_token,
+)
+
+
+# In-memory stand-in for frappe.cache() with redis semantics: values come back as bytes, keys
+# expire after ex seconds on a clock the test moves, and a transaction pipeline runs its queued
+# commands together on execute
+class FakeCache:
+	def __init__(self):
+		self.now = 0
+		self.data = {}
+		self.pipelines = []
+
+	def make_key(self, key):
+		return f"site:{key}"
+
+	def set(self, key, value, ex=None):
+		self.data[key] = (value.encode(), self.now + ex if ex else None)
+
+	def get(self, key):
+		value, expires = self.data.get(key, (None, None))
+		if expires is not None and expires <= self.now:
+			del self.data[key]
+			return None
+		return value
+
+	def delete(self, *keys):
+		for key in keys:
+			self.data.pop(key, None)
+
+	def scan_iter(self, match):
+		return [key for key in list(self.data) if self.get(key) is not None and fnmatch.fnmatch(key, match)]
+
+	def pipeline(self, transaction=True):
+		pipeline = FakePipeline(self, transaction)
+		self.pipelines.append(pipeline)
+		return pipeline
+
+
+class FakePipeline:
+	def __init__(self, cache, transaction):
+		self.cache = cache
+		self.transaction = transaction
+		self.commands = []
+
+	def get(self, key):
+		self.commands.append(("get", key))
+
+	def delete(self, key):
+		self.commands.append(("delete", key))
+
+	def execute(self):
+		return [getattr(self.cache, command)(key) for command, key in self.commands]
+
+
+class TestDownloadTokens(unittest.TestCase):
+	def setUp(self):
+		self.cache = FakeCache()
+		patcher = patch.object(frappe, "cache", lambda: self.cache, create=True)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def test_mint_stores_path_with_ttl(self):
+		token = mint_token("/site/private/files/cv.pdf", ttl=60)
+		self.assertGreaterEqual(len(token), 20)
+		self.assertNotEqual(token, mint_token("/site/private/files/cv.pdf", ttl=60))
+		self.assertEqual(
+			self.cache.data[self.cache.make_key(TOKEN_PREFIX + token)], (b"/site/private/files/cv.pdf", 60)
+		)
+
+	def test_mint_uses_configured_ttl(self):
+		with patch.object(download_tokens, "get_config", return_value=120):
+			token = mint_token("/site/private/files/cv.pdf", single_use=True)
+		self.assertEqual(self.cache.data[self.cache.make_key(SINGLE_USE_TOKEN_PREFIX + token)][1], 120)
+
+	def test_reusable_token_resolves_until_expiry(self):
+		token = mint_token("/site/private/files/cv.pdf", ttl=60)
+		self.assertEqual(resolve_token(token), "/site/private/files/cv.pdf")
+		self.assertEqual(resolve_token(token), "/site/private/files/cv.pdf")
+
+		self.cache.now = 60
+		self.assertIsNone(resolve_token(token))
+
+	def test_single_use_token_resolves_once(self):
+		token = mint_token("/site/private/files/cv.pdf", single_use=True, ttl=60)
+		self.assertEqual(resolve_token(token), "/site/private/files/cv.pdf")
+		self.assertIsNone(resolve_token(token))
+
+		# Read and delete go through one MULTI/EXEC transaction
+		pipeline = self.cache.pipelines[0]
+		self.assertTrue(pipeline.transaction)
+		self.assertEqual([command for command, _ in pipeline.commands], ["get", "get", "delete"])
+
+	def test_expired_single_use_token(self):
+		token = mint_token("/site/private/files/cv.pdf", single_use=True, ttl=60)
+		self.cache.now = 61
+		self.assertIsNone(resolve_token(token))
+
+	def test_unknown_revoked_and_empty_tokens(self):
+		token = mint_token("/site/private/files/cv.pdf", ttl=60)
+		revoke_token(token)
+		self.assertIsNone(resolve_token(token))
+		self.assertIsNone(resolve_token("not-a-token"))
+		self.assertIsNone(resolve_token(""))
+		self.assertIsNone(resolve_token(None))
+		# Empty tokens never reach redis
+		self.assertEqual(len(self.cache.pipelines), 2)
+
+	def test_count_live_tokens(self):
+		mint_token("/site/private/files/a.pdf", ttl=60)
+		mint_token("/site/private/files/b.pdf", ttl=30)
+		mint_token("/site/private/files/c.pdf", single_use=True, ttl=60)
+		self.assertEqual(count_live_tokens(), {"reusable": 2, "single_use": 1})
+
+		self.cache.now = 30
+		self.assertEqual(count_live_tokens(), {"reusable": 1, "single_use": 1})
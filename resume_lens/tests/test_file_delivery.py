@@ -0,0 +1,105 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import frappe
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
+from werkzeug.test import EnvironBuilder
+from werkzeug.wrappers import Request
+
+from resume_lens import file_delivery
+from resume_lens.file_delivery import send_resume_file
+
+CONTENT = bytes(range(100))
+
+
+class TestSendResumeFile(unittest.TestCase):
+	def setUp(self):
+		self.site_path = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.site_path)
+		os.makedirs(os.path.join(self.site_path, "private", "files"))
+		self.filepath = os.path.join(self.site_path, "private", "files", "resume.pdf")
+		with open(self.filepath, "wb") as f:
+			f.write(CONTENT)
+
+		for patcher in (
+			patch.object(file_delivery, "get_config", lambda key, default=None: default),
+			patch.object(
+				frappe, "get_site_path", lambda *parts: os.path.join(self.site_path, *parts), create=True
+			),
+		):
+			patcher.start()
+			self.addCleanup(patcher.stop)
+
+	def send(self, headers=None, filepath=None, **kwargs):
+		request = Request(EnvironBuilder(path="/api/method/view", headers=headers or {}).get_environ())
+		with patch.object(frappe.local, "request", request, create=True):
+			response = send_resume_file(filepath or self.filepath, **kwargs)
+		self.addCleanup(response.close)
+		return response
+
+	def read(self, response):
+		response.direct_passthrough = False
+		return response.get_data()
+
+	def test_full_response(self):
+		response = self.send()
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(self.read(response), CONTENT)
+		self.assertEqual(response.mimetype, "application/pdf")
+		self.assertEqual(response.headers["Accept-Ranges"], "bytes")
+		self.assertTrue(response.headers["ETag"])
+		self.assertTrue(response.headers["Last-Modified"])
+		self.assertTrue(response.headers["Content-Disposition"].startswith("inline"))
+		self.assertTrue(response.cache_control.private)
+		self.assertFalse(response.cache_control.public)
+		self.assertEqual(response.cache_control.max_age, file_delivery.DEFAULT_MAX_AGE)
+
+	def test_attachment(self):
+		response = self.send(as_attachment=True)
+		self.assertEqual(response.headers["Content-Disposition"], "attachment; filename=resume.pdf")
+
+	def test_range_request(self):
+		response = self.send({"Range": "bytes=10-19"})
+		self.assertEqual(response.status_code, 206)
+		self.assertEqual(response.headers["Content-Range"], "bytes 10-19/100")
+		self.assertEqual(self.read(response), CONTENT[10:20])
+
+	def test_unsatisfiable_range(self):
+		with self.assertRaises(RequestedRangeNotSatisfiable):
+			self.send({"Range": "bytes=200-299"})
+
+	def test_conditional_requests(self):
+		first = self.send()
+		self.assertEqual(self.send({"If-None-Match": first.headers["ETag"]}).status_code, 304)
+		self.assertEqual(self.send({"If-Modified-Since": first.headers["Last-Modified"]}).status_code, 304)
+		self.assertEqual(self.send({"If-None-Match": '"stale"'}).status_code, 200)
+
+	def test_range_ignored_when_etag_changed(self):
+		response = self.send({"Range": "bytes=10-19", "If-Range": '"stale"'})
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(self.read(response), CONTENT)
+
+	def test_x_accel_redirect(self):
+		response = self.send({"X-Use-X-Accel-Redirect": "True"}, as_attachment=True)
+		self.assertEqual(response.headers["X-Accel-Redirect"], "/protected/private/files/resume.pdf")
+		self.assertEqual(response.headers["Content-Disposition"], "attachment; filename=resume.pdf")
+		self.assertEqual(response.get_data(), b"")
+
+	def test_x_accel_redirect_needs_file_under_site(self):
+		with tempfile.NamedTemporaryFile(suffix=".pdf") as outside:
+			outside.write(CONTENT)
+			outside.flush()
+			response = self.send({"X-Use-X-Accel-Redirect": "True"}, filepath=outside.name)
+			self.assertNotIn("X-Accel-Redirect", response.headers)
+			self.assertEqual(self.read(response), CONTENT)
+
+	def test_x_accel_redirect_disabled(self):
+		with patch.object(file_delivery, "get_config", return_value=0):
+			response = self.send({"X-Use-X-Accel-Redirect": "True"})
+		self.assertNotIn("X-Accel-Redirect", response.headers)
@@ -0,0 +1,246 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import contextlib
+import pickle
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import frappe
+
+from resume_lens import job_catalogue
+from resume_lens.job_catalogue import (
+	CATALOGUE_BUILD_KEY,
+	CATALOGUE_CACHE_KEY,
+	CATALOGUE_VERSION_KEY,
+	ensure_catalogue,
+	get_catalogue_entry,
+	get_catalogue_records,
+	refresh_openings,
+	write_catalogue,
+)
+
+
+# In-memory stand-in for frappe.cache(). Raw commands take made keys, the hash helpers make the key
+# and pickle values like RedisWrapper, and a pipeline applies its queued commands only on execute.
+class FakeCache:
+	def __init__(self):
+		self.data = {}
+		self.executed = []
+
+	def make_key(self, key):
+		return f"site:{key}"
+
+	def get(self, key):
+		return self.data.get(key)
+
+	def set(self, key, value):
+		self.data[key] = value
+
+	def delete(self, *keys):
+		for key in keys:
+			self.data.pop(key, None)
+
+	def rename(self, src, dst):
+		self.data[dst] = self.data.pop(src)
+
+	def raw_hset(self, key, mapping):
+		self.data.setdefault(key, {}).update(mapping)
+
+	def hset(self, name, key, value):
+		self.raw_hset(self.make_key(name), {key: pickle.dumps(value)})
+
+	def hget(self, name, key):
+		value = self.data.get(self.make_key(name), {}).get(key)
+		return pickle.loads(value) if value is not None else None
+
+	def hgetall(self, name):
+		return {key: pickle.loads(value) for key, value in self.data.get(self.make_key(name), {}).items()}
+
+	def hdel(self, name, key):
+		self.data.get(self.make_key(name), {}).pop(key, None)
+
+	def lock(self, name, timeout=None):
+		return contextlib.nullcontext()
+
+	def pipeline(self, transaction=True):
+		return FakePipeline(self)
+
+
+class FakePipeline:
+	def __init__(self, cache):
+		self.cache = cache
+		self.commands = []
+
+	def delete(self, key):
+		self.commands.append(("delete", key))
+
+	def hset(self, key, mapping):
+		self.commands.append(("raw_hset", key, mapping))
+
+	def rename(self, src, dst):
+		self.commands.append(("rename", src, dst))
+
+	def set(self, key, value):
+		self.commands.append(("set", key, value))
+
+	def execute(self):
+		self.cache.executed.append([command[0] for command in self.commands])
+		for command, *args in self.commands:
+			getattr(self.cache, command)(*args)
+
+
+def make_opening(name, modified, job_title=None):
+	return SimpleNamespace(
+		name=name, job_title=job_title or name, description=f"{name} description", modified=modified
+	)
+
+
+def make_entry(opening):
+	return {
+		"name": opening.name,
+		"job_title": opening.job_title,
+		"description": opening.description,
+		"experience_range": (1, 3),
+		"jd_required_skills": ["python"],
+		"modified": opening.modified,
+	}
+
+
+class CatalogueTestCase(unittest.TestCase):
+	def setUp(self):
+		self.cache = FakeCache()
+		self.openings = [make_opening("JO-1", 1), make_opening("JO-2", 3), make_opening("JO-3", 2)]
+		for patcher in (
+			patch.object(frappe, "cache", lambda: self.cache, create=True),
+			patch.object(job_catalogue, "get_pipeline_version", return_value="v1"),
+			patch.object(job_catalogue, "make_entry", side_effect=make_entry),
+			patch.object(
+				job_catalogue,
+				"get_open_openings",
+				side_effect=lambda names=None: [o for o in self.openings if names is None or o.name in names],
+			),
+		):
+			patcher.start()
+			self.addCleanup(patcher.stop)
+
+	def catalogue(self):
+		return self.cache.hgetall(CATALOGUE_CACHE_KEY)
+
+	def version(self):
+		return pickle.loads(self.cache.data[self.cache.make_key(CATALOGUE_VERSION_KEY)])
+
+
+class TestWriteCatalogue(CatalogueTestCase):
+	def test_builds_aside_and_renames_in_one_transaction(self):
+		write_catalogue()
+		self.assertEqual(self.cache.executed, [["delete", "raw_hset", "rename", "set"]])
+		self.assertEqual(set(self.catalogue()), {"JO-1", "JO-2", "JO-3"})
+		self.assertNotIn(self.cache.make_key(CATALOGUE_BUILD_KEY), self.cache.data)
+		self.assertEqual(self.version(), "v1")
+
+	def test_rebuild_replaces_catalogue(self):
+		write_catalogue()
+		# A closed opening and a half-written build left by a crashed worker must not survive
+		self.openings = self.openings[1:]
+		self.cache.raw_hset(self.cache.make_key(CATALOGUE_BUILD_KEY), {"JO-9": pickle.dumps({})})
+		write_catalogue()
+		self.assertEqual(set(self.catalogue()), {"JO-2", "JO-3"})
+
+	def test_readers_keep_old_catalogue_until_execute(self):
+		write_catalogue()
+		self.openings = [make_opening("JO-4", 4)]
+
+		def make_entry_while_reading(opening):
+			self.assertEqual(set(self.catalogue()), {"JO-1", "JO-2", "JO-3"})
+			return make_entry(opening)
+
+		with patch.object(job_catalogue, "make_entry", side_effect=make_entry_while_reading):
+			write_catalogue()
+		self.assertEqual(set(self.catalogue()), {"JO-4"})
+
+	def test_no_open_openings(self):
+		write_catalogue()
+		self.openings = []
+		write_catalogue()
+		self.assertEqual(self.cache.executed[-1], ["delete", "delete", "set"])
+		self.assertEqual(self.catalogue(), {})
+		self.assertEqual(self.version(), "v1")
+
+
+class TestEnsureCatalogue(CatalogueTestCase):
+	def test_builds_missing_catalogue_in_request(self):
+		self.assertEqual(get_catalogue_entry("JO-2")["job_title"], "JO-2")
+		self.assertEqual(len(self.cache.executed), 1)
+		ensure_catalogue()
+		self.assertEqual(len(self.cache.executed), 1)
+
+	def test_stale_catalogue_is_served_and_rebuilt_in_background(self):
+		write_catalogue()
+		with patch.object(job_catalogue, "get_pipeline_version", return_value="v2"):
+			with patch.object(job_catalogue, "enqueue_build_catalogue") as enqueue:
+				ensure_catalogue()
+		enqueue.assert_called_once_with()
+		self.assertEqual(len(self.cache.executed), 1)
+		self.assertEqual(self.version(), "v1")
+
+
+class TestRefreshOpenings(CatalogueTestCase):
+	def setUp(self):
+		super().setUp()
+		patcher = patch("resume_lens.opening_matching.clear_opening_features")
+		self.clear_opening_features = patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def test_skipped_until_built(self):
+		refresh_openings(["JO-1"])
+		self.assertEqual(self.cache.data, {})
+
+	def test_reparses_open_and_drops_closed(self):
+		write_catalogue()
+		self.openings = [make_opening("JO-1", 5, "Renamed"), make_opening("JO-2", 3)]
+		refresh_openings(["JO-1", "JO-3"])
+		self.assertEqual(self.catalogue()["JO-1"]["job_title"], "Renamed")
+		self.assertEqual(set(self.catalogue()), {"JO-1", "JO-2"})
+		self.clear_opening_features.assert_called_once_with()
+
+
+class TestCatalogueRecords(CatalogueTestCase):
+	def setUp(self):
+		super().setUp()
+		write_catalogue()
+
+	def test_default_fields_newest_first(self):
+		self.assertEqual(
+			get_catalogue_records(),
+			[
+				{"name": "JO-2", "job_title": "JO-2", "description": "JO-2 description"},
+				{"name": "JO-3", "job_title": "JO-3", "description": "JO-3 description"},
+				{"name": "JO-1", "job_title": "JO-1", "description": "JO-1 description"},
+			],
+		)
+
+	def get_names(self, **kwargs):
+		return [record["name"] for record in get_catalogue_records("name", **kwargs)]
+
+	def test_pagination(self):
+		self.assertEqual(self.get_names(start=1), ["JO-3", "JO-1"])
+		self.assertEqual(self.get_names(start=0, page_length=2), ["JO-2", "JO-3"])
+		self.assertEqual(self.get_names(start="2", page_length="2"), ["JO-1"])
+		self.assertEqual(self.get_names(start=3, page_length=2), [])
+
+	def test_field_selection(self):
+		self.assertEqual(
+			get_catalogue_records("name, experience_range", page_length=1),
+			[{"name": "JO-2", "experience_range": (1, 3)}],
+		)
+		self.assertEqual(
+			get_catalogue_records('["jd_required_skills"]', page_length=1),
+			[{"jd_required_skills": ["python"]}],
+		)
+		self.assertEqual(get_catalogue_records(["job_title"], page_length=1), [{"job_title": "JO-2"}])
+
+	def test_unknown_field(self):
+		with self.assertRaises(frappe.ValidationError):
+			get_catalogue_records("name,modified")
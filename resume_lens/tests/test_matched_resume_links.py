@@ -0,0 +1,62 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from resume_lens import api
+from resume_lens.download_tokens import SINGLE_USE_TOKEN_PREFIX, _key, mint_token
+
+
+# Serving resumes through download_matched_resume / view_matched_resume. send_resume_file is
+# replaced so the tests only check which tokens are let through.
+class TestMatchedResumeLinks(FrappeTestCase):
+	def setUp(self):
+		self.filepath = frappe.get_site_path("private", "files", "resume_lens_test_resume.pdf")
+		with open(self.filepath, "wb") as f:
+			f.write(b"%PDF-1.4")
+		self.addCleanup(os.remove, self.filepath)
+
+		patcher = patch.object(api, "send_resume_file", return_value="response")
+		self.send_resume_file = patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def test_reusable_token(self):
+		token = mint_token(self.filepath)
+		self.assertEqual(api.download_matched_resume(token), "response")
+		self.assertEqual(api.view_matched_resume(token), "response")
+		self.send_resume_file.assert_any_call(self.filepath, as_attachment=True)
+		self.send_resume_file.assert_called_with(self.filepath)
+
+	def test_single_use_token_is_not_reusable(self):
+		token = mint_token(self.filepath, single_use=True)
+		self.assertEqual(api.view_matched_resume(token), "response")
+		self.assertRaises(frappe.PermissionError, api.view_matched_resume, token)
+		self.assertRaises(frappe.PermissionError, api.download_matched_resume, token)
+
+	def test_expired_token(self):
+		token = mint_token(self.filepath, single_use=True)
+		frappe.cache().pexpire(_key(SINGLE_USE_TOKEN_PREFIX, token), 1)
+		time.sleep(0.01)
+		self.assertRaises(frappe.PermissionError, api.download_matched_resume, token)
+		self.send_resume_file.assert_not_called()
+
+	def test_unknown_token(self):
+		self.assertRaises(frappe.PermissionError, api.download_matched_resume, "not-a-token")
+		self.assertRaises(frappe.PermissionError, api.view_matched_resume, "")
+
+	def test_missing_file(self):
+		token = mint_token(frappe.get_site_path("private", "files", "resume_lens_missing.pdf"))
+		self.assertRaises(frappe.PermissionError, api.view_matched_resume, token)
+
+	def test_file_outside_site_files(self):
+		with tempfile.NamedTemporaryFile(suffix=".pdf") as outside:
+			token = mint_token(outside.name)
+			self.assertRaises(frappe.PermissionError, api.download_matched_resume, token)
+			self.assertRaises(frappe.PermissionError, api.view_matched_resume, token)
+		self.send_resume_file.assert_not_called()
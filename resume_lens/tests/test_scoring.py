@@ -0,0 +1,62 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import unittest
+
+import numpy as np
+
+from resume_lens.scoring import normalize_rows, pooled_score_matrix, pooled_scores, split_chunks
+
+
+class TestSplitChunks(unittest.TestCase):
+	def test_short_text_is_one_chunk(self):
+		self.assertEqual(split_chunks("a  b\nc", chunk_words=5, overlap=1), ["a b c"])
+		self.assertEqual(split_chunks("", chunk_words=5, overlap=1), [""])
+
+	def test_overlapping_windows(self):
+		text = " ".join(str(i) for i in range(10))
+		self.assertEqual(
+			split_chunks(text, chunk_words=4, overlap=1, max_chunks=None),
+			["0 1 2 3", "3 4 5 6", "6 7 8 9"]
+		)
+
+	def test_every_word_is_covered(self):
+		words = [str(i) for i in range(23)]
+		chunks = split_chunks(" ".join(words), chunk_words=6, overlap=2, max_chunks=None)
+		self.assertEqual(set(" ".join(chunks).split()), set(words))
+		self.assertTrue(all(len(chunk.split()) <= 6 for chunk in chunks))
+
+	def test_max_chunks(self):
+		text = " ".join(str(i) for i in range(100))
+		self.assertEqual(len(split_chunks(text, chunk_words=10, overlap=0, max_chunks=3)), 3)
+
+
+class TestPooledScores(unittest.TestCase):
+	def setUp(self):
+		rng = np.random.default_rng(0)
+		self.resumes = [rng.normal(size=(size, 8)).astype(np.float16) for size in (1, 3, 2)]
+		self.jds = [rng.normal(size=(size, 8)) for size in (2, 1, 4)]
+
+	def reference(self, resume, jd, pooling):
+		similarities = normalize_rows(resume) @ normalize_rows(jd).T
+		return (similarities.max(axis=0) if pooling == "max" else similarities.mean(axis=0)).mean()
+
+	def test_pooled_scores_match_pairwise_pooling(self):
+		for pooling in ("max", "mean"):
+			expected = [self.reference(resume, self.jds[0], pooling) for resume in self.resumes]
+			np.testing.assert_allclose(pooled_scores(self.resumes, self.jds[0], pooling), expected, atol=1e-3)
+
+	def test_pooled_score_matrix_columns(self):
+		for pooling in ("max", "mean"):
+			scores = pooled_score_matrix(self.resumes, self.jds, pooling)
+			self.assertEqual(scores.shape, (3, 3))
+			for column, jd in enumerate(self.jds):
+				np.testing.assert_allclose(scores[:, column], pooled_scores(self.resumes, jd, pooling), atol=1e-5)
+
+	def test_identical_windows_score_one(self):
+		windows = normalize_rows(self.jds[2])
+		self.assertAlmostEqual(float(pooled_scores([windows], windows, "max")[0]), 1.0, places=5)
+
+	def test_empty_inputs(self):
+		self.assertEqual(pooled_scores([], self.jds[0]).shape, (0,))
+		self.assertEqual(pooled_score_matrix(self.resumes, []).shape, (3, 0))
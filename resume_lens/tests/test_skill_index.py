@@ -0,0 +1,71 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import shutil
+import tempfile
+import unittest
+
+from resume_lens.skill_index import SkillIndex
+
+
+class TestSkillIndex(unittest.TestCase):
+	def setUp(self):
+		self.path = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.path)
+		self.index = SkillIndex.create(self.path, "v1")
+		self.index.add_many([
+			("a", ["Python", "Django", "SQL"], 3),
+			("b", ["python", "react"], 6),
+			("c", ["java", "sql"], 10),
+			("d", [], 1),
+		])
+
+	def query(self, **filters):
+		return self.index.query(**filters)
+
+	def test_boolean_queries(self):
+		self.assertEqual(self.query(all_of=["python", "sql"]), ["a"])
+		self.assertEqual(self.query(any_of=["react", "java"]), ["b", "c"])
+		self.assertEqual(self.query(none_of=["python"]), ["c", "d"])
+		self.assertEqual(self.query(all_of=["sql"], none_of=["django"]), ["c"])
+		self.assertEqual(self.query(all_of=["cobol"]), [])
+
+	def test_min_match_and_experience(self):
+		self.assertEqual(self.query(match_skills=["python", "sql", "django"], min_match=2), ["a"])
+		self.assertEqual(self.query(min_experience=3, max_experience=6), ["a", "b"])
+		self.assertEqual(self.query(any_of=["sql"], min_experience=5), ["c"])
+
+	def test_query_mask_is_boolean_per_row(self):
+		mask = self.index.query_mask(any_of=["PYTHON"])
+		self.assertEqual(mask.tolist(), [True, True, False, False])
+
+	def test_replace_and_remove(self):
+		self.index.add("a", ["go"], 4)
+		self.assertEqual(self.query(any_of=["python"]), ["b"])
+		self.assertEqual(self.query(any_of=["go"]), ["a"])
+
+		self.index.remove(["b"])
+		self.assertEqual(self.query(any_of=["python", "react"]), [])
+		self.assertNotIn("b", self.index)
+		self.assertEqual(self.query(), ["a", "c", "d"])
+
+	def test_save_and_reload(self):
+		self.index.remove(["c"])
+		self.index.save()
+
+		reloaded = SkillIndex(self.path)
+		self.assertEqual(reloaded.version, "v1")
+		self.assertEqual(reloaded.query(any_of=["sql"]), ["a"])
+		self.assertEqual(reloaded.query(), ["a", "b", "d"])
+
+		reloaded.add("e", ["rust"], 2)
+		self.assertEqual(reloaded.keys.index("e"), 2)
+
+	def test_skill_names_that_clash_with_storage_names(self):
+		self.index.add_many([("e", ["file", "experience", "__experience__", "postings"], 7)])
+		self.index.save()
+
+		reloaded = SkillIndex(self.path)
+		for skill in ("file", "experience", "__experience__", "postings"):
+			self.assertEqual(reloaded.query(all_of=[skill]), ["e"])
+		self.assertEqual(reloaded.query(min_experience=7), ["c", "e"])
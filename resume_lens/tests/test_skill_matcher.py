@@ -0,0 +1,76 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import unittest
+from types import SimpleNamespace
+
+from resume_lens.skill_taxonomy import SkillMatcher, load_taxonomy, merge_skill_records, normalize_text
+
+
+class TestSkillMatcher(unittest.TestCase):
+	def setUp(self):
+		self.matcher = SkillMatcher.from_taxonomy({
+			"Python": ["py3"],
+			"Spring": [],
+			"Spring Boot": ["springboot"],
+			"C++": ["cpp"],
+			"Node.js": ["nodejs"],
+			"CI/CD": [],
+			"Go": ["golang"],
+			"C": ["c programming"],
+		})
+
+	def test_normalize_text(self):
+		self.assertEqual(normalize_text("Python, Node.js; C++."), "python node.js c++")
+		self.assertEqual(normalize_text("HTML/CSS, CI/CD."), "html / css ci / cd")
+
+	def test_aliases_map_to_canonical_skill(self):
+		self.assertEqual(self.matcher.match("py3 and cpp, NodeJS"), ["python", "c++", "node.js"])
+
+	def test_longest_phrase_wins(self):
+		self.assertEqual(self.matcher.match("Spring Boot services"), ["spring boot"])
+		self.assertEqual(self.matcher.match("spring and springboot"), ["spring", "spring boot"])
+
+	def test_whole_words_only(self):
+		self.assertEqual(self.matcher.match("pythonic cpps springtime"), [])
+		self.assertEqual(self.matcher.match("Built CI/CD pipelines in Python."), ["ci/cd", "python"])
+
+	def test_slash_separated_skills(self):
+		matcher = SkillMatcher.from_taxonomy({
+			"HTML": [], "CSS": [], "Python": [], "Django": [], "AWS": [], "GCP": [], "Azure": [],
+			"React": ["react.js"], "Redux": [], "CI/CD": [], "TCP/IP": [], "CI": [],
+		})
+		self.assertEqual(matcher.match("HTML/CSS, Python/Django"), ["html", "css", "python", "django"])
+		self.assertEqual(matcher.match("AWS/GCP/Azure"), ["aws", "gcp", "azure"])
+		self.assertEqual(matcher.match("React.js/Redux"), ["react", "redux"])
+		self.assertEqual(matcher.match("CI/CD and TCP / IP"), ["ci/cd", "tcp/ip"])
+		self.assertEqual(matcher.match("CI and /CSS/"), ["ci", "css"])
+
+	def test_first_appearance_order_without_repeats(self):
+		self.assertEqual(self.matcher.match("cpp python C++ py3"), ["c++", "python"])
+
+	def test_alias_only_skills(self):
+		self.assertEqual(self.matcher.match("I will go with a grade C"), [])
+		self.assertEqual(self.matcher.match("golang and c programming"), ["go", "c"])
+
+	def test_bundled_taxonomy(self):
+		matcher = SkillMatcher.from_taxonomy(load_taxonomy())
+		self.assertEqual(matcher.match("We go to great lengths to deliver grade C work"), [])
+		self.assertIn("go", matcher.match("Skills: Golang, Python"))
+
+
+class TestMergeSkillRecords(unittest.TestCase):
+	def record(self, skill, aliases="", enabled=1):
+		return SimpleNamespace(skill=skill, aliases=aliases, enabled=enabled)
+
+	def test_records_replace_shipped_skills_case_insensitively(self):
+		taxonomy = merge_skill_records({"Python": ["py3"], "Java": []}, [self.record("python", "cpython, py")])
+		self.assertEqual(taxonomy, {"Java": [], "python": ["cpython", "py"]})
+
+	def test_disabled_record_removes_skill(self):
+		taxonomy = merge_skill_records({"Python": ["py3"], "Java": []}, [self.record("JAVA", enabled=0)])
+		self.assertEqual(taxonomy, {"Python": ["py3"]})
+
+	def test_new_and_repeated_records(self):
+		taxonomy = merge_skill_records({}, [self.record("Rust"), self.record("rust", "rustlang")])
+		self.assertEqual(taxonomy, {"rust": ["rustlang"]})
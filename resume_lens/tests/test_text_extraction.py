@@ -0,0 +1,60 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from resume_lens.text_extraction import extract_texts_parallel
+
+
+class TestExtractTextsParallel(unittest.TestCase):
+	def setUp(self):
+		self.path = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.path)
+
+	def write(self, filename, text):
+		file_path = os.path.join(self.path, filename)
+		with open(file_path, "w") as f:
+			f.write(text)
+		return file_path
+
+	def extract(self, file_paths, **kwargs):
+		return {result["file_path"]: result for result in extract_texts_parallel(file_paths, **kwargs)}
+
+	def test_extracts_every_file_on_reused_workers(self):
+		file_paths = [self.write(f"resume-{i}.txt", f"resume {i}") for i in range(7)]
+		results = self.extract(file_paths, max_workers=2, max_tasks_per_worker=3)
+		self.assertEqual(set(results), set(file_paths))
+		for i, file_path in enumerate(file_paths):
+			self.assertEqual(results[file_path]["text"], f"resume {i}")
+			self.assertIsNone(results[file_path]["error"])
+			self.assertGreaterEqual(results[file_path]["elapsed"], 0)
+
+	def test_errors_are_reported_per_file(self):
+		text_path = self.write("resume.txt", "python developer")
+		empty_path = self.write("empty.txt", "   ")
+		missing_path = os.path.join(self.path, "missing.txt")
+		results = self.extract([text_path, empty_path, missing_path], max_workers=2)
+
+		self.assertEqual(results[text_path]["text"], "python developer")
+		self.assertEqual(results[empty_path]["error"]["type"], "empty")
+		self.assertEqual(results[missing_path]["error"]["type"], "not_found")
+		self.assertIsNone(results[missing_path]["text"])
+
+	def test_max_chars(self):
+		file_path = self.write("long.txt", "x" * 100)
+		self.assertEqual(self.extract([file_path], max_chars=10)[file_path]["text"], "x" * 10)
+
+	def test_timeout_kills_only_the_stuck_worker(self):
+		# Opening a FIFO without a writer blocks the worker until it is killed
+		fifo_path = os.path.join(self.path, "stuck.txt")
+		os.mkfifo(fifo_path)
+		file_paths = [fifo_path] + [self.write(f"resume-{i}.txt", f"resume {i}") for i in range(3)]
+
+		results = self.extract(file_paths, max_workers=2, timeout=1)
+		self.assertEqual(results[fifo_path]["error"]["type"], "timeout")
+		self.assertIsNone(results[fifo_path]["text"])
+		for i, file_path in enumerate(file_paths[1:]):
+			self.assertEqual(results[file_path]["text"], f"resume {i}")
@@ -0,0 +1,95 @@
+# Copyright (c) 2026, AT and Contributors
+# See license.txt
+
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from resume_lens.vector_index import VectorIndex, top_k_indices
+
+
+class TestTopKIndices(unittest.TestCase):
+	def test_best_first(self):
+		scores = np.array([0.1, 0.9, 0.5, 0.7])
+		self.assertEqual(top_k_indices(scores, 2).tolist(), [1, 3])
+		self.assertEqual(top_k_indices(scores).tolist(), [1, 3, 2, 0])
+
+	def test_min_score(self):
+		scores = np.array([0.1, 0.9, 0.5, 0.7])
+		self.assertEqual(top_k_indices(scores, min_score=0.5).tolist(), [1, 3, 2])
+		self.assertEqual(top_k_indices(scores, 1, min_score=0.95).tolist(), [])
+
+	def test_ties_keep_position_order(self):
+		scores = np.array([0.5, 0.8, 0.5, 0.5])
+		self.assertEqual(top_k_indices(scores).tolist(), [1, 0, 2, 3])
+
+	def test_top_k_larger_than_scores(self):
+		self.assertEqual(top_k_indices(np.array([0.2, 0.4]), 10).tolist(), [1, 0])
+		self.assertEqual(top_k_indices(np.array([]), 5).tolist(), [])
+
+
+class TestVectorIndex(unittest.TestCase):
+	def setUp(self):
+		self.path = tempfile.mkdtemp()
+		self.addCleanup(shutil.rmtree, self.path)
+		self.index = VectorIndex.create(self.path, 4, "v1")
+
+	def test_add_and_search(self):
+		self.index.add(["a", "b", "c"], np.eye(4)[:3])
+		hits = self.index.search([1, 0.5, 0, 0], top_k=2)
+		self.assertEqual([key for key, score in hits], ["a", "b"])
+		self.assertAlmostEqual(hits[0][1], 1 / np.sqrt(1.25), places=5)
+
+	def test_readd_overwrites_vector(self):
+		self.index.add(["a", "b"], np.eye(4)[:2])
+		self.index.add(["a"], [[0, 0, 1, 0]])
+		self.assertEqual(len(self.index), 2)
+		self.assertEqual(self.index.search([0, 0, 1, 0], top_k=1)[0][0], "a")
+
+	def test_remove_reuses_row(self):
+		self.index.add(["a", "b"], np.eye(4)[:2])
+		self.index.remove(["a", "missing"])
+		self.assertNotIn("a", self.index)
+		self.assertEqual([key for key, score in self.index.search([1, 0, 0, 0])], ["b"])
+
+		self.index.add(["c"], [[0, 0, 1, 0]])
+		self.assertEqual(self.index.keys, ["c", "b"])
+
+	def test_save_and_reload(self):
+		self.index.add(["a", "b"], np.eye(4)[:2])
+		self.index.remove(["a"])
+		self.index.save()
+
+		reloaded = VectorIndex(self.path)
+		self.assertEqual((reloaded.dim, reloaded.version, len(reloaded)), (4, "v1", 1))
+		self.assertEqual(reloaded.search([0, 1, 0, 0], top_k=1)[0][0], "b")
+
+	def test_min_score_and_keys(self):
+		self.index.add(["a", "b", "c"], np.eye(4)[:3])
+		self.assertEqual([key for key, score in self.index.search([1, 0, 0, 0], min_score=0.5)], ["a"])
+		hits = self.index.search([1, 0.5, 0, 0], top_k=1, keys=["b", "c", "missing"])
+		self.assertEqual([key for key, score in hits], ["b"])
+		self.assertEqual(self.index.search([1, 0, 0, 0], keys=[]), [])
+
+	def test_ivf_search(self):
+		rng = np.random.default_rng(0)
+		centers = np.eye(4)[:2]
+		vectors = np.repeat(centers, 50, axis=0) + rng.normal(scale=0.05, size=(100, 4))
+		keys = [f"k{i}" for i in range(100)]
+		self.index.add(keys, vectors)
+		self.index.train(2)
+		self.assertTrue(self.index.is_trained)
+
+		exact = self.index.search([0, 1, 0, 0], top_k=5)
+		approximate = self.index.search([0, 1, 0, 0], top_k=5, nprobe=1)
+		self.assertEqual(approximate, exact)
+		self.assertTrue(all(int(key[1:]) >= 50 for key, score in approximate))
+
+		# Rows added after training are assigned to a partition and found by probing it
+		self.index.add(["new"], [[0, 1, 0, 0]])
+		self.assertEqual(self.index.search([0, 1, 0, 0], top_k=1, nprobe=1)[0][0], "new")
+
+		self.index.save()
+		self.assertEqual(VectorIndex(self.path).search([0, 1, 0, 0], top_k=5, nprobe=1)[:1], [("new", 1.0)])
@@ -0,0 +1,245 @@
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+
+import docx2txt
+import psutil
+import pypdf
+
+DEFAULT_EXTRACTION_TIMEOUT = 60
+DEFAULT_EXTRACTION_MAX_MEMORY_MB = 1024
+# Only the start of a resume reaches the embedding model, so long portfolios are cut off
+DEFAULT_MAX_PAGES = 30
+DEFAULT_MAX_CHARS = 100000
+# Files a worker process extracts before it is replaced with a fresh one
+DEFAULT_MAX_TASKS_PER_WORKER = 50
+# How often running workers are checked against the timeout and memory limit
+POLL_INTERVAL = 0.1
+
+# Raised when a file yields no usable text; `reason` is one of not_found, unreadable, empty
+class TextExtractionError(Exception):
+    def __init__(self, file_path, reason, message):
+        super().__init__(message)
+        self.file_path = file_path
+        self.reason = reason
+
+    def as_dict(self):
+        return {"type": self.reason, "message": str(self)}
+
+# Yield the text of each PDF page once, stopping after max_pages
+def iter_pdf_pages(file_path, max_pages=None):
+    with open(file_path, 'rb') as file:
+        reader = pypdf.PdfReader(file)
+        for index, page in enumerate(reader.pages):
+            if max_pages and index >= max_pages:
+                break
+            page_text = page.extract_text()
+            if page_text:
+                yield page_text
+
+def _check_file(file_path):
+    if not os.path.exists(file_path):
+        raise TextExtractionError(file_path, "not_found", f"File not found: {file_path}")
+
+def _finish_text(file_path, text, max_chars):
+    if max_chars:
+        text = text[:max_chars]
+    if not text.strip():
+        raise TextExtractionError(file_path, "empty", f"No text could be extracted from {os.path.basename(file_path)}")
+    return text
+
+#Extract Text From PDF File, reading at most max_pages pages and max_chars characters
+def extract_text_from_pdf(file_path, max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS):
+    _check_file(file_path)
+
+    pages = []
+    length = 0
+    try:
+        for page_text in iter_pdf_pages(file_path, max_pages):
+            pages.append(page_text)
+            length += len(page_text) + 1
+            if max_chars and length >= max_chars:
+                break
+    except Exception as e:
+        raise TextExtractionError(file_path, "unreadable", f"Error reading PDF: {e}")
+
+    return _finish_text(file_path, "".join(page + "\n" for page in pages), max_chars)
+
+#Extract Text from doc, docx files
+def extract_text_from_docx(file_path, max_chars=DEFAULT_MAX_CHARS):
+    _check_file(file_path)
+
+    try:
+        text = docx2txt.process(file_path)
+    except Exception as e:
+        raise TextExtractionError(file_path, "unreadable", f"Error reading document: {e}")
+
+    return _finish_text(file_path, text or "", max_chars)
+
+# Extract the plain text of a resume file [pdf, doc, docx, txt]
+def extract_resume_text(file_path, max_pages=DEFAULT_MAX_PAGES, max_chars=DEFAULT_MAX_CHARS):
+    if file_path.endswith('.pdf'):
+        return extract_text_from_pdf(file_path, max_pages, max_chars)
+    elif file_path.endswith('.doc') or file_path.endswith('.docx'):
+        return extract_text_from_docx(file_path, max_chars)
+    else:
+        _check_file(file_path)
+        with open(file_path, 'r') as f:
+            return _finish_text(file_path, f.read(max_chars or -1), max_chars)
+
+def _extract(file_path, max_pages, max_chars):
+    try:
+        return {"text": extract_resume_text(file_path, max_pages, max_chars), "error": None}
+    except TextExtractionError as e:
+        return {"text": None, "error": e.as_dict()}
+    except Exception as e:
+        return {"text": None, "error": {"type": "error", "message": f"{type(e).__name__}: {e}"}}
+
+# Worker process loop: extract each file path received until None or the pipe closes
+def _extraction_worker(conn, max_pages, max_chars):
+    try:
+        while True:
+            try:
+                file_path = conn.recv()
+            except EOFError:
+                break
+            if file_path is None:
+                break
+            conn.send(_extract(file_path, max_pages, max_chars))
+    finally:
+        conn.close()
+
+def _get_rss_mb(pid):
+    try:
+        return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+    except psutil.Error:
+        return 0
+
+# Workers are started from a fork server (or spawned) rather than forked from the caller. Screening runs
+# inside threaded web and RQ workers holding model, redis and database state, and forking such a process
+# can deadlock the child on a lock held by another thread.
+def get_worker_context():
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload([__name__])
+    return ctx
+
+# One reusable extraction process and the file it is working on
+class ExtractionWorker:
+    def __init__(self, ctx, max_pages, max_chars):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_extraction_worker, args=(child_conn, max_pages, max_chars), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+        self.file_path = None
+
+    def submit(self, file_path):
+        self.file_path = file_path
+        self.started = time.monotonic()
+        self.baseline_rss = _get_rss_mb(self.process.pid)
+        self.tasks += 1
+        self.conn.send(file_path)
+
+    def stop(self, kill=False):
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+        self.process.join()
+        self.conn.close()
+
+# Extract text from many files on at most max_workers reusable worker processes and yield results as
+# they finish. A worker is killed and replaced when its current file runs past `timeout` seconds or
+# grows the worker by more than `max_memory_mb` over its size when the file was handed to it, and is
+# retired after max_tasks_per_worker files so leaks in the PDF parser stay bounded. Each result is a dict
+# with file_path, text, error and elapsed (seconds); error is None or a dict with the failure type and message.
+def extract_texts_parallel(file_paths, max_workers=None, timeout=DEFAULT_EXTRACTION_TIMEOUT,
+                           max_memory_mb=DEFAULT_EXTRACTION_MAX_MEMORY_MB, max_pages=DEFAULT_MAX_PAGES,
+                           max_chars=DEFAULT_MAX_CHARS, max_tasks_per_worker=DEFAULT_MAX_TASKS_PER_WORKER):
+    ctx = get_worker_context()
+    max_workers = max_workers or os.cpu_count() or 1
+    pending = iter(file_paths)
+    idle = []
+    busy = {}
+
+    def dispatch():
+        while len(busy) < max_workers:
+            file_path = next(pending, None)
+            if file_path is None:
+                return
+            worker = idle.pop() if idle else ExtractionWorker(ctx, max_pages, max_chars)
+            worker.submit(file_path)
+            busy[worker.conn] = worker
+
+    def finish(worker, text=None, error=None, kill=False):
+        del busy[worker.conn]
+        if kill or not worker.process.is_alive() or worker.tasks >= max_tasks_per_worker:
+            worker.stop(kill=kill)
+        else:
+            idle.append(worker)
+        return {
+            "file_path": worker.file_path,
+            "text": text,
+            "error": error,
+            "elapsed": round(time.monotonic() - worker.started, 4)
+        }
+
+    try:
+        dispatch()
+        while busy:
+            for conn in wait(list(busy), timeout=POLL_INTERVAL):
+                worker = busy[conn]
+                try:
+                    result = conn.recv()
+                except (EOFError, OSError):
+                    worker.process.join()
+                    yield finish(worker, error={
+                        "type": "worker_crashed",
+                        "message": f"Extraction worker exited with code {worker.process.exitcode}"
+                    })
+                else:
+                    yield finish(worker, result["text"], result["error"])
+
+            now = time.monotonic()
+            for worker in list(busy.values()):
+                if timeout and now - worker.started > timeout:
+                    yield finish(worker, error={
+                        "type": "timeout", "message": f"Extraction timed out after {timeout}s"
+                    }, kill=True)
+                elif max_memory_mb and _get_rss_mb(worker.process.pid) - worker.baseline_rss > max_memory_mb:
+                    yield finish(worker, error={
+                        "type": "memory_limit", "message": f"Extraction exceeded {max_memory_mb} MB"
+                    }, kill=True)
+
+            dispatch()
+    finally:
+        for worker in idle:
+            worker.stop()
+        for worker in busy.values():
+            worker.stop(kill=True)
+
+# Summarize extraction results for a run: counts, latency percentiles and per-file latency
+def summarize_extraction(results):
+    latencies = sorted(result["elapsed"] for result in results)
+
+    def percentile(pct):
+        return latencies[min(len(latencies) - 1, round(pct / 100 * (len(latencies) - 1)))] if latencies else 0
+
+    return {
+        "files": len(results),
+        "failed": sum(1 for result in results if result["error"]),
+        "total_seconds": round(sum(latencies), 4),
+        "p50_seconds": percentile(50),
+        "p95_seconds": percentile(95),
+        "max_seconds": latencies[-1] if latencies else 0,
+        "per_file": [
+            {"file": os.path.basename(result["file_path"]), "elapsed": result["elapsed"], "error": result["error"]}
+            for result in results
+        ],
+    }
@@ -0,0 +1,209 @@
+import json
+import os
+
+import numpy as np
+
+VECTORS_FILE = "vectors.npy"
+META_FILE = "meta.json"
+CENTROIDS_FILE = "centroids.npy"
+ASSIGNMENTS_FILE = "assignments.npy"
+INITIAL_CAPACITY = 1024
+DEFAULT_NPROBE = 8
+KMEANS_ITERATIONS = 10
+KMEANS_SAMPLE_SIZE = 20000
+
+def normalize(vectors):
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+# Positions of the top_k highest scores at or above min_score, best first. argpartition selects the
+# top_k in linear time so only those are sorted, not the whole score array.
+def top_k_indices(scores, top_k=None, min_score=None):
+    candidates = np.arange(len(scores)) if min_score is None else np.flatnonzero(scores >= min_score)
+    if top_k and len(candidates) > top_k:
+        candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+def _write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def _save_npy(path, array):
+    tmp_path = f"{path}.tmp.npy"
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+# On-disk index of normalized vectors. Vectors live in a memory-mapped .npy file, one row per key,
+# and meta.json maps each row to its key (a Job Applicant name). Rows of removed keys are zeroed and
+# reused by later adds, so row ids of the remaining keys never change. Search is exact by default;
+# after train() rows are also assigned to k-means partitions (IVF) and search(nprobe=n) only scores
+# rows in the n partitions closest to the query.
+class VectorIndex:
+    def __init__(self, path, dim=None, version=None):
+        self.path = path
+        meta = {"dim": dim, "version": version, "keys": []}
+        if os.path.exists(self._file(META_FILE)):
+            with open(self._file(META_FILE)) as f:
+                meta = json.load(f)
+
+        self.dim = meta["dim"]
+        self.version = meta["version"]
+        self.keys = meta["keys"]
+        self.rows = {key: row for row, key in enumerate(self.keys) if key is not None}
+        self.free_rows = [row for row, key in enumerate(self.keys) if key is None]
+
+        self.centroids = None
+        self.assignments = None
+        if os.path.exists(self._file(CENTROIDS_FILE)):
+            self.centroids = np.load(self._file(CENTROIDS_FILE))
+            self.assignments = np.load(self._file(ASSIGNMENTS_FILE))
+
+    # Start an empty index at path, dropping any existing files
+    @classmethod
+    def create(cls, path, dim, version=None):
+        os.makedirs(path, exist_ok=True)
+        for filename in (VECTORS_FILE, META_FILE, CENTROIDS_FILE, ASSIGNMENTS_FILE):
+            if os.path.exists(os.path.join(path, filename)):
+                os.remove(os.path.join(path, filename))
+        index = cls(path, dim, version)
+        index.save()
+        return index
+
+    def _file(self, filename):
+        return os.path.join(self.path, filename)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __contains__(self, key):
+        return key in self.rows
+
+    @property
+    def is_trained(self):
+        return self.centroids is not None
+
+    def _vectors(self, mode="r"):
+        if not os.path.exists(self._file(VECTORS_FILE)):
+            return np.empty((0, self.dim), dtype=np.float32)
+        return np.load(self._file(VECTORS_FILE), mmap_mode=mode)
+
+    # Grow the vector file (doubling) so it holds at least `rows` rows
+    def _reserve(self, rows):
+        vectors = self._vectors()
+        capacity = len(vectors)
+        if rows <= capacity:
+            return
+        new_capacity = max(INITIAL_CAPACITY, capacity * 2, rows)
+        tmp_path = self._file(f"{VECTORS_FILE}.tmp.npy")
+        grown = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=(new_capacity, self.dim))
+        grown[:capacity] = vectors
+        grown.flush()
+        del grown, vectors
+        os.replace(tmp_path, self._file(VECTORS_FILE))
+
+        if self.assignments is not None:
+            self.assignments = np.concatenate([
+                self.assignments, np.full(new_capacity - len(self.assignments), -1, dtype=np.int32)
+            ])
+
+    def _assign(self, vectors):
+        return np.argmax(vectors @ self.centroids.T, axis=1).astype(np.int32)
+
+    # Insert or overwrite the vectors of the given keys
+    def add(self, keys, vectors):
+        keys = list(keys)
+        if not keys:
+            return
+        vectors = normalize(vectors)
+
+        rows = []
+        for key in keys:
+            row = self.rows.get(key)
+            if row is None:
+                row = self.free_rows.pop() if self.free_rows else len(self.keys)
+                if row == len(self.keys):
+                    self.keys.append(None)
+                self.keys[row] = key
+                self.rows[key] = row
+            rows.append(row)
+
+        self._reserve(len(self.keys))
+        stored = self._vectors("r+")
+        stored[rows] = vectors
+        stored.flush()
+        if self.is_trained:
+            self.assignments[rows] = self._assign(vectors)
+
+    # Drop keys from the index, their rows are reused by later adds
+    def remove(self, keys):
+        rows = [self.rows.pop(key) for key in keys if key in self.rows]
+        if not rows:
+            return
+        for row in rows:
+            self.keys[row] = None
+        self.free_rows.extend(rows)
+
+        stored = self._vectors("r+")
+        stored[rows] = 0
+        stored.flush()
+        if self.is_trained:
+            self.assignments[rows] = -1
+
+    # Spherical k-means over (a sample of) the stored vectors; enables approximate search
+    def train(self, nlist, iterations=KMEANS_ITERATIONS, sample_size=KMEANS_SAMPLE_SIZE, seed=0):
+        live_rows = np.array(sorted(self.rows.values()), dtype=np.int64)
+        nlist = min(nlist, len(live_rows))
+        if nlist < 1:
+            return
+
+        rng = np.random.default_rng(seed)
+        vectors = self._vectors()
+        sample = vectors[np.sort(rng.choice(live_rows, min(sample_size, len(live_rows)), replace=False))]
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)]
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = sample[labels == cluster]
+                if len(members):
+                    centroids[cluster] = members.sum(axis=0)
+            centroids = normalize(centroids)
+
+        self.centroids = centroids
+        self.assignments = np.full(len(vectors), -1, dtype=np.int32)
+        self.assignments[live_rows] = self._assign(vectors[live_rows])
+
+    # Best matching keys for a query vector as [(key, score)], at most top_k and at least min_score.
+    # With a trained index and nprobe, only the nprobe partitions nearest the query are scanned. With
+    # keys, only the rows of those keys are scored (exactly), so top_k is taken among them.
+    def search(self, query, top_k=50, min_score=None, nprobe=None, keys=None):
+        if not self.rows:
+            return []
+        query = normalize(query)[0]
+        vectors = self._vectors()[:len(self.keys)]
+
+        if keys is not None:
+            rows = np.array(sorted(self.rows[key] for key in set(keys) if key in self.rows), dtype=np.int64)
+            scores = vectors[rows] @ query
+        elif nprobe and self.is_trained:
+            partitions = top_k_indices(self.centroids @ query, nprobe)
+            rows = np.flatnonzero(np.isin(self.assignments[:len(self.keys)], partitions))
+            scores = vectors[rows] @ query
+        else:
+            rows = np.arange(len(self.keys))
+            scores = vectors @ query
+
+        live = np.fromiter((self.keys[row] is not None for row in rows), dtype=bool, count=len(rows))
+        scores = np.where(live, scores, -np.inf)
+        hits = top_k_indices(scores, top_k, -1.0 if min_score is None else min_score)
+        return [(self.keys[rows[hit]], float(scores[hit])) for hit in hits]
+
+    def save(self):
+        os.makedirs(self.path, exist_ok=True)
+        if self.is_trained:
+            _save_npy(self._file(CENTROIDS_FILE), self.centroids)
+            _save_npy(self._file(ASSIGNMENTS_FILE), self.assignments)
+        _write_json(self._file(META_FILE), {"dim": self.dim, "version": self.version, "keys": self.keys})